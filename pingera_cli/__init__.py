@@ -6,6 +6,12 @@ __version__ = "0.1.16"
 __author__ = "Pingera Team"
 __description__ = "A beautiful Python CLI tool built with typer and rich, distributed via pip and based on Pingera SDK"
 
-from .main import app
-
 __all__ = ["app", "__version__"]
+
+
+def __getattr__(name):
+    # Import the Typer app lazily so the launcher can start without loading it
+    if name == "app":
+        from .main import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -219,20 +219,11 @@ API Key: ✗ Not set
         """
         try:
             # Import here to avoid circular imports and handle missing SDK gracefully
-            from pingera import ApiClient, Configuration
             from pingera.api import ChecksApi
             from pingera.exceptions import UnauthorizedException
+            from ..utils.client import get_api_client
 
-            # Configure the client (same pattern as checks command)
-            from ..utils.config import get_config
-            
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            checks_api = ChecksApi(api_client)
+            checks_api = ChecksApi(get_api_client(api_key))
 
             # Make a lightweight test request to validate the API key
             checks_api.v1_checks_get()
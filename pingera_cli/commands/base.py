@@ -3,7 +3,8 @@ Base command class for PingeraCLI commands
 """
 
 import json
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 try:
@@ -16,7 +17,13 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ..utils.console import console, error_console
-from ..utils.config import get_config
+from ..utils.bulk import DEFAULT_CONCURRENCY
+from ..utils.config import STRUCTURED_FORMATS, get_config
+from ..utils.tabular import TABULAR_FORMATS
+
+# Page size of list commands unless given, and the largest one the API accepts
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
 
 
 class BaseCommand:
@@ -27,6 +34,16 @@ class BaseCommand:
         self.error_console = error_console
         self.output_format = output_format or get_config().get('output_format', 'table')
 
+    @property
+    def structured_output(self) -> bool:
+        """Whether output goes to other programs (json, yaml, csv, tsv) rather than a person"""
+        return self.output_format in STRUCTURED_FORMATS
+
+    @property
+    def tabular_output(self) -> bool:
+        """Whether output is CSV or TSV rows"""
+        return self.output_format in TABULAR_FORMATS
+
     def validate_api_key(self) -> str:
         """
         Validate that API key is available
@@ -162,8 +179,223 @@ class BaseCommand:
 
         return response in ['y', 'yes', '1', 'true']
 
+    def run_bulk_operation(
+        self,
+        action: str,
+        noun: str,
+        targets: List[Tuple[str, str]],
+        operation: Callable[[str], Any],
+        confirm: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        stdin_used: bool = False,
+        skipped: Optional[List[Tuple[str, str]]] = None,
+    ) -> bool:
+        """
+        Confirm once, then run an operation for many targets concurrently
+
+        Args:
+            action: Verb for the operation, e.g. 'delete'
+            noun: Plural resource name, e.g. 'checks'
+            targets: (id, label) pairs to operate on
+            operation: Function performing the operation for one ID
+            confirm: Skip the confirmation prompt
+            concurrency: Maximum number of operations in flight
+            stdin_used: Whether the IDs were read from stdin, so the prompt must use the terminal
+            skipped: (id, label) pairs left alone because they are already in the wanted state
+
+        Returns:
+            bool: True if every operation succeeded (or there was nothing to do)
+        """
+        from rich.prompt import Confirm
+        from ..utils.bulk import run_concurrently
+
+        skipped = skipped or []
+        done = action.rstrip('e') + 'ed'
+
+        if not targets:
+            if self.structured_output:
+                report = {"action": action, "succeeded": [], "failed": []}
+                if skipped:
+                    report["skipped"] = [target_id for target_id, _ in skipped]
+                self.output_data(report)
+            elif skipped:
+                self.display_info(f"Nothing to {action}: all {len(skipped)} {noun} are already in that state.")
+            else:
+                self.display_info(f"No {noun} matched; nothing to {action}.")
+            return True
+
+        if not confirm:
+            preview = Table(title=f"{len(targets)} {noun} to {action}", show_header=True, header_style="bold magenta")
+            preview.add_column("ID", style="cyan")
+            preview.add_column("Name", style="green")
+            for target_id, label in targets[:10]:
+                preview.add_row(target_id, label if label != target_id else "-")
+            if len(targets) > 10:
+                preview.add_row(f"... and {len(targets) - 10} more", "")
+            self.console.print(preview)
+
+            stream = None
+            if stdin_used:
+                # stdin held the IDs, so answer the prompt on the terminal
+                try:
+                    stream = open('/dev/tty')
+                except OSError:
+                    self.display_error(f"IDs were read from stdin, so the confirmation prompt cannot be answered. Use --confirm to {action} without prompting.")
+                    return False
+            try:
+                if not Confirm.ask(f"{action.capitalize()} {len(targets)} {noun}?", stream=stream):
+                    self.console.print("[yellow]Operation cancelled.[/yellow]")
+                    return True
+            finally:
+                if stream is not None:
+                    stream.close()
+
+        succeeded, failed = run_concurrently(
+            targets,
+            operation,
+            f"{action.capitalize()} {noun}",
+            concurrency=concurrency,
+            console=self.error_console,
+            show_progress=not self.structured_output,
+        )
+
+        if self.structured_output:
+            report = {
+                "action": action,
+                "succeeded": [target_id for target_id, _ in succeeded],
+                "failed": [{"id": target_id, "name": label, "error": error} for target_id, label, error in failed],
+            }
+            if skipped:
+                report["skipped"] = [target_id for target_id, _ in skipped]
+            self.output_data(report)
+        elif not failed:
+            skipped_note = f"\n{len(skipped)} already in that state, skipped." if skipped else ""
+            self.display_success(f"{len(succeeded)} {noun} {done} successfully!{skipped_note}", f"✅ Bulk {action.capitalize()}")
+        else:
+            report = Table(title=f"❌ Failed to {action} {len(failed)} of {len(targets)} {noun}", show_header=True, header_style="bold magenta")
+            report.add_column("ID", style="cyan")
+            report.add_column("Name", style="green")
+            report.add_column("Error", style="red")
+            for target_id, label, error in failed:
+                report.add_row(target_id, label if label != target_id else "-", error)
+            self.error_console.print(report)
+            if succeeded:
+                self.console.print(f"[green]{len(succeeded)} {noun} {done} successfully.[/green]")
+
+        return not failed
+
+    def compile_where(self, expression: Optional[str], pushdown: Optional[Dict[str, str]] = None):
+        """
+        Compile a --where option, exiting with an error if it is invalid
+
+        Args:
+            expression: The --where expression
+            pushdown: Field name -> API query parameter for terms the API can evaluate
+
+        Returns:
+            Where: The compiled filter
+        """
+        import typer
+        from ..utils.where import compile_where
+
+        try:
+            return compile_where(expression, pushdown)
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+
+    def iter_pages(self, fetch_page: Callable[[int], Any], items_attr: str, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE, all_pages: bool = True, query=None, limit: Optional[int] = None):
+        """
+        Yield the (matching) items of each page from `page` on
+
+        The next page is requested while the caller handles the current one,
+        so processing overlaps with the network round trip. Paging stops at a
+        page the pagination info marks as last, a short page without it, or
+        once `limit` items have matched; no page past that is requested.
+
+        Args:
+            fetch_page: Function fetching one page by number
+            items_attr: Attribute of the response holding the items
+            page: First page
+            page_size: Items requested per page
+            all_pages: Whether to go past the first page
+            query: A compiled --where filter for the items
+            limit: Stop after this many items
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        remaining = limit
+        prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pngr-prefetch')
+        try:
+            pending = prefetch.submit(fetch_page, page)
+            while pending is not None:
+                response = pending.result()
+                items = list(getattr(response, items_attr, None) or [])
+                more = bool(items) and all_pages and self._has_next_page(response, page, len(items), page_size)
+                if query is not None and query.is_local:
+                    items = list(query.filter(items))
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                    more = more and remaining > 0
+                pending = prefetch.submit(fetch_page, page + 1) if more else None
+                page += 1
+                if items:
+                    yield items
+        finally:
+            prefetch.shutdown(wait=False)
+
+    @staticmethod
+    def _has_next_page(response, page: int, count: int, page_size: int) -> bool:
+        pagination = getattr(response, 'pagination', None)
+        if isinstance(pagination, dict):
+            if 'has_next' in pagination:
+                return bool(pagination['has_next'])
+            total_pages = pagination.get('total_pages') or pagination.get('pages')
+            if total_pages:
+                return page < total_pages
+        return count >= page_size
+
+    @staticmethod
+    def page_size_for(page_size: Optional[int], page: int = 1, limit: Optional[int] = None, query=None, max_page_size: int = MAX_PAGE_SIZE) -> int:
+        """
+        Resolve the page size of a listing
+
+        An explicit page size is kept. For --limit N starting at the first
+        page, pages are sized to reach N items in the fewest requests and
+        without fetching more than needed: N=150 becomes two pages of 75. When
+        a --where filter is evaluated locally there is no telling how many
+        items match, so pages are as large as the API allows.
+        """
+        if page_size:
+            return page_size
+        if not limit or page != 1:
+            # --page counts pages of the default size
+            return DEFAULT_PAGE_SIZE
+        if query is not None and query.is_local:
+            return max_page_size
+        requests = -(-limit // max_page_size)
+        return -(-limit // requests)
+
+    def fetch_listing(self, fetch_page: Callable[[int], Any], items_attr: str, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE, query=None, all_pages: bool = False, limit: Optional[int] = None):
+        """
+        Fetch a listing, filtered by a --where query and cut to `limit` items
+
+        Returns the API response as is for a single unfiltered page. Otherwise
+        the matching items from `page` on (every page with all_pages, or as
+        many as it takes to reach `limit`) are returned under items_attr of a
+        response-like object without pagination.
+        """
+        from types import SimpleNamespace
+
+        if not all_pages and not limit and (query is None or not query.is_local):
+            return fetch_page(page)
+
+        pages = self.iter_pages(fetch_page, items_attr, page, page_size, all_pages or bool(limit), query, limit)
+        return SimpleNamespace(**{items_attr: [item for items in pages for item in items], 'pagination': None})
+
     def output_data(self, data: Any, format_override: Optional[str] = None):
-        """Output data in the specified format (table, json, yaml)"""
+        """Output data in the specified format (table, json, yaml, csv, tsv)"""
         output_format = format_override or self.output_format
 
         if output_format == 'json':
@@ -202,6 +434,9 @@ class BaseCommand:
                         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
                     self.console.print(json.dumps(data, indent=2, default=json_serializer))
+        elif output_format in TABULAR_FORMATS:
+            from ..utils.tabular import records_of
+            self.tabular_writer(output_format=output_format).write(records_of(data))
         else:
             # Default to table format - subclasses should override this
             if isinstance(data, dict):
@@ -211,6 +446,23 @@ class BaseCommand:
             else:
                 self.console.print(str(data))
 
+    def output_ndjson(self, records: Iterable[Dict[str, Any]]):
+        """Write records as newline-delimited JSON, one compact object per line"""
+        for record in records:
+            sys.stdout.write(json.dumps(record, default=str) + "\n")
+        sys.stdout.flush()
+
+    def tabular_writer(self, columns: Optional[List[str]] = None, output_format: Optional[str] = None):
+        """
+        Create a CSV/TSV writer on stdout for streaming rows
+
+        Args:
+            columns: Dotted columns to write (default: the fields of the first record)
+            output_format: 'csv' or 'tsv' (default: the command's output format)
+        """
+        from ..utils.tabular import TabularWriter
+        return TabularWriter(output_format or self.output_format, columns)
+
     def _display_dict_as_table(self, data: Dict[str, Any]):
         """Display dictionary data as a table"""
         table = Table(title="Data")
@@ -3,7 +3,7 @@
 Check groups commands for PingeraCLI
 """
 
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 import typer
@@ -12,8 +12,12 @@ from rich.panel import Panel
 from rich.prompt import Confirm
 
 from .base import BaseCommand
+from ..utils.bulk import DEFAULT_CONCURRENCY, MAX_CONCURRENCY
 from ..utils.config import get_api_key
 
+# Bulk operations: groups or group checks fetched per page
+BULK_PAGE_SIZE = 100
+
 
 class CheckGroupsCommand(BaseCommand):
     """
@@ -31,18 +35,10 @@ class CheckGroupsCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import CheckGroupsApi
-            from ..utils.config import get_config
-
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
+            from ..utils.client import get_api_client
 
-            # Create API client
-            api_client = ApiClient(configuration)
-            return CheckGroupsApi(api_client)
+            return CheckGroupsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -50,6 +46,17 @@ class CheckGroupsCommand(BaseCommand):
             self.display_error(f"Failed to initialize client: {str(e)}")
             raise typer.Exit(1)
 
+    def get_checks_client(self):
+        """Get the checks API client, used to update the checks of a group"""
+        try:
+            from pingera.api import ChecksApi
+            from ..utils.client import get_api_client
+
+            return ChecksApi(get_api_client(get_api_key()))
+        except ImportError:
+            self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
+            raise typer.Exit(1)
+
     def list_groups(self, page: int = 1, page_size: int = 20):
         """List check groups"""
         try:
@@ -61,14 +68,14 @@ class CheckGroupsCommand(BaseCommand):
             if not hasattr(response, 'groups') or not response.groups:
                 if self.output_format == 'json':
                     self.output_data({"groups": [], "total": 0, "message": "No groups found"})
-                elif self.output_format == 'yaml':
+                elif self.structured_output:
                     self.output_data({"groups": [], "total": 0, "message": "No groups found"})
                 else:
                     self.display_info("No check groups found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 groups_data = []
                 for group in response.groups:
                     group_dict = {
@@ -156,7 +163,7 @@ class CheckGroupsCommand(BaseCommand):
             group = groups_api.v1_check_groups_group_id_get(group_id=group_id)
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 group_data = {
                     "id": str(group.id) if group.id else None,
                     "name": group.name if group.name else None,
@@ -333,6 +340,94 @@ class CheckGroupsCommand(BaseCommand):
             self.display_error(f"Failed to delete group: {str(e)}")
             raise typer.Exit(1)
 
+    def bulk_delete_groups(self, group_ids: List[str], name_pattern: Optional[str] = None, confirm: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+        """Delete many check groups, selected by ID and/or a name regex, concurrently"""
+        from ..utils.bulk import compile_name_pattern, read_ids
+
+        try:
+            ids, stdin_used = read_ids(group_ids)
+            pattern = compile_name_pattern(name_pattern)
+            groups_api = self.get_client()
+
+            if pattern:
+                wanted = set(ids)
+                targets = []
+                page = 1
+                while True:
+                    response = groups_api.v1_check_groups_get(page=page, page_size=BULK_PAGE_SIZE)
+                    page_groups = getattr(response, 'groups', None) or []
+                    for group in page_groups:
+                        if (not wanted or str(group.id) in wanted) and pattern.search(group.name or ''):
+                            targets.append((str(group.id), group.name or str(group.id)))
+                    if len(page_groups) < BULK_PAGE_SIZE:
+                        break
+                    page += 1
+            else:
+                targets = [(group_id, group_id) for group_id in ids]
+
+            succeeded = self.run_bulk_operation(
+                'delete', 'check groups', targets,
+                lambda group_id: groups_api.v1_check_groups_group_id_delete(group_id=group_id),
+                confirm=confirm, concurrency=concurrency, stdin_used=stdin_used,
+            )
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to delete groups: {str(e)}")
+            raise typer.Exit(1)
+
+        if not succeeded:
+            raise typer.Exit(1)
+
+    def _all_group_checks(self, groups_api, group_id: str) -> list:
+        """Fetch every check of a group, following pagination"""
+        checks = []
+        page = 1
+        while True:
+            response = groups_api.v1_check_groups_group_id_checks_get(group_id=group_id, page=page, page_size=BULK_PAGE_SIZE)
+            page_checks = getattr(response, 'checks', None) or []
+            checks.extend(page_checks)
+            if len(page_checks) < BULK_PAGE_SIZE:
+                return checks
+            page += 1
+
+    def set_group_active(self, group_id: str, active: bool, concurrency: int = DEFAULT_CONCURRENCY):
+        """Pause or resume every check in a group, skipping checks already in that state"""
+        action = 'resume' if active else 'pause'
+        try:
+            groups_api = self.get_client()
+            checks = self._all_group_checks(groups_api, group_id)
+            if not checks:
+                if self.structured_output:
+                    self.output_data({"action": action, "group_id": group_id, "succeeded": [], "failed": []})
+                else:
+                    self.display_info(f"No checks found in group {group_id}.")
+                return
+
+            # Checks already in the wanted state need no request
+            targets, skipped = [], []
+            for check in checks:
+                target = (str(check.id), check.name or str(check.id))
+                (skipped if getattr(check, 'active', None) is active else targets).append(target)
+
+            checks_api = self.get_checks_client()
+            succeeded = self.run_bulk_operation(
+                action, 'checks', targets,
+                lambda check_id: checks_api.v1_checks_check_id_patch(check_id=check_id, monitor_check1={"active": active}),
+                confirm=True, concurrency=concurrency, skipped=skipped,
+            )
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to {action} checks in group: {str(e)}")
+            raise typer.Exit(1)
+
+        if not succeeded:
+            raise typer.Exit(1)
+
     def get_group_checks(self, group_id: str, page: int = 1, page_size: int = 20):
         """Get checks that belong to a specific group"""
         try:
@@ -346,14 +441,14 @@ class CheckGroupsCommand(BaseCommand):
             )
 
             if not hasattr(response, 'checks') or not response.checks:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"checks": [], "total": 0, "group_id": group_id, "message": "No checks found in this group"})
                 else:
                     self.display_info(f"No checks found in group {group_id}.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 checks_data = []
                 for check in response.checks:
                     check_dict = {
@@ -515,12 +610,42 @@ def update_group(
 
 @app.command("delete")
 def delete_group(
-    group_id: str = typer.Argument(..., help="Group ID to delete"),
+    group_ids: Optional[List[str]] = typer.Argument(None, help="Group IDs to delete ('-' reads IDs from stdin)"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Delete groups whose name matches this regular expression"),
     confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of deletions in flight"),
+):
+    """Delete one or more check groups. All checks in the groups will be moved to ungrouped."""
+    if not group_ids and not name:
+        typer.echo("Error: Specify group IDs, '-' to read them from stdin, or --name", err=True)
+        raise typer.Exit(1)
+
+    groups_cmd = CheckGroupsCommand(get_output_format())
+    if len(group_ids or []) == 1 and group_ids[0] != '-' and not name:
+        groups_cmd.delete_group(group_ids[0], confirm)
+        return
+
+    groups_cmd.bulk_delete_groups(group_ids or [], name, confirm, concurrency)
+
+
+@app.command("pause")
+def pause_group(
+    group_id: str = typer.Argument(..., help="Group ID whose checks to pause"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of updates in flight"),
+):
+    """Pause all checks in a group, e.g. for a maintenance window. Checks already paused are skipped."""
+    groups_cmd = CheckGroupsCommand(get_output_format())
+    groups_cmd.set_group_active(group_id, False, concurrency)
+
+
+@app.command("resume")
+def resume_group(
+    group_id: str = typer.Argument(..., help="Group ID whose checks to resume"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of updates in flight"),
 ):
-    """Delete a check group. All checks in the group will be moved to ungrouped."""
+    """Resume all checks in a group. Checks already active are skipped."""
     groups_cmd = CheckGroupsCommand(get_output_format())
-    groups_cmd.delete_group(group_id, confirm)
+    groups_cmd.set_group_active(group_id, True, concurrency)
 
 
 @app.command("list-checks")
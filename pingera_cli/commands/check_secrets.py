@@ -32,18 +32,10 @@ class CheckSecretsCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import CheckSecretsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            return CheckSecretsApi(api_client)
+            return CheckSecretsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -60,7 +52,7 @@ class CheckSecretsCommand(BaseCommand):
             secrets = check_secrets_api.v1_checks_check_id_secrets_get(check_id)
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 # Convert to dict for JSON/YAML output
                 secrets_data = [secret.to_dict() for secret in secrets]
                 self.output_data({
@@ -117,7 +109,7 @@ class CheckSecretsCommand(BaseCommand):
             created_association = check_secrets_api.v1_checks_check_id_secrets_post(check_id, check_secret)
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data(created_association.to_dict())
             else:
                 self.display_success(
@@ -158,7 +150,7 @@ class CheckSecretsCommand(BaseCommand):
             # Make API call
             check_secrets_api.v1_checks_check_id_secrets_secret_id_delete(check_id, secret_id)
             
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data({
                     "message": f"Secret '{secret_id}' removed from check '{check_id}'",
                     "check_id": check_id,
@@ -192,7 +184,7 @@ class CheckSecretsCommand(BaseCommand):
             updated_associations = check_secrets_api.v1_checks_check_id_secrets_put(check_id, check_secrets)
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 associations_data = [assoc.to_dict() for assoc in updated_associations]
                 self.output_data({
                     'check_id': check_id,
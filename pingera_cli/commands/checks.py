@@ -3,7 +3,7 @@ Checks commands for PingeraCLI
 """
 
 import os
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 import typer
@@ -12,11 +12,104 @@ from rich.panel import Panel
 from rich.prompt import Confirm
 
 from .base import BaseCommand
+from ..utils.bulk import DEFAULT_CONCURRENCY, MAX_CONCURRENCY
 from ..utils.config import get_api_key
 
 # Supported check types
 SUPPORTED_CHECK_TYPES = ["web", "api", "tcp", "ssl", "dns", "icmp", "portscan", "synthetic", "multistep"]
 
+# Watch mode: results fetched per poll page, pages per poll, and IDs remembered for deduplication
+WATCH_PAGE_SIZE = 100
+WATCH_MAX_PAGES = 10
+WATCH_SEEN_IDS = 1000
+
+# Bulk operations: checks fetched per page when resolving filters
+BULK_PAGE_SIZE = 100
+
+# Results export and --all: results fetched per page
+EXPORT_PAGE_SIZE = 100
+
+# Formats of checks export-results
+EXPORT_FORMATS = ["archive", "parquet"]
+
+# --where fields on results that the API filters on itself, and their query parameters
+RESULT_WHERE_PUSHDOWN = {"check_id": "check_id", "status": "status", "check_type": "check_type", "region": "region", "result_type": "result_type"}
+
+# --where fields on checks that the API filters on itself
+CHECK_WHERE_PUSHDOWN = {"type": "type", "status": "status", "group_id": "group_id"}
+
+# Default csv/tsv columns for results; check_metadata is left out unless asked for
+RESULT_COLUMNS = [
+    "id", "check_id", "check_name", "check_type", "status", "created_at", "response_time",
+    "error_message", "region", "result_type", "check_server_id",
+    "check_server.ip_address", "check_server.country", "check_server.region",
+]
+
+# Dashboard: response times kept per check for the trend sparkline
+DASHBOARD_SPARK_POINTS = 20
+# Dashboard: pages per refresh when results of checks off the board share the query
+DASHBOARD_MAX_PAGES = 50
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: List[Optional[float]]) -> str:
+    """Render values as a unicode block sparkline, missing values as spaces"""
+    numbers = [value for value in values if value is not None]
+    if not numbers:
+        return ""
+
+    low, high = min(numbers), max(numbers)
+    span = (high - low) or 1
+    return "".join(
+        " " if value is None else SPARK_BLOCKS[int((value - low) / span * (len(SPARK_BLOCKS) - 1))]
+        for value in values
+    )
+
+
+def _age(timestamp: Optional[datetime]) -> str:
+    """Format how long ago a timestamp was, e.g. '42s ago'"""
+    if timestamp is None:
+        return "-"
+
+    from datetime import timezone
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    seconds = max(0, int((datetime.now(timezone.utc) - timestamp).total_seconds()))
+    if seconds < 60:
+        return f"{seconds}s ago"
+    if seconds < 3600:
+        return f"{seconds // 60}m ago"
+    return f"{seconds // 3600}h ago"
+
+
+def _result_check_server(result) -> Optional[dict]:
+    server = getattr(result, 'check_server', None)
+    if not server:
+        return None
+    return {
+        "ip_address": getattr(server, 'ip_address', None),
+        "country": getattr(server, 'country', None),
+        "region": getattr(server, 'region', None),
+    }
+
+
+# Fields of a result in JSON/YAML/NDJSON output, in order; --fields picks from these
+RESULT_FIELD_GETTERS = {
+    "id": lambda result: str(result.id) if getattr(result, 'id', None) else None,
+    "check_id": lambda result: getattr(result, 'check_id', None),
+    "check_name": lambda result: getattr(result, 'check_name', None),
+    "check_type": lambda result: getattr(result, 'check_type', None),
+    "status": lambda result: getattr(result, 'status', None),
+    "created_at": lambda result: getattr(result, 'created_at', None) or None,
+    "response_time": lambda result: getattr(result, 'response_time', None),
+    "error_message": lambda result: getattr(result, 'error_message', None),
+    "check_server_id": lambda result: getattr(result, 'check_server_id', None),
+    "region": lambda result: getattr(result, 'region', None),
+    "result_type": lambda result: getattr(result, 'result_type', None),
+    "check_metadata": lambda result: getattr(result, 'check_metadata', None),
+    "check_server": _result_check_server,
+}
+
 
 class ChecksCommand(BaseCommand):
     """
@@ -34,18 +127,10 @@ class ChecksCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import ChecksApi
-            from ..utils.config import get_config
-
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
+            from ..utils.client import get_api_client
 
-            # Create API client
-            api_client = ApiClient(configuration)
-            return ChecksApi(api_client)
+            return ChecksApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -61,18 +146,10 @@ class ChecksCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import ChecksUnifiedResultsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            return ChecksUnifiedResultsApi(api_client)
+            return ChecksUnifiedResultsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -80,41 +157,35 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to initialize client: {str(e)}")
             raise typer.Exit(1)
 
-    def list_checks(self, page: int = 1, page_size: int = 20, check_type: Optional[str] = None, status: Optional[str] = None, name: Optional[str] = None, group_id: Optional[str] = None):
+    def list_checks(self, page: int = 1, page_size: Optional[int] = None, check_type: Optional[str] = None, status: Optional[str] = None, name: Optional[str] = None, group_id: Optional[str] = None, where: Optional[str] = None, all_pages: bool = False, limit: Optional[int] = None):
         """List monitoring checks"""
+        explicit = {"type": check_type, "status": status, "group_id": group_id}
+        query = self.compile_where(where, {field: param for field, param in CHECK_WHERE_PUSHDOWN.items() if not explicit.get(param)})
+        page_size = self.page_size_for(page_size, page, limit, query)
+
         try:
             checks_api = self.get_client()
 
             # Build parameters for the API call
-            params = {
-                "page": page,
-                "page_size": page_size
-            }
+            params = {**query.params, **self._list_checks_params(page, page_size, check_type, status, name, group_id)}
 
-            # Add optional filters
-            if check_type:
-                params["type"] = check_type
-            if status:
-                params["status"] = status
-            if name:
-                params["name"] = name
-            if group_id:
-                params["group_id"] = group_id
+            def fetch_page(number):
+                return checks_api.v1_checks_get(**{**params, "page": number})
 
             # Make API call using the actual SDK method with filters
-            response = checks_api.v1_checks_get(**params)
+            response = self.fetch_listing(fetch_page, 'checks', page, page_size, query, all_pages, limit)
 
             if not response.checks:
                 if self.output_format == 'json':
                     self.output_data({"checks": [], "total": 0, "message": "No checks found"})
-                elif self.output_format == 'yaml':
+                elif self.structured_output:
                     self.output_data({"checks": [], "total": 0, "message": "No checks found"})
                 else:
                     self.display_info("No checks found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 checks_data = []
                 for check in response.checks:
                     check_dict = {
@@ -258,6 +329,25 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to list checks: {str(e)}")
             raise typer.Exit(1)
 
+    def _list_checks_params(self, page: int, page_size: int, check_type: Optional[str] = None, status: Optional[str] = None, name: Optional[str] = None, group_id: Optional[str] = None) -> dict:
+        """Build v1_checks_get parameters from the list filters"""
+        params = {
+            "page": page,
+            "page_size": page_size
+        }
+
+        # Add optional filters
+        if check_type:
+            params["type"] = check_type
+        if status:
+            params["status"] = status
+        if name:
+            params["name"] = name
+        if group_id:
+            params["group_id"] = group_id
+
+        return params
+
     def get_check(self, check_id: str):
         """Get specific check details"""
         try:
@@ -265,7 +355,7 @@ class ChecksCommand(BaseCommand):
             check = checks_api.v1_checks_check_id_get(check_id=check_id)
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 check_data = {
                     "id": str(check.id) if check.id else None,
                     "name": check.name if check.name else None,
@@ -593,73 +683,79 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to create check: {str(e)}")
             raise typer.Exit(1)
 
-    def update_check(self, check_id: str, name: Optional[str] = None, url: Optional[str] = None, host: Optional[str] = None, port: Optional[int] = None, interval: Optional[int] = None, timeout: Optional[int] = None, active: Optional[bool] = None, parameters: Optional[str] = None, pw_script_file: Optional[str] = None, regions: Optional[str] = None):
-        """Update an existing check"""
-        try:
-            import json
-            import os
-            checks_api = self.get_client()
+    def _build_check_update(self, name: Optional[str] = None, url: Optional[str] = None, host: Optional[str] = None, port: Optional[int] = None, interval: Optional[int] = None, timeout: Optional[int] = None, active: Optional[bool] = None, parameters: Optional[str] = None, pw_script_file: Optional[str] = None, regions: Optional[str] = None) -> dict:
+        """Build the PATCH body for check updates, loading the Playwright script if given"""
+        import json
+        import os
+
+        # Build update data
+        update_data = {}
+        if name is not None:
+            update_data["name"] = name
+        if url is not None:
+            update_data["url"] = url
+        if host is not None:
+            update_data["host"] = host
+        if port is not None:
+            update_data["port"] = port
+        if interval is not None:
+            update_data["interval"] = interval
+        if timeout is not None:
+            update_data["timeout"] = timeout
+        if active is not None:
+            update_data["active"] = active
+
+        # Handle pw_script_file option
+        params_dict = {}
+        if pw_script_file is not None:
+            if not os.path.exists(pw_script_file):
+                self.display_error(f"Playwright script file not found: {pw_script_file}")
+                raise typer.Exit(1)
 
-            # Build update data
-            update_data = {}
-            if name is not None:
-                update_data["name"] = name
-            if url is not None:
-                update_data["url"] = url
-            if host is not None:
-                update_data["host"] = host
-            if port is not None:
-                update_data["port"] = port
-            if interval is not None:
-                update_data["interval"] = interval
-            if timeout is not None:
-                update_data["timeout"] = timeout
-            if active is not None:
-                update_data["active"] = active
+            try:
+                with open(pw_script_file, 'r', encoding='utf-8') as f:
+                    pw_script_content = f.read().strip()
 
-            # Handle pw_script_file option
-            params_dict = {}
-            if pw_script_file is not None:
-                if not os.path.exists(pw_script_file):
-                    self.display_error(f"Playwright script file not found: {pw_script_file}")
+                if not pw_script_content:
+                    self.display_error(f"Playwright script file is empty: {pw_script_file}")
                     raise typer.Exit(1)
 
-                try:
-                    with open(pw_script_file, 'r', encoding='utf-8') as f:
-                        pw_script_content = f.read().strip()
+                params_dict["pw_script"] = pw_script_content
+                self.display_info(f"Loaded Playwright script from: {pw_script_file}")
 
-                    if not pw_script_content:
-                        self.display_error(f"Playwright script file is empty: {pw_script_file}")
-                        raise typer.Exit(1)
+            except IOError as e:
+                self.display_error(f"Failed to read Playwright script file: {str(e)}")
+                raise typer.Exit(1)
 
-                    params_dict["pw_script"] = pw_script_content
-                    self.display_info(f"Loaded Playwright script from: {pw_script_file}")
+        # Handle regions parameter - add to params_dict if provided and not in parameters
+        if regions is not None and parameters is None:
+            # Parse comma-separated regions into a list
+            regions_list = [r.strip() for r in regions.split(',') if r.strip()]
+            if regions_list:
+                params_dict["regions"] = regions_list
 
-                except IOError as e:
-                    self.display_error(f"Failed to read Playwright script file: {str(e)}")
-                    raise typer.Exit(1)
+        # Parse parameters JSON if provided (this takes precedence over --regions)
+        if parameters is not None:
+            try:
+                parsed_params = json.loads(parameters)
+                # Merge with pw_script from file if both are provided
+                params_dict.update(parsed_params)
+            except json.JSONDecodeError as e:
+                self.display_error(f"Invalid JSON in --parameters: {str(e)}")
+                self.display_info("Example: --parameters '{\"pw_script\": \"const { test } = require('@playwright/test'); test('example', async ({ page }) => { await page.goto('https://example.com'); });\", \"regions\": [\"US\", \"EU\"]}'")
+                raise typer.Exit(1)
 
-            # Handle regions parameter - add to params_dict if provided and not in parameters
-            if regions is not None and parameters is None:
-                # Parse comma-separated regions into a list
-                regions_list = [r.strip() for r in regions.split(',') if r.strip()]
-                if regions_list:
-                    params_dict["regions"] = regions_list
+        # Add parameters to update_data if we have any
+        if params_dict:
+            update_data["parameters"] = params_dict
 
-            # Parse parameters JSON if provided (this takes precedence over --regions)
-            if parameters is not None:
-                try:
-                    parsed_params = json.loads(parameters)
-                    # Merge with pw_script from file if both are provided
-                    params_dict.update(parsed_params)
-                except json.JSONDecodeError as e:
-                    self.display_error(f"Invalid JSON in --parameters: {str(e)}")
-                    self.display_info("Example: --parameters '{\"pw_script\": \"const { test } = require('@playwright/test'); test('example', async ({ page }) => { await page.goto('https://example.com'); });\", \"regions\": [\"US\", \"EU\"]}'")
-                    raise typer.Exit(1)
+        return update_data
 
-            # Add parameters to update_data if we have any
-            if params_dict:
-                update_data["parameters"] = params_dict
+    def update_check(self, check_id: str, name: Optional[str] = None, url: Optional[str] = None, host: Optional[str] = None, port: Optional[int] = None, interval: Optional[int] = None, timeout: Optional[int] = None, active: Optional[bool] = None, parameters: Optional[str] = None, pw_script_file: Optional[str] = None, regions: Optional[str] = None):
+        """Update an existing check"""
+        try:
+            checks_api = self.get_client()
+            update_data = self._build_check_update(name, url, host, port, interval, timeout, active, parameters, pw_script_file, regions)
 
             if not update_data:
                 self.display_warning("No updates specified. Use --name, --url, --host, --port, --interval, --timeout, --active/--inactive, --parameters, or --pw-script-file to update.")
@@ -722,16 +818,126 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to delete check: {str(e)}")
             raise typer.Exit(1)
 
-    def get_check_results(self, check_id: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None, page: int = 1, page_size: int = 20, status: Optional[str] = None, check_type: Optional[str] = None, region: Optional[str] = None, result_id: Optional[str] = None):
-        """Get check results using unified results API"""
+    def _select_checks(self, check_ids: List[str], check_type: Optional[str] = None, group_id: Optional[str] = None, name_pattern: Optional[str] = None) -> List[tuple]:
+        """
+        Resolve explicit IDs and filters to the checks a bulk operation targets
+
+        Without filters the IDs are used as given. With filters, all matching
+        checks are listed (type and group are filtered by the API, the name
+        regex locally), restricted to the explicit IDs if any were given.
+
+        Returns:
+            List[tuple]: (check ID, check name) pairs
+        """
+        from ..utils.bulk import compile_name_pattern
+
+        pattern = compile_name_pattern(name_pattern)
+        if not (check_type or group_id or pattern):
+            return [(check_id, check_id) for check_id in check_ids]
+
+        checks_api = self.get_client()
+        wanted = set(check_ids)
+        selected = []
+        page = 1
+        while True:
+            response = checks_api.v1_checks_get(**self._list_checks_params(page, BULK_PAGE_SIZE, check_type, None, None, group_id))
+            page_checks = response.checks or []
+            for check in page_checks:
+                if wanted and str(check.id) not in wanted:
+                    continue
+                if pattern and not pattern.search(check.name or ''):
+                    continue
+                selected.append((str(check.id), check.name or str(check.id)))
+            if len(page_checks) < BULK_PAGE_SIZE:
+                break
+            page += 1
+        return selected
+
+    def bulk_delete_checks(self, check_ids: List[str], check_type: Optional[str] = None, group_id: Optional[str] = None, name_pattern: Optional[str] = None, confirm: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+        """Delete many checks, selected by ID and/or filters, concurrently"""
+        from ..utils.bulk import read_ids
+
+        try:
+            ids, stdin_used = read_ids(check_ids)
+            targets = self._select_checks(ids, check_type, group_id, name_pattern)
+            checks_api = self.get_client()
+            succeeded = self.run_bulk_operation(
+                'delete', 'checks', targets,
+                lambda check_id: checks_api.v1_checks_check_id_delete(check_id=check_id),
+                confirm=confirm, concurrency=concurrency, stdin_used=stdin_used,
+            )
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to delete checks: {str(e)}")
+            raise typer.Exit(1)
+
+        if not succeeded:
+            raise typer.Exit(1)
+
+    def bulk_update_checks(self, check_ids: List[str], update_options: dict, check_type: Optional[str] = None, group_id: Optional[str] = None, name_pattern: Optional[str] = None, confirm: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+        """Apply the same update to many checks, selected by ID and/or filters, concurrently"""
+        from ..utils.bulk import read_ids
+
+        try:
+            update_data = self._build_check_update(**update_options)
+            if not update_data:
+                self.display_warning("No updates specified. Use --name, --url, --host, --port, --interval, --timeout, --active/--inactive, --parameters, or --pw-script-file to update.")
+                return
+
+            ids, stdin_used = read_ids(check_ids)
+            targets = self._select_checks(ids, check_type, group_id, name_pattern)
+            checks_api = self.get_client()
+            succeeded = self.run_bulk_operation(
+                'update', 'checks', targets,
+                lambda check_id: checks_api.v1_checks_check_id_patch(check_id=check_id, monitor_check1=update_data),
+                confirm=confirm, concurrency=concurrency, stdin_used=stdin_used,
+            )
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to update checks: {str(e)}")
+            raise typer.Exit(1)
+
+        if not succeeded:
+            raise typer.Exit(1)
+
+    def get_check_results(self, check_id: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None, page: int = 1, page_size: Optional[int] = None, status: Optional[str] = None, check_type: Optional[str] = None, region: Optional[str] = None, result_id: Optional[str] = None, all_pages: bool = False, columns: Optional[str] = None, fields: Optional[str] = None, where: Optional[str] = None, limit: Optional[int] = None):
+        """
+        Get check results using unified results API
+
+        With `fields`, structured output only carries those fields; the others
+        (check_metadata in particular) are never converted or serialized.
+        `where` filters results as pages arrive; equality terms on fields the
+        API filters on are sent with the request. With `limit`, pages are
+        fetched until that many results match and no further.
+        """
+        from ..utils.fields import parse_fields
+        from ..utils.tabular import parse_columns
+
+        try:
+            fields_list = parse_fields(fields, list(RESULT_FIELD_GETTERS))
+            # Projected records define their own columns unless --columns says otherwise
+            columns_list = parse_columns(columns, None if fields_list else RESULT_COLUMNS)
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+
+        explicit = {"check_id": check_id, "status": status, "check_type": check_type, "region": region}
+        query = self.compile_where(where, {field: param for field, param in RESULT_WHERE_PUSHDOWN.items() if not explicit.get(param)})
+        page_size = self.page_size_for(page_size, page, limit, query)
+
         try:
             unified_api = self.get_unified_results_client()
 
             # Build parameters for the unified API call
-            params = {
-                "page": page,
-                "page_size": page_size
-            }
+            params = dict(query.params)
 
             # Add check_id only if provided
             if check_id:
@@ -753,11 +959,21 @@ class ChecksCommand(BaseCommand):
             if region:
                 params["region"] = region
 
+            def fetch_page(number):
+                return unified_api.v1_checks_all_results_get(page=number, page_size=page_size, **params)
+
+            if self.tabular_output:
+                # Rows go out page by page instead of after the whole listing
+                writer = self.tabular_writer(columns_list)
+                for results in self.iter_pages(fetch_page, 'results', page, page_size, all_pages or bool(limit), query, limit):
+                    writer.write(self._result_to_dict(result, fields_list) for result in results)
+                return
+
             # Use the unified results API
-            response = unified_api.v1_checks_all_results_get(**params)
+            response = self.fetch_listing(fetch_page, 'results', page, page_size, query, all_pages, limit)
 
             if not hasattr(response, 'results') or not response.results:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"results": [], "total": 0, "message": "No results found"})
                 else:
                     self.display_info("No results found.")
@@ -767,26 +983,8 @@ class ChecksCommand(BaseCommand):
             if result_id and len(response.results) == 1:
                 result = response.results[0]
 
-                if self.output_format in ['json', 'yaml']:
-                    result_dict = {
-                        "id": str(result.id) if hasattr(result, 'id') and result.id else None,
-                        "check_id": result.check_id if hasattr(result, 'check_id') else None,
-                        "check_name": result.check_name if hasattr(result, 'check_name') else None,
-                        "check_type": result.check_type if hasattr(result, 'check_type') else None,
-                        "status": result.status if hasattr(result, 'status') else None,
-                        "created_at": result.created_at if hasattr(result, 'created_at') and result.created_at else None,
-                        "response_time": result.response_time if hasattr(result, 'response_time') else None,
-                        "error_message": result.error_message if hasattr(result, 'error_message') else None,
-                        "check_server_id": result.check_server_id if hasattr(result, 'check_server_id') else None,
-                        "region": result.region if hasattr(result, 'region') else None,
-                        "result_type": result.result_type if hasattr(result, 'result_type') else None,
-                        "check_metadata": result.check_metadata if hasattr(result, 'check_metadata') else None,
-                        "check_server": {
-                            "ip_address": result.check_server.ip_address if hasattr(result, 'check_server') and result.check_server and hasattr(result.check_server, 'ip_address') else None,
-                            "country": result.check_server.country if hasattr(result, 'check_server') and result.check_server and hasattr(result.check_server, 'country') else None,
-                            "region": result.check_server.region if hasattr(result, 'check_server') and result.check_server and hasattr(result.check_server, 'region') else None
-                        } if hasattr(result, 'check_server') and result.check_server else None
-                    }
+                if self.structured_output:
+                    result_dict = self._result_to_dict(result, fields_list)
                     self.output_data(result_dict)
                 else:
                     # Display with full formatting using _display_detailed_result
@@ -794,28 +992,10 @@ class ChecksCommand(BaseCommand):
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 results_data = []
                 for result in response.results:
-                    result_dict = {
-                        "id": str(result.id) if hasattr(result, 'id') and result.id else None,
-                        "check_id": result.check_id if hasattr(result, 'check_id') else None,
-                        "check_name": result.check_name if hasattr(result, 'check_name') else None,
-                        "check_type": result.check_type if hasattr(result, 'check_type') else None,
-                        "status": result.status if hasattr(result, 'status') else None,
-                        "created_at": result.created_at if hasattr(result, 'created_at') and result.created_at else None,
-                        "response_time": result.response_time if hasattr(result, 'response_time') else None,
-                        "error_message": result.error_message if hasattr(result, 'error_message') else None,
-                        "check_server_id": result.check_server_id if hasattr(result, 'check_server_id') else None,
-                        "region": result.region if hasattr(result, 'region') else None,
-                        "result_type": result.result_type if hasattr(result, 'result_type') else None,
-                        "check_metadata": result.check_metadata if hasattr(result, 'check_metadata') else None,
-                        "check_server": {
-                            "ip_address": result.check_server.ip_address if hasattr(result, 'check_server') and result.check_server and hasattr(result.check_server, 'ip_address') else None,
-                            "country": result.check_server.country if hasattr(result, 'check_server') and result.check_server and hasattr(result.check_server, 'country') else None,
-                            "region": result.check_server.region if hasattr(result, 'check_server') and result.check_server and hasattr(result.check_server, 'region') else None
-                        } if hasattr(result, 'check_server') and result.check_server else None
-                    }
+                    result_dict = self._result_to_dict(result, fields_list)
                     results_data.append(result_dict)
 
                 pagination_info = {}
@@ -930,6 +1110,349 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to get check results: {str(e)}")
             raise typer.Exit(1)
 
+    def _result_to_dict(self, result, fields: Optional[List[str]] = None) -> dict:
+        """Convert a unified result to a plain dict for JSON/YAML/NDJSON output, with only `fields` if given"""
+        from ..utils.fields import project
+        return project(result, RESULT_FIELD_GETTERS, fields)
+
+    def export_results(self, path: str, check_id: Optional[str] = None, from_date: Optional[str] = None, to_date: Optional[str] = None, status: Optional[str] = None, check_type: Optional[str] = None, region: Optional[str] = None, compression: Optional[str] = None, export_format: Optional[str] = None):
+        """
+        Stream check results into a compressed archive or a Parquet file
+
+        Each page is written as soon as it arrives while the next one is
+        already being fetched, so memory stays flat however many results
+        match. Parquet takes its columns straight from the result objects.
+        """
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+        from .. import __version__
+
+        export_format = export_format or ('parquet' if path.endswith('.parquet') else 'archive')
+        if export_format not in EXPORT_FORMATS:
+            self.display_error(f"Invalid export format '{export_format}'. Must be one of: {', '.join(EXPORT_FORMATS)}")
+            raise typer.Exit(1)
+
+        params = {"check_id": check_id, "start_date": from_date, "end_date": to_date, "status": status, "check_type": check_type, "region": region}
+        params = {key: value for key, value in params.items() if value}
+
+        try:
+            unified_api = self.get_unified_results_client()
+
+            metadata = {'kind': 'results', 'filters': params, 'cli_version': __version__}
+            if export_format == 'parquet':
+                from ..utils.parquet import ParquetResultWriter
+                writer = ParquetResultWriter(path, compression or 'zstd', metadata=metadata)
+                write_page = writer.write
+                written = lambda: writer.rows
+            else:
+                from ..utils.archive import ArchiveWriter
+                writer = ArchiveWriter(path, compression or 'gzip', resources=['results'], metadata=metadata)
+                write_page = lambda results: writer.write_many('results', (self._result_to_dict(result) for result in results))
+                written = lambda: writer.counts()['results']
+
+            with writer, Progress(SpinnerColumn(), TextColumn("{task.description}"), TimeElapsedColumn(), console=self.error_console, transient=True, disable=self.structured_output) as progress:
+                task = progress.add_task("Exporting results...", total=None)
+                fetch_page = lambda number: unified_api.v1_checks_all_results_get(page=number, page_size=EXPORT_PAGE_SIZE, **params)
+                for page, results in enumerate(self.iter_pages(fetch_page, 'results', page_size=EXPORT_PAGE_SIZE), start=1):
+                    write_page(results)
+                    progress.update(task, description=f"Exporting results... {written()} written (page {page})")
+            count = written()
+
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to export results: {str(e)}")
+            raise typer.Exit(1)
+
+        if self.structured_output:
+            self.output_data({"path": path, "results": count})
+        else:
+            self.display_success(f"{count} results written to {path}", "📦 Results Exported")
+
+    def watch_results(self, check_id: Optional[str] = None, interval: float = 10.0, lines: int = 10, status: Optional[str] = None, check_type: Optional[str] = None, region: Optional[str] = None, ndjson: bool = False, columns: Optional[str] = None, fields: Optional[str] = None):
+        """
+        Follow new check results, like tail -f
+
+        Keeps a created_at watermark and only asks for results from it onwards,
+        so each poll costs as much as the number of new results. Results seen
+        at the watermark are deduplicated by ID.
+        """
+        import time
+        from collections import OrderedDict
+        from ..utils.client import DeadlineExceeded
+        from ..utils.fields import parse_fields
+        from ..utils.tabular import parse_columns
+
+        try:
+            fields_list = parse_fields(fields, list(RESULT_FIELD_GETTERS))
+            writer = self.tabular_writer(parse_columns(columns, None if fields_list else RESULT_COLUMNS)) if self.tabular_output and not ndjson else None
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+        ndjson = ndjson or self.structured_output
+        unified_api = self.get_unified_results_client()
+
+        params = {}
+        if check_id:
+            params["check_id"] = check_id
+        if status:
+            params["status"] = status
+        if check_type:
+            params["check_type"] = check_type
+        if region:
+            params["region"] = region
+
+        watermark = None
+        seen_ids = OrderedDict()
+        shown = 0
+
+        def emit(results):
+            nonlocal watermark, shown
+            for result in results:
+                result_key = str(result.id)
+                if result_key in seen_ids:
+                    continue
+                seen_ids[result_key] = True
+                while len(seen_ids) > WATCH_SEEN_IDS:
+                    seen_ids.popitem(last=False)
+
+                if result.created_at and (watermark is None or result.created_at > watermark):
+                    watermark = result.created_at
+
+                if writer is not None:
+                    writer.write([self._result_to_dict(result, fields_list)])
+                elif ndjson:
+                    self.output_ndjson([self._result_to_dict(result, fields_list)])
+                else:
+                    self.console.print(self._format_watch_line(result))
+                shown += 1
+
+        try:
+            if not ndjson:
+                target = f"check {check_id}" if check_id else "all checks"
+                self.console.print(f"[dim]Watching new results for {target} every {interval:g}s. Press Ctrl+C to stop.[/dim]")
+                self.console.print(f"[bold]{'Time':<8}  {'Status':<11} {'Response':>9}  {'Region':<12} {'Check':<24} Result ID[/bold]")
+
+            # Start with the most recent results, oldest first like tail
+            response = unified_api.v1_checks_all_results_get(page=1, page_size=max(1, min(lines, 100)), **params)
+            initial = list(getattr(response, 'results', None) or [])
+            emit(sorted(initial, key=self._created_at_key)[-lines:] if lines > 0 else [])
+            if lines <= 0 and initial:
+                # Nothing to show, but start the watermark at the newest result
+                watermark = max(initial, key=self._created_at_key).created_at
+                seen_ids.update((str(result.id), True) for result in initial)
+
+            while True:
+                time.sleep(interval)
+                try:
+                    if watermark is None:
+                        response = unified_api.v1_checks_all_results_get(page=1, page_size=WATCH_PAGE_SIZE, **params)
+                        emit(sorted(getattr(response, 'results', None) or [], key=self._created_at_key))
+                    else:
+                        emit(self._fetch_results_since(unified_api, params, watermark, seen_ids)[0])
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    # Keep following through transient failures (retries have already been used)
+                    self.error_console.print(f"[yellow]⚠ Failed to fetch new results: {str(e)}[/yellow]")
+
+        except (KeyboardInterrupt, DeadlineExceeded):
+            if not ndjson:
+                self.console.print(f"\n[dim]Stopped watching after {shown} results[/dim]")
+        except Exception as e:
+            self.display_error(f"Failed to watch check results: {str(e)}")
+            raise typer.Exit(1)
+
+    def _fetch_results_since(self, unified_api, params: dict, watermark, seen_ids, max_pages: int = WATCH_MAX_PAGES) -> Tuple[list, bool]:
+        """
+        Fetch results created at or after the watermark that were not seen yet, oldest first
+
+        Returns:
+            Tuple[list, bool]: The results, and whether max_pages ran out before
+            reaching the watermark (older new results were left out)
+        """
+        new_results = []
+        truncated = True
+        for page in range(1, max_pages + 1):
+            response = unified_api.v1_checks_all_results_get(page=page, page_size=WATCH_PAGE_SIZE, start_date=watermark, **params)
+            results = list(getattr(response, 'results', None) or [])
+            fresh = [result for result in results if str(result.id) not in seen_ids]
+            new_results.extend(fresh)
+
+            # A short page, or one reaching results already seen, is the last one needed
+            if len(results) < WATCH_PAGE_SIZE or len(fresh) < len(results):
+                truncated = False
+                break
+
+        return sorted(new_results, key=self._created_at_key), truncated
+
+    @staticmethod
+    def _created_at_key(result):
+        created_at = getattr(result, 'created_at', None)
+        return created_at.timestamp() if created_at else 0.0
+
+    def _format_watch_line(self, result) -> str:
+        """Format one result as a fixed-width line for watch mode"""
+        timestamp = result.created_at.strftime("%H:%M:%S") if getattr(result, 'created_at', None) else "-"
+        result_status = getattr(result, 'status', None) or "-"
+        status_color = "green" if result_status == 'ok' else "red"
+        status_emoji = "✅" if result_status == 'ok' else "❌"
+        response_time = f"{result.response_time}ms" if getattr(result, 'response_time', None) is not None else "-"
+        region_display = (getattr(result, 'region', None) or "-")[:12]
+        check_name = (getattr(result, 'check_name', None) or getattr(result, 'check_id', None) or "-")[:24]
+
+        line = f"{timestamp:<8}  [{status_color}]{status_emoji} {result_status:<8}[/{status_color}] {response_time:>9}  [magenta]{region_display:<12}[/magenta] [green]{check_name:<24}[/green] [dim]{result.id}[/dim]"
+        error_message = getattr(result, 'error_message', None)
+        if error_message:
+            line += f"\n          [red]{error_message}[/red]"
+        return line
+
+    def show_dashboard(self, check_type: Optional[str] = None, status: Optional[str] = None, name: Optional[str] = None, group_id: Optional[str] = None, interval: float = 30.0, history_minutes: int = 60, max_checks: int = 100, once: bool = False):
+        """
+        Live status board for many checks
+
+        Checks are listed with the `checks list` filters; every refresh then
+        makes one unified results query for everything newer than the last
+        result seen (paging only when more than a page arrived) and updates
+        per-check latency histories in place.
+
+        The query can only be narrowed to a single check or a check type, so
+        when other checks' results share it the page budget is raised, and the
+        board says so if results were still left out.
+        """
+        import time
+        from collections import OrderedDict, deque
+        from datetime import timedelta, timezone
+        from rich.live import Live
+        from ..utils.client import DeadlineExceeded
+
+        try:
+            checks_api = self.get_client()
+            unified_api = self.get_unified_results_client()
+
+            params = self._list_checks_params(1, max_checks, check_type, status, name, group_id)
+            checks = list(checks_api.v1_checks_get(**params).checks or [])
+            if not checks:
+                self.display_info("No checks found.")
+                return
+
+            history = {str(check.id): deque(maxlen=DASHBOARD_SPARK_POINTS) for check in checks}
+            watermark = datetime.now(timezone.utc) - timedelta(minutes=history_minutes)
+            seen_ids = OrderedDict()
+            truncated = False
+
+            if len(checks) == 1:
+                results_params = {"check_id": str(checks[0].id)}
+            else:
+                results_params = {"check_type": check_type} if check_type else {}
+            # Results of checks not on the board also count against the page budget
+            shared = len(checks) > 1 and bool(status or name or group_id or len(checks) >= max_checks)
+            max_pages = DASHBOARD_MAX_PAGES if shared else WATCH_MAX_PAGES
+
+            def refresh():
+                nonlocal watermark, truncated
+                results, cut_short = self._fetch_results_since(unified_api, results_params, watermark, seen_ids, max_pages)
+                # The gap stays in the histories, so the flag does too
+                truncated = truncated or cut_short
+                for result in results:
+                    seen_ids[str(result.id)] = True
+                    if self._created_at_key(result) > watermark.timestamp():
+                        watermark = result.created_at
+                    check_history = history.get(str(getattr(result, 'check_id', None)))
+                    if check_history is not None:
+                        check_history.append(result)
+                while len(seen_ids) > WATCH_SEEN_IDS:
+                    seen_ids.popitem(last=False)
+
+            refresh()
+
+            if once or self.structured_output:
+                if self.structured_output:
+                    self.output_data({
+                        "checks": [self._dashboard_entry(check, history[str(check.id)]) for check in checks],
+                        "history_truncated": truncated,
+                    })
+                else:
+                    self.console.print(self._render_dashboard(checks, history, truncated=truncated))
+                return
+
+            with Live(self._render_dashboard(checks, history, interval, truncated), console=self.console, auto_refresh=False, screen=False) as live:
+                while True:
+                    time.sleep(interval)
+                    try:
+                        refresh()
+                    except DeadlineExceeded:
+                        raise
+                    except Exception as e:
+                        self.error_console.print(f"[yellow]⚠ Failed to refresh results: {str(e)}[/yellow]")
+                    live.update(self._render_dashboard(checks, history, interval, truncated), refresh=True)
+
+        except (KeyboardInterrupt, DeadlineExceeded):
+            return
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to show dashboard: {str(e)}")
+            raise typer.Exit(1)
+
+    def _dashboard_entry(self, check, results) -> dict:
+        """Summarize a check's recent results for the dashboard"""
+        latest = results[-1] if results else None
+        return {
+            "id": str(check.id),
+            "name": check.name,
+            "type": check.type,
+            "status": getattr(latest, 'status', None),
+            "response_time": getattr(latest, 'response_time', None),
+            "last_result_at": latest.created_at.isoformat() if latest is not None and latest.created_at else None,
+            "region": getattr(latest, 'region', None),
+            "response_times": [getattr(result, 'response_time', None) for result in results],
+        }
+
+    def _render_dashboard(self, checks, history, interval: Optional[float] = None, truncated: bool = False) -> Table:
+        """Build the dashboard table"""
+        table = Table(title="📊 Checks Dashboard", title_justify="left")
+        table.add_column("Check", style="green", max_width=30)
+        table.add_column("Type", style="blue")
+        table.add_column("Status")
+        table.add_column("Latency", justify="right", style="yellow")
+        table.add_column("Trend", no_wrap=True)
+        table.add_column("Last Result", style="dim", justify="right")
+        table.add_column("Region", style="magenta", max_width=12)
+
+        failing = 0
+        for check in checks:
+            entry = self._dashboard_entry(check, history[str(check.id)])
+            if entry["status"] is None:
+                status_display = "[dim]no data[/dim]"
+            elif entry["status"] == 'ok':
+                status_display = "[green]✅ ok[/green]"
+            else:
+                failing += 1
+                status_display = f"[red]❌ {entry['status']}[/red]"
+
+            latency = f"{entry['response_time']}ms" if entry["response_time"] is not None else "-"
+            statuses = [getattr(result, 'status', None) for result in history[str(check.id)]]
+            trend_color = "green" if all(result_status == 'ok' for result_status in statuses) else "yellow"
+            last_result = history[str(check.id)][-1].created_at if history[str(check.id)] else None
+
+            table.add_row(
+                check.name or str(check.id),
+                check.type or "-",
+                status_display,
+                latency,
+                f"[{trend_color}]{sparkline(entry['response_times'])}[/{trend_color}]",
+                _age(last_result),
+                entry["region"] or "-",
+            )
+
+        caption = f"{len(checks)} checks • {failing} failing • updated {datetime.now().strftime('%H:%M:%S')}"
+        if truncated:
+            caption += " • [yellow]history truncated: too many results since the last refresh[/yellow]"
+        if interval:
+            caption += f" • refresh every {interval:g}s • Ctrl+C to exit"
+        table.caption = caption
+        return table
+
     def get_check_result(self, result_id: str):
         """Get detailed information for a specific check result"""
         try:
@@ -950,7 +1473,7 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to get result details: {str(e)}")
             raise typer.Exit(1)
 
-    def get_check_result_detailed(self, result_id: str, verbose: bool = False):
+    def get_check_result_detailed(self, result_id: str, verbose: bool = False, pager: bool = False, ports: bool = False):
         """Get detailed information for a specific check result using result_id"""
         try:
             unified_api = self.get_unified_results_client()
@@ -964,7 +1487,9 @@ class ChecksCommand(BaseCommand):
 
             result = response.results[0]
 
-            if self.output_format in ['json', 'yaml']:
+            if ports:
+                self._output_port_records(result)
+            elif self.structured_output:
                 # Full result data for JSON/YAML
                 result_data = {
                     "id": str(result.id) if hasattr(result, 'id') else None,
@@ -977,6 +1502,10 @@ class ChecksCommand(BaseCommand):
                     "check_metadata": result.check_metadata if hasattr(result, 'check_metadata') else None
                 }
                 self.output_data(result_data)
+            elif pager:
+                # Page the detailed view; huge port scans stay scrollable
+                with self.console.pager(styles=True):
+                    self._display_detailed_result(result, verbose)
             else:
                 # Rich formatted detailed view
                 self._display_detailed_result(result, verbose)
@@ -985,6 +1514,18 @@ class ChecksCommand(BaseCommand):
             self.display_error(f"Failed to get result details: {str(e)}")
             raise typer.Exit(1)
 
+    def _output_port_records(self, result):
+        """Stream open ports of a port scan result as NDJSON"""
+        from ..formatters.portscan_formatter import PortscanFormatter
+
+        metadata = result.check_metadata if hasattr(result, 'check_metadata') else None
+        formatter = PortscanFormatter()
+        if not isinstance(metadata, dict) or not formatter.can_format(metadata):
+            self.display_error(f"Result {result.id} is not a port scan result")
+            raise typer.Exit(1)
+
+        self.output_ndjson(formatter.iter_port_records(metadata))
+
     def _display_detailed_result(self, result, verbose: bool = False):
         """Display detailed result information in a rich format"""
 
@@ -1021,20 +1562,10 @@ class ChecksCommand(BaseCommand):
 [bold red]Error Information:[/bold red]
 • Error: [red]{result.error_message}[/red]"""
 
-        # Metadata analysis - handle different check types
-        metadata_info = ""
-        if hasattr(result, 'check_metadata') and result.check_metadata:
-            metadata = result.check_metadata
-
-            if isinstance(metadata, dict):
-                metadata_info = self._format_metadata_by_type(metadata, verbose)
-
         # Combine all sections
         full_info = basic_info
         if error_info:
             full_info += error_info
-        if metadata_info:
-            full_info += metadata_info
 
         panel = Panel(
             full_info,
@@ -1045,11 +1576,20 @@ class ChecksCommand(BaseCommand):
 
         self.console.print(panel)
 
-    def _format_metadata_by_type(self, metadata, verbose: bool = False):
-        """Format metadata using the appropriate formatter"""
+        # Metadata analysis - handle different check types. Port scans and
+        # synthetic logs can be huge, so lines are printed as they are formatted.
+        if hasattr(result, 'check_metadata') and result.check_metadata:
+            metadata = result.check_metadata
+
+            if isinstance(metadata, dict):
+                for line in self._iter_metadata_lines(metadata, verbose):
+                    self.console.print(line)
+
+    def _iter_metadata_lines(self, metadata, verbose: bool = False):
+        """Yield formatted metadata line by line using the appropriate formatter"""
         from ..formatters.registry import FormatterRegistry
         registry = FormatterRegistry(verbose)
-        return registry.format_metadata(metadata)
+        return registry.iter_lines(metadata)
 
     def list_regions(self, check_type: Optional[str] = None):
         """List available regions for checks"""
@@ -1063,14 +1603,14 @@ class ChecksCommand(BaseCommand):
                 response = checks_api.v1_checks_get_regions_get()
 
             if not hasattr(response, 'regions') or not response.regions:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"regions": [], "total": 0, "message": "No regions found"})
                 else:
                     self.display_info("No regions found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 regions_data = []
                 for region in response.regions:
                     region_dict = {
@@ -1148,17 +1688,10 @@ class ChecksCommand(BaseCommand):
                 raise typer.Exit(1)
 
             try:
-                from pingera import ApiClient, Configuration
                 from pingera.api import CheckGroupsApi
+                from ..utils.client import get_api_client
 
-                # Configure the client
-                configuration = Configuration()
-                configuration.host = "https://api.pingera.ru"
-                configuration.api_key['apiKeyAuth'] = api_key
-
-                # Create API client
-                api_client = ApiClient(configuration)
-                groups_api = CheckGroupsApi(api_client)
+                groups_api = CheckGroupsApi(get_api_client(api_key))
             except ImportError:
                 self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
                 raise typer.Exit(1)
@@ -1190,11 +1723,14 @@ app = typer.Typer(name="checks", help="🔍 Manage monitoring checks", no_args_i
 @app.command("list")
 def list_checks(
     page: int = typer.Option(1, "--page", "-p", help="Page number"),
-    page_size: int = typer.Option(20, "--page-size", "-s", help="Items per page"),
+    page_size: Optional[int] = typer.Option(None, "--page-size", "-s", help="Items per page (default: 20, or sized to --limit)"),
     check_type: Optional[str] = typer.Option(None, "--type", "-t", help="Filter by check type (web, api, ssl, tcp, icmp, dns, synthetic, multistep)"),
     status: Optional[str] = typer.Option(None, "--status", help="Filter by status. Multiple statuses can be separated by commas (e.g., 'ok,failed')"),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="Filter by name using case-insensitive partial matching (max 100 chars)"),
     group_id: Optional[str] = typer.Option(None, "--group-id", "-g", help="Filter by group ID"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter expression, e.g. \"type=web and name~api\" (see docs for the syntax)"),
+    all_pages: bool = typer.Option(False, "--all", help="Go through every page from --page on (needed for --where to look past one page)"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", min=1, help="Stop after this many checks, fetching only the pages needed"),
 ):
     """List monitoring checks with advanced filtering options"""
     from ..utils.config import get_output_format
@@ -1219,7 +1755,7 @@ def list_checks(
                 raise typer.Exit(1)
 
     checks_cmd = ChecksCommand(get_output_format())
-    checks_cmd.list_checks(page, page_size, check_type, status, name, group_id)
+    checks_cmd.list_checks(page, page_size, check_type, status, name, group_id, where, all_pages, limit)
 
 
 @app.command("get")
@@ -1277,7 +1813,7 @@ def create_check(
 
 @app.command("update")
 def update_check(
-    check_id: str = typer.Argument(..., help="Check ID to update"),
+    check_ids: Optional[List[str]] = typer.Argument(None, help="Check IDs to update ('-' reads IDs from stdin)"),
     name: Optional[str] = typer.Option(None, "--name", "-n", help="New check name"),
     url: Optional[str] = typer.Option(None, "--url", "-u", help="New URL"),
     host: Optional[str] = typer.Option(None, "--host", help="New hostname/IP for TCP/SSL checks (max 255 characters)"),
@@ -1288,22 +1824,64 @@ def update_check(
     parameters: Optional[str] = typer.Option(None, "--parameters", help="JSON string with check parameters (e.g., '{\"pw_script\": \"...\", \"regions\": [\"US\", \"EU\"]}')"),
     pw_script_file: Optional[str] = typer.Option(None, "--pw-script-file", help="Path to file containing Playwright script for synthetic/multistep checks"),
     regions: Optional[str] = typer.Option(None, "--regions", help="Comma-separated list of regions (e.g., 'ru-central1,eu-west1')"),
+    check_type: Optional[str] = typer.Option(None, "--type", help="Bulk: only update checks of this type"),
+    group_id: Optional[str] = typer.Option(None, "--group-id", "-g", help="Bulk: only update checks in this group ('ungrouped' for checks without a group)"),
+    match: Optional[str] = typer.Option(None, "--match", help="Bulk: only update checks whose name matches this regular expression"),
+    confirm: bool = typer.Option(False, "--confirm", help="Bulk: skip confirmation prompt"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Bulk: maximum number of updates in flight"),
 ):
-    """Update an existing check. Use --parameters to provide complex parameters like Playwright scripts, regions, etc."""
+    """Update one or more checks. Use --parameters to provide complex parameters like Playwright scripts, regions, etc.
+
+    Several IDs, '-' (IDs from stdin) or the --type/--group-id/--match filters
+    apply the same update to every selected check concurrently, after one
+    confirmation.
+    """
     from ..utils.config import get_output_format
+
+    if not check_ids and not (check_type or group_id or match):
+        typer.echo("Error: Specify check IDs, '-' to read them from stdin, or a filter (--type, --group-id, --match)", err=True)
+        raise typer.Exit(1)
+
     checks_cmd = ChecksCommand(get_output_format())
-    checks_cmd.update_check(check_id, name, url, host, port, interval, timeout, active, parameters, pw_script_file, regions)
+    if _is_single_check(check_ids, check_type, group_id, match):
+        checks_cmd.update_check(check_ids[0], name, url, host, port, interval, timeout, active, parameters, pw_script_file, regions)
+        return
+
+    update_options = dict(name=name, url=url, host=host, port=port, interval=interval, timeout=timeout, active=active, parameters=parameters, pw_script_file=pw_script_file, regions=regions)
+    checks_cmd.bulk_update_checks(check_ids or [], update_options, check_type, group_id, match, confirm, concurrency)
 
 
 @app.command("delete")
 def delete_check(
-    check_id: str = typer.Argument(..., help="Check ID to delete"),
+    check_ids: Optional[List[str]] = typer.Argument(None, help="Check IDs to delete ('-' reads IDs from stdin)"),
+    check_type: Optional[str] = typer.Option(None, "--type", "-t", help="Delete checks of this type"),
+    group_id: Optional[str] = typer.Option(None, "--group-id", "-g", help="Delete checks in this group ('ungrouped' for checks without a group)"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Delete checks whose name matches this regular expression"),
     confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of deletions in flight"),
 ):
-    """Delete a monitoring check"""
+    """Delete one or more monitoring checks
+
+    Several IDs, '-' (IDs from stdin) or the --type/--group-id/--name filters
+    delete every selected check concurrently, after one confirmation.
+    """
     from ..utils.config import get_output_format
+
+    if not check_ids and not (check_type or group_id or name):
+        typer.echo("Error: Specify check IDs, '-' to read them from stdin, or a filter (--type, --group-id, --name)", err=True)
+        raise typer.Exit(1)
+
     checks_cmd = ChecksCommand(get_output_format())
-    checks_cmd.delete_check(check_id, confirm)
+    if _is_single_check(check_ids, check_type, group_id, name):
+        checks_cmd.delete_check(check_ids[0], confirm)
+        return
+
+    checks_cmd.bulk_delete_checks(check_ids or [], check_type, group_id, name, confirm, concurrency)
+
+
+def _is_single_check(check_ids: Optional[List[str]], *filters) -> bool:
+    """Check if a command targets exactly one check given by ID, keeping its original output"""
+    return bool(check_ids) and len(check_ids) == 1 and check_ids[0] != '-' and not any(filters)
 
 
 @app.command("results")
@@ -1312,11 +1890,16 @@ def get_results(
     from_date: Optional[str] = typer.Option(None, "--from", help="Start date (ISO 8601) - max 6 months ago"),
     to_date: Optional[str] = typer.Option(None, "--to", help="End date (ISO 8601)"),
     page: int = typer.Option(1, "--page", "-p", help="Page number"),
-    page_size: int = typer.Option(20, "--page-size", "-s", help="Items per page (1-100)"),
+    page_size: Optional[int] = typer.Option(None, "--page-size", "-s", help="Items per page, 1-100 (default: 20, or sized to --limit)"),
     status: Optional[str] = typer.Option(None, "--status", help="Filter by status (ok, failed, degraded, timeout, pending)"),
     check_type: Optional[str] = typer.Option(None, "--type", help="Filter by check type (web, api, tcp, ssl, synthetic, multistep)"),
     region: Optional[str] = typer.Option(None, "--region", help="Filter by region"),
     result_id: Optional[str] = typer.Option(None, "--result-id", "-r", help="Filter by specific result ID"),
+    all_pages: bool = typer.Option(False, "--all", help="Fetch every page from --page on (csv/tsv rows are written as each page arrives)"),
+    columns: Optional[str] = typer.Option(None, "--columns", help="Columns for csv/tsv output: comma-separated fields like check_server.region or check_metadata.ssl_grade; start with + to add to the defaults"),
+    fields: Optional[str] = typer.Option(None, "--fields", help="Only output these fields in json/yaml/csv/tsv, e.g. id,status,response_time or check_metadata.ssl_grade"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter expression, e.g. \"status!=ok and response_time>2000\" (see docs for the syntax)"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", min=1, help="Stop after this many results, fetching only the pages needed"),
 ):
     """Get check results with advanced filtering. If no check_id is provided, returns unified results across all checks. Use --result-id to fetch a specific result."""
     from ..utils.config import get_output_format
@@ -1327,18 +1910,89 @@ def get_results(
         raise typer.Exit(1)
 
     checks_cmd = ChecksCommand(get_output_format())
-    checks_cmd.get_check_results(check_id, from_date, to_date, page, page_size, status, check_type, region, result_id)
+    checks_cmd.get_check_results(check_id, from_date, to_date, page, page_size, status, check_type, region, result_id, all_pages, columns, fields, where, limit)
+
+
+@app.command("export-results")
+def export_results(
+    path: str = typer.Argument(..., help="File to write: a .tar archive, a directory, or a .parquet file"),
+    check_id: Optional[str] = typer.Option(None, "--check-id", "-c", help="Only export results of this check"),
+    from_date: Optional[str] = typer.Option(None, "--from", help="Start date (ISO 8601) - max 6 months ago"),
+    to_date: Optional[str] = typer.Option(None, "--to", help="End date (ISO 8601)"),
+    status: Optional[str] = typer.Option(None, "--status", help="Filter by status (ok, failed, degraded, timeout, pending)"),
+    check_type: Optional[str] = typer.Option(None, "--type", help="Filter by check type (web, api, tcp, ssl, synthetic, multistep)"),
+    region: Optional[str] = typer.Option(None, "--region", help="Filter by region"),
+    compression: Optional[str] = typer.Option(None, "--compression", help="Compression: gzip (archive default), zstd (Parquet default; archives need the zstandard package), snappy (Parquet only) or none"),
+    export_format: Optional[str] = typer.Option(None, "--format", "-f", help="archive (NDJSON with a manifest) or parquet (needs pyarrow); default: parquet for .parquet paths"),
+):
+    """Export check results to a compressed NDJSON archive or a Parquet file for analytics"""
+    from ..utils.config import get_output_format
+
+    # Validate check type
+    if check_type and check_type not in SUPPORTED_CHECK_TYPES:
+        typer.echo(f"Error: Invalid check type '{check_type}'. Must be one of: {', '.join(SUPPORTED_CHECK_TYPES)}", err=True)
+        raise typer.Exit(1)
+
+    checks_cmd = ChecksCommand(get_output_format())
+    checks_cmd.export_results(path, check_id, from_date, to_date, status, check_type, region, compression, export_format)
+
+
+@app.command("watch")
+def watch_results(
+    check_id: Optional[str] = typer.Argument(None, help="Check ID (optional - if not provided, follows results of all checks)"),
+    interval: float = typer.Option(10.0, "--interval", "-i", help="Seconds between polls", min=1.0),
+    lines: int = typer.Option(10, "--lines", "-n", help="Number of recent results to show first", min=0),
+    status: Optional[str] = typer.Option(None, "--status", help="Filter by status (ok, failed, degraded, timeout, pending)"),
+    check_type: Optional[str] = typer.Option(None, "--type", help="Filter by check type (web, api, tcp, ssl, synthetic, multistep)"),
+    region: Optional[str] = typer.Option(None, "--region", help="Filter by region"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Emit one JSON object per result (default with --output json/yaml)"),
+    columns: Optional[str] = typer.Option(None, "--columns", help="Columns for csv/tsv output: comma-separated fields; start with + to add to the defaults"),
+    fields: Optional[str] = typer.Option(None, "--fields", help="Only output these fields in NDJSON/csv/tsv, e.g. id,status,response_time"),
+):
+    """Follow new check results as they arrive, like tail -f"""
+    from ..utils.config import get_output_format
+
+    if check_type and check_type not in SUPPORTED_CHECK_TYPES:
+        typer.echo(f"Error: Invalid check type '{check_type}'. Must be one of: {', '.join(SUPPORTED_CHECK_TYPES)}", err=True)
+        raise typer.Exit(1)
+
+    checks_cmd = ChecksCommand(get_output_format())
+    checks_cmd.watch_results(check_id, interval, lines, status, check_type, region, ndjson, columns, fields)
+
+
+@app.command("dashboard")
+def show_dashboard(
+    check_type: Optional[str] = typer.Option(None, "--type", "-t", help="Filter by check type (web, api, ssl, tcp, icmp, dns, synthetic, multistep)"),
+    status: Optional[str] = typer.Option(None, "--status", help="Filter by status. Multiple statuses can be separated by commas (e.g., 'ok,failed')"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Filter by name using case-insensitive partial matching (max 100 chars)"),
+    group_id: Optional[str] = typer.Option(None, "--group-id", "-g", help="Filter by group ID"),
+    interval: float = typer.Option(30.0, "--interval", "-i", help="Seconds between refreshes", min=5.0),
+    history: int = typer.Option(60, "--history", help="Minutes of results to load for the trend on start", min=1),
+    max_checks: int = typer.Option(100, "--max-checks", help="Maximum number of checks to show (1-100)", min=1, max=100),
+    once: bool = typer.Option(False, "--once", help="Render the dashboard once and exit"),
+):
+    """Live status and latency trend for many checks"""
+    from ..utils.config import get_output_format
+
+    if check_type and check_type not in SUPPORTED_CHECK_TYPES:
+        typer.echo(f"Error: Invalid check type '{check_type}'. Must be one of: {', '.join(SUPPORTED_CHECK_TYPES)}", err=True)
+        raise typer.Exit(1)
+
+    checks_cmd = ChecksCommand(get_output_format())
+    checks_cmd.show_dashboard(check_type, status, name, group_id, interval, history, max_checks, once)
 
 
 @app.command("result")
 def get_result(
     result_id: str = typer.Argument(..., help="Result ID to retrieve detailed information for"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show full detailed information including network requests"),
+    pager: bool = typer.Option(False, "--pager", help="Page the detailed view through the system pager"),
+    ports: bool = typer.Option(False, "--ports", help="Stream open ports of a port scan result as NDJSON, one port per line"),
 ):
     """Get detailed information for a specific check result"""
     from ..utils.config import get_output_format
     checks_cmd = ChecksCommand(get_output_format())
-    checks_cmd.get_check_result_detailed(result_id, verbose)
+    checks_cmd.get_check_result_detailed(result_id, verbose, pager=pager, ports=ports)
 
 
 @app.command("list-regions")
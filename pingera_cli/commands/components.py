@@ -3,7 +3,7 @@
 Components commands for PingeraCLI
 """
 
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 import typer
@@ -12,6 +12,7 @@ from rich.panel import Panel
 from rich.prompt import Confirm
 
 from .base import BaseCommand
+from ..utils.bulk import DEFAULT_CONCURRENCY, MAX_CONCURRENCY
 from ..utils.config import get_api_key
 
 
@@ -32,18 +33,10 @@ class ComponentsCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import StatusPagesComponentsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            return StatusPagesComponentsApi(api_client)
+            return StatusPagesComponentsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -51,21 +44,23 @@ class ComponentsCommand(BaseCommand):
             self.display_error(f"Failed to initialize client: {str(e)}")
             raise typer.Exit(1)
 
-    def list_components(self, page_id: str):
+    def list_components(self, page_id: str, where: Optional[str] = None):
         """List components for a status page"""
+        query = self.compile_where(where)
+
         try:
             components_api = self.get_client()
-            response = components_api.v1_pages_page_id_components_get(page_id=page_id)
+            response = list(query.filter(components_api.v1_pages_page_id_components_get(page_id=page_id) or []))
 
             if not response:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"components": [], "total": 0, "message": "No components found"})
                 else:
                     self.display_info("No components found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 components_data = []
                 for component in response:
                     component_dict = {
@@ -129,7 +124,7 @@ class ComponentsCommand(BaseCommand):
             )
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 component_data = {
                     "id": str(component.id) if hasattr(component, 'id') and component.id else None,
                     "name": component.name if hasattr(component, 'name') and component.name else None,
@@ -314,6 +309,42 @@ class ComponentsCommand(BaseCommand):
             self.display_error(f"Failed to delete component: {str(e)}")
             raise typer.Exit(1)
 
+    def bulk_delete_components(self, page_id: str, component_ids: List[str], name_pattern: Optional[str] = None, confirm: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+        """Delete many components of a status page, selected by ID and/or a name regex, concurrently"""
+        from ..utils.bulk import compile_name_pattern, read_ids
+
+        try:
+            ids, stdin_used = read_ids(component_ids)
+            pattern = compile_name_pattern(name_pattern)
+            components_api = self.get_client()
+
+            if pattern:
+                wanted = set(ids)
+                targets = [
+                    (str(component.id), component.name or str(component.id))
+                    for component in (components_api.v1_pages_page_id_components_get(page_id=page_id) or [])
+                    if (not wanted or str(component.id) in wanted) and pattern.search(component.name or '')
+                ]
+            else:
+                targets = [(component_id, component_id) for component_id in ids]
+
+            succeeded = self.run_bulk_operation(
+                'delete', 'components', targets,
+                lambda component_id: components_api.v1_pages_page_id_components_component_id_delete(page_id=page_id, component_id=component_id),
+                confirm=confirm, concurrency=concurrency, stdin_used=stdin_used,
+            )
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to delete components: {str(e)}")
+            raise typer.Exit(1)
+
+        if not succeeded:
+            raise typer.Exit(1)
+
     def get_component_uptime(self, page_id: str, component_id: str, start: Optional[str] = None, end: Optional[str] = None):
         """Get uptime data for a specific component"""
         try:
@@ -341,7 +372,7 @@ class ComponentsCommand(BaseCommand):
                 raise typer.Exit(1)
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 uptime_dict = {
                     "component_id": component_id,
                     "page_id": page_id,
@@ -439,11 +470,12 @@ app = typer.Typer(name="components", help="🔧 Manage status page components",
 @app.command("list")
 def list_components(
     page_id: str = typer.Option(..., "--page-id", "-p", help="Status page ID"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter expression, e.g. \"status!=operational\" (see docs for the syntax)"),
 ):
     """List components for a status page"""
     from ..utils.config import get_output_format
     components_cmd = ComponentsCommand(get_output_format())
-    components_cmd.list_components(page_id)
+    components_cmd.list_components(page_id, where)
 
 
 @app.command("get")
@@ -515,14 +547,25 @@ def update_component(
 
 @app.command("delete")
 def delete_component(
-    component_id: str = typer.Argument(..., help="Component ID to delete"),
+    component_ids: Optional[List[str]] = typer.Argument(None, help="Component IDs to delete ('-' reads IDs from stdin)"),
     page_id: str = typer.Option(..., "--page-id", "-p", help="Status page ID"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Delete components whose name matches this regular expression"),
     confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of deletions in flight"),
 ):
-    """Delete a component"""
+    """Delete one or more components"""
     from ..utils.config import get_output_format
+
+    if not component_ids and not name:
+        typer.echo("Error: Specify component IDs, '-' to read them from stdin, or --name", err=True)
+        raise typer.Exit(1)
+
     components_cmd = ComponentsCommand(get_output_format())
-    components_cmd.delete_component(page_id, component_id, confirm)
+    if len(component_ids or []) == 1 and component_ids[0] != '-' and not name:
+        components_cmd.delete_component(page_id, component_ids[0], confirm)
+        return
+
+    components_cmd.bulk_delete_components(page_id, component_ids or [], name, confirm, concurrency)
 
 
 @app.command("uptime")
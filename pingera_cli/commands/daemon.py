@@ -0,0 +1,142 @@
+"""
+Daemon commands for PingeraCLI
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from .base import BaseCommand
+from ..utils.config import get_output_format
+
+
+class DaemonCommand(BaseCommand):
+    """
+    Commands for managing the persistent pngr daemon
+    """
+
+    def __init__(self, output_format: Optional[str] = None):
+        super().__init__(output_format)
+
+    def _socket_path(self, socket_path: Optional[str]) -> Path:
+        """Resolve the socket path from the option or the default location"""
+        from ..launcher import get_socket_path
+        return Path(socket_path) if socket_path else get_socket_path()
+
+    def start(self, socket_path: Optional[str] = None, foreground: bool = False):
+        """Start the daemon in the background or in the foreground"""
+        from ..utils.daemon import PngrDaemon, request_control, wait_for_daemon
+
+        path = self._socket_path(socket_path)
+        status = request_control('status', path)
+        if status:
+            self.display_warning(f"Daemon is already running (PID {status.get('pid')}) on {path}")
+            return
+
+        if foreground:
+            self.display_info(f"Daemon listening on {path}. Press Ctrl+C to stop.")
+            try:
+                PngrDaemon(path).serve_forever()
+            except KeyboardInterrupt:
+                self.console.print("\n[yellow]⚠ Daemon stopped[/yellow]")
+            return
+
+        try:
+            subprocess.Popen(
+                [sys.executable, '-m', 'pingera_cli.main', 'daemon', 'start', '--foreground', '--socket', str(path)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                env={**os.environ, 'PNGR_NO_DAEMON': '1'},
+            )
+        except Exception as e:
+            self.display_error(f"Failed to start daemon: {str(e)}")
+            raise typer.Exit(1)
+
+        if not wait_for_daemon(path):
+            self.display_error(f"Daemon did not start listening on {path}")
+            raise typer.Exit(1)
+
+        self.display_success(
+            f"Daemon started on [white]{path}[/white]\n\n"
+            f"[dim]Non-interactive pngr invocations are now served by the daemon.\n"
+            f"Set PNGR_NO_DAEMON=1 to bypass it.[/dim]",
+            title="🚀 Daemon Started"
+        )
+
+    def stop(self, socket_path: Optional[str] = None):
+        """Stop a running daemon"""
+        from ..utils.daemon import request_control
+
+        path = self._socket_path(socket_path)
+        reply = request_control('stop', path)
+        if not reply:
+            self.display_warning(f"No daemon is running on {path}")
+            return
+
+        self.display_success(f"Daemon (PID {reply.get('pid')}) stopped")
+
+    def status(self, socket_path: Optional[str] = None):
+        """Show the state of the daemon"""
+        from ..utils.daemon import request_control
+
+        path = self._socket_path(socket_path)
+        status = request_control('status', path)
+
+        if self.structured_output:
+            self.output_data(status or {'running': False, 'socket': str(path)})
+            return
+
+        if not status:
+            self.display_info(f"No daemon is running on {path}")
+            return
+
+        self.display_info(
+            f"• PID: [white]{status.get('pid')}[/white]\n"
+            f"• Socket: [white]{status.get('socket')}[/white]\n"
+            f"• Uptime: [white]{status.get('uptime_seconds')}s[/white]\n"
+            f"• Requests Served: [white]{status.get('requests_served')}[/white]\n"
+            f"• Pooled Clients: [white]{status.get('pooled_clients')}[/white]",
+            title="🟢 Daemon Running"
+        )
+
+
+# Create Typer app for daemon commands
+app = typer.Typer(
+    name="daemon",
+    help="🔥 Keep a warm pngr process to speed up repeated invocations",
+    no_args_is_help=True,
+)
+
+
+@app.command("start")
+def start_daemon(
+    socket_path: Optional[str] = typer.Option(None, "--socket", help="Unix socket path (default: daemon.sock in the config directory)"),
+    foreground: bool = typer.Option(False, "--foreground", help="Run in the foreground instead of detaching"),
+):
+    """Start the pngr daemon"""
+    daemon_cmd = DaemonCommand(get_output_format())
+    daemon_cmd.start(socket_path, foreground)
+
+
+@app.command("stop")
+def stop_daemon(
+    socket_path: Optional[str] = typer.Option(None, "--socket", help="Unix socket path (default: daemon.sock in the config directory)"),
+):
+    """Stop the pngr daemon"""
+    daemon_cmd = DaemonCommand(get_output_format())
+    daemon_cmd.stop(socket_path)
+
+
+@app.command("status")
+def daemon_status(
+    socket_path: Optional[str] = typer.Option(None, "--socket", help="Unix socket path (default: daemon.sock in the config directory)"),
+):
+    """Show whether the pngr daemon is running"""
+    daemon_cmd = DaemonCommand(get_output_format())
+    daemon_cmd.status(socket_path)
@@ -29,18 +29,10 @@ class ExecutionGroupsCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import ExecutionGroupsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            return ExecutionGroupsApi(api_client)
+            return ExecutionGroupsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -61,14 +53,14 @@ class ExecutionGroupsCommand(BaseCommand):
             )
 
             if not hasattr(response, 'execution_groups') or not response.execution_groups:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"execution_groups": [], "total": 0, "message": "No execution groups found"})
                 else:
                     self.display_info("No execution groups found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 groups_data = []
                 for group in response.execution_groups:
                     # Calculate region counts from requested_regions and regional_summary
@@ -179,7 +171,7 @@ class ExecutionGroupsCommand(BaseCommand):
             groups_api = self.get_client()
             group = groups_api.v1_execution_groups_group_id_get(group_id=group_id)
 
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 # Calculate region counts from requested_regions and regional_summary
                 total_regions = len(group.requested_regions) if hasattr(group, 'requested_regions') and group.requested_regions else 0
                 successful_regions = 0
@@ -294,13 +286,13 @@ class ExecutionGroupsCommand(BaseCommand):
             response = groups_api.v1_execution_groups_group_id_regional_results_get(group_id=group_id)
 
             if not hasattr(response, 'regional_results') or not response.regional_results:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"regional_results": [], "total": 0, "message": "No regional results found"})
                 else:
                     self.display_info("No regional results found.")
                 return
 
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 results_data = []
                 for result in response.regional_results:
                     result_dict = {
@@ -15,6 +15,28 @@ from .base import BaseCommand
 from ..utils.config import get_api_key
 
 
+# --where fields the incidents API filters on itself, and their query parameters
+INCIDENT_PUSHDOWN = {"component": "component_id", "component_id": "component_id"}
+
+
+def _component_ids(incident) -> list:
+    """IDs of the components an incident affects"""
+    ids = []
+    for component in getattr(incident, 'components', None) or []:
+        component_id = component.get('id') if isinstance(component, dict) else getattr(component, 'id', None)
+        if component_id is not None:
+            ids.append(str(component_id))
+    return ids
+
+
+# --where fields computed from the incident; terms the API cannot take are
+# evaluated against the affected components' IDs
+INCIDENT_WHERE_FIELDS = {"component": _component_ids, "component_id": _component_ids}
+
+# Incidents that are still open
+UNRESOLVED_WHERE = "status!=null and status!=resolved"
+
+
 class IncidentsCommand(BaseCommand):
     """
     Commands for managing status page incidents
@@ -32,18 +54,10 @@ class IncidentsCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import StatusPagesIncidentsApi
-            from ..utils.config import get_config
-
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
+            from ..utils.client import get_api_client
 
-            # Create API client
-            api_client = ApiClient(configuration)
-            return StatusPagesIncidentsApi(api_client)
+            return StatusPagesIncidentsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -57,41 +71,65 @@ class IncidentsCommand(BaseCommand):
         component_id: Optional[str] = None,
         unresolved: bool = False,
         maintenance: bool = False,
+        where: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
     ):
-        """List incidents for a status page with optional filters"""
+        """
+        List incidents for a status page with optional filters
+
+        The filters are compiled into one --where predicate applied in a single
+        pass; a top-level `component=<id>` term is sent to the API instead.
+
+        Raises:
+            typer.Exit: If the filters are invalid or --component-id contradicts them
+        """
+        from ..utils.where import compile_where
+
+        conditions = [f"({where})"] if where else []
+        if unresolved:
+            conditions.append(UNRESOLVED_WHERE)
+        if maintenance:
+            conditions.append("scheduled_for!=null")
+        if since:
+            conditions.append(f"created_at>='{since}'")
+        if until:
+            conditions.append(f"created_at<'{until}'")
+
+        try:
+            query = compile_where(" and ".join(conditions), INCIDENT_PUSHDOWN, fields=INCIDENT_WHERE_FIELDS)
+        except ValueError as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+
+        pushed_component = query.params.get('component_id')
+        if component_id and pushed_component and pushed_component != component_id:
+            self.display_error(f"--component-id {component_id} contradicts component={pushed_component} in --where")
+            raise typer.Exit(1)
+
         try:
             incidents_api = self.get_client()
             
             # Build parameters
-            params = {}
+            params = dict(query.params)
             if component_id:
                 params['component_id'] = component_id
             
             response = incidents_api.v1_pages_page_id_incidents_get(page_id=page_id, **params)
             
-            # Apply client-side filters
-            if response and (unresolved or maintenance):
-                filtered_incidents = []
-                for incident in response:
-                    if unresolved:
-                        # Filter for unresolved incidents (not resolved)
-                        if hasattr(incident, 'status') and incident.status and incident.status != 'resolved':
-                            filtered_incidents.append(incident)
-                    elif maintenance:
-                        # Filter for scheduled maintenance
-                        if hasattr(incident, 'scheduled_for') and incident.scheduled_for:
-                            filtered_incidents.append(incident)
-                response = filtered_incidents
+            # Apply the rest of the filters on the client
+            if response and query.is_local:
+                response = list(query.filter(response))
 
             if not response:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"incidents": [], "total": 0, "message": "No incidents found"})
                 else:
                     self.display_info("No incidents found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 incidents_data = []
                 for incident in response:
                     incident_dict = {
@@ -151,7 +189,7 @@ class IncidentsCommand(BaseCommand):
             )
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 # Parse incident_updates
                 incident_updates_data = []
                 if hasattr(incident, 'incident_updates') and incident.incident_updates:
@@ -450,11 +488,14 @@ def list_incidents(
     component_id: Optional[str] = typer.Option(None, "--component-id", "-c", help="Filter by component ID"),
     unresolved: bool = typer.Option(False, "--unresolved", "-u", help="Show only unresolved incidents"),
     maintenance: bool = typer.Option(False, "--maintenance", "-m", help="Show only scheduled maintenance"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter expression, e.g. \"status!=resolved and impact=major\" (fields: status, impact, name, created_at, resolved_at, scheduled_for, component, ...)"),
+    since: Optional[str] = typer.Option(None, "--since", help="Only incidents created at or after this date (ISO 8601) or age (e.g. 7d, 12h)"),
+    until: Optional[str] = typer.Option(None, "--until", help="Only incidents created before this date (ISO 8601) or age"),
 ):
     """List incidents for a status page"""
     from ..utils.config import get_output_format
     incidents_cmd = IncidentsCommand(get_output_format())
-    incidents_cmd.list_incidents(page_id, component_id, unresolved, maintenance)
+    incidents_cmd.list_incidents(page_id, component_id, unresolved, maintenance, where, since, until)
 
 
 @app.command("get")
@@ -560,19 +601,21 @@ def delete_incident(
 def list_unresolved_incidents(
     page_id: str = typer.Option(..., "--page-id", "-p", help="Status page ID"),
     component_id: Optional[str] = typer.Option(None, "--component-id", "-c", help="Filter by component ID"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Additional filter expression, e.g. \"impact=major\""),
 ):
     """List unresolved incidents (not resolved)"""
     from ..utils.config import get_output_format
     incidents_cmd = IncidentsCommand(get_output_format())
-    incidents_cmd.list_incidents(page_id, component_id, unresolved=True)
+    incidents_cmd.list_incidents(page_id, component_id, unresolved=True, where=where)
 
 
 @app.command("maintenance")
 def list_maintenance_windows(
     page_id: str = typer.Option(..., "--page-id", "-p", help="Status page ID"),
     component_id: Optional[str] = typer.Option(None, "--component-id", "-c", help="Filter by component ID"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Additional filter expression, e.g. \"scheduled_for>=2025-06-01\""),
 ):
     """List scheduled maintenance windows"""
     from ..utils.config import get_output_format
     incidents_cmd = IncidentsCommand(get_output_format())
-    incidents_cmd.list_incidents(page_id, component_id, maintenance=True)
+    incidents_cmd.list_incidents(page_id, component_id, maintenance=True, where=where)
@@ -4,27 +4,50 @@ On-demand checks commands for PingeraCLI
 """
 
 import os
+from datetime import datetime, timezone
 from typing import Optional
 
 import typer
 from rich.table import Table
 from rich.panel import Panel
 
-from .base import BaseCommand
+from .base import MAX_PAGE_SIZE, BaseCommand
 from ..utils.config import get_api_key
+from ..utils.trace import annotate, span
 
 # Supported check types for on-demand execution
 SUPPORTED_CHECK_TYPES = ["web", "api", "tcp", "ssl", "dns", "icmp", "portscan", "synthetic", "multistep"]
 
+# --where fields on jobs that the API filters on itself
+JOB_WHERE_PUSHDOWN = {"status": "status"}
+
+# Name of the --since-last cursor of checks jobs list
+JOBS_CURSOR = "checks.jobs"
+
+# Waiting for a job: overall limit and status poll interval, in seconds
+JOB_WAIT_TIMEOUT = 300
+JOB_POLL_INTERVAL = 2.0
+
+# Waiting for the regional results of a multi-region job: overall limit, and
+# the delay between status polls, growing from the first to the last value
+REGIONS_WAIT_TIMEOUT = 30.0
+REGIONS_POLL_DELAY = 0.25
+REGIONS_POLL_MAX_DELAY = 2.0
+
+# Narrowest region panel of --details; as many as fit are shown side by side
+DETAILS_MIN_WIDTH = 48
+
 
 class OnDemandChecksCommand(BaseCommand):
     """
     Commands for managing on-demand monitoring checks
     """
     
-    def __init__(self, output_format: Optional[str] = None, verbose: bool = False):
+    def __init__(self, output_format: Optional[str] = None, verbose: bool = False, details: bool = False):
         super().__init__(output_format)
         self.verbose = verbose
+        # Fetch and show every region's full result for multi-region jobs
+        self.details = details
     
     def _parse_check_file(self, file_path: str) -> dict:
         """Parse check configuration from JSON or YAML file (local or URL)"""
@@ -48,18 +71,10 @@ class OnDemandChecksCommand(BaseCommand):
             raise typer.Exit(1)
         
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import OnDemandChecksApi
-            from ..utils.config import get_config
-            
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-            
-            # Create API client
-            api_client = ApiClient(configuration)
-            return OnDemandChecksApi(api_client)
+            from ..utils.client import get_api_client
+
+            return OnDemandChecksApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -245,6 +260,7 @@ class OnDemandChecksCommand(BaseCommand):
             # Execute the check
             response = checks_api.v1_checks_execute_post(check_request)
             job_id = response.job_id
+            annotate(job_id=job_id, check_type=check_data.get("type", check_type))
             
             # Build success message - use the actual type from check_data
             actual_check_type = check_data.get("type", check_type)
@@ -262,7 +278,7 @@ class OnDemandChecksCommand(BaseCommand):
                 # Wait for the job to complete and show the result
                 self._wait_and_show_result(job_id, success_details)
             else:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     actual_check_type = check_data.get("type", check_type)
                     actual_name = check_data.get("name", name)
                     self.output_data({
@@ -292,13 +308,14 @@ class OnDemandChecksCommand(BaseCommand):
             # Execute existing check
             response = checks_api.v1_checks_check_id_execute_post(check_id=check_id)
             job_id = response.job_id
+            annotate(job_id=job_id, check_id=check_id)
             
             if wait_for_result:
                 # Wait for the job to complete and show the result
                 success_details = [f"Job ID: {job_id}", f"Check ID: {check_id}"]
                 self._wait_and_show_result(job_id, success_details)
             else:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({
                         "job_id": job_id,
                         "check_id": check_id,
@@ -315,151 +332,221 @@ class OnDemandChecksCommand(BaseCommand):
             raise typer.Exit(1)
 
 
-    def list_jobs(self, page: int = 1, page_size: int = 20):
-        """List check jobs"""
+    def list_jobs(self, page: int = 1, page_size: Optional[int] = None, where: Optional[str] = None, all_pages: bool = False, limit: Optional[int] = None, since_last: bool = False):
+        """
+        List check jobs
+
+        With `since_last`, only jobs created since the previous --since-last
+        run for this account are listed, and the stored cursor moves past
+        them once they have been output.
+        """
+        if since_last and (limit or page != 1):
+            self.display_error("--since-last cannot be combined with --limit or --page")
+            raise typer.Exit(1)
+
+        # Jobs the filter leaves out still count as seen, so it is all applied locally
+        query = self.compile_where(where, None if since_last else JOB_WHERE_PUSHDOWN)
+        page_size = (page_size or MAX_PAGE_SIZE) if since_last else self.page_size_for(page_size, page, limit, query)
+
         try:
             checks_api = self.get_client()
-            
-            # List check jobs
-            response = checks_api.v1_checks_jobs_get(
-                page=page,
-                per_page=page_size
-            )
-            
-            if not hasattr(response, 'jobs') or not response.jobs:
-                if self.output_format in ['json', 'yaml']:
-                    self.output_data({"jobs": [], "total": 0, "message": "No jobs found"})
-                else:
-                    self.display_info("No jobs found.")
+
+            def fetch_page(number):
+                return checks_api.v1_checks_jobs_get(page=number, per_page=page_size, **query.params)
+
+            if since_last:
+                from types import SimpleNamespace
+                from ..utils.cursor import load_cursor, save_cursor
+
+                cursor = load_cursor(JOBS_CURSOR)
+                jobs = self._jobs_since(fetch_page, page_size, cursor)
+                self._output_jobs(SimpleNamespace(jobs=list(query.filter(jobs)), pagination=None), page, page_size)
+                if jobs:
+                    save_cursor(JOBS_CURSOR, self._jobs_cursor(jobs, cursor))
                 return
-            
-            if self.output_format in ['json', 'yaml']:
-                jobs_data = []
-                for job in response.jobs:
-                    # Extract name and type from check_parameters
-                    name = None
-                    check_type = None
-                    host = None
-                    url = None
-                    
-                    if hasattr(job, 'check_parameters') and job.check_parameters:
-                        params = job.check_parameters
-                        name = params.get('name')
-                        check_type = params.get('type')
-                        host = params.get('host')
-                        # For web checks, construct URL from host/url
-                        if check_type == 'web' and 'url' in params:
-                            url = params['url']
-                        elif host:
-                            url = host
-                    
-                    job_dict = {
-                        "job_id": str(job.id) if job.id else None,
-                        "name": name,
-                        "type": check_type,
-                        "url": url,
-                        "host": host,
-                        "status": job.status if hasattr(job, 'status') else None,
-                        "job_type": job.job_type if hasattr(job, 'job_type') else None,
-                        "check_id": job.check_id if hasattr(job, 'check_id') else None,
-                        "created_at": job.created_at.isoformat() if hasattr(job, 'created_at') and job.created_at else None,
-                        "started_at": job.started_at.isoformat() if hasattr(job, 'started_at') and job.started_at else None,
-                        "completed_at": job.completed_at.isoformat() if hasattr(job, 'completed_at') and job.completed_at else None,
-                        "error_message": job.error_message if hasattr(job, 'error_message') else None
-                    }
-                    jobs_data.append(job_dict)
+
+            # List check jobs
+            response = self.fetch_listing(fetch_page, 'jobs', page, page_size, query, all_pages, limit)
+            self._output_jobs(response, page, page_size)
+
+        except Exception as e:
+            self.display_error(f"Failed to list jobs: {str(e)}")
+            raise typer.Exit(1)
+
+    @staticmethod
+    def _job_created_at(job) -> Optional[datetime]:
+        created_at = getattr(job, 'created_at', None)
+        if isinstance(created_at, datetime) and created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at if isinstance(created_at, datetime) else None
+
+    def _jobs_since(self, fetch_page, page_size: int, cursor: Optional[dict]) -> list:
+        """
+        Fetch the jobs created after a cursor
+
+        Jobs are listed newest first, so paging stops at the first page that
+        reaches back to the cursor. Jobs created at the cursor's own timestamp
+        are told apart by ID. Without a cursor, every job is fetched.
+        """
+        since = datetime.fromisoformat(cursor['created_at']) if cursor and cursor.get('created_at') else None
+        seen = set(cursor.get('ids') or []) if cursor else set()
+
+        jobs = []
+        for items in self.iter_pages(fetch_page, 'jobs', 1, page_size):
+            reached = False
+            for job in items:
+                created_at = self._job_created_at(job)
+                if since is not None and created_at is not None and (created_at < since or (created_at == since and str(job.id) in seen)):
+                    reached = True
+                    continue
+                jobs.append(job)
+            if reached:
+                break
+        return jobs
+
+    def _jobs_cursor(self, jobs: list, previous: Optional[dict]) -> dict:
+        """Cursor just past the newest of the given jobs"""
+        newest = max((created_at for created_at in map(self._job_created_at, jobs) if created_at), default=None)
+        if newest is None:
+            return previous or {}
+        ids = [str(job.id) for job in jobs if self._job_created_at(job) == newest]
+        if previous and previous.get('created_at') and datetime.fromisoformat(previous['created_at']) == newest:
+            ids = list(dict.fromkeys((previous.get('ids') or []) + ids))
+        return {'created_at': newest.isoformat(), 'ids': ids, 'updated_at': datetime.now(timezone.utc).isoformat()}
+
+    def _output_jobs(self, response, page: int, page_size: int):
+        """Render a listing of check jobs"""
+        if not hasattr(response, 'jobs') or not response.jobs:
+            if self.structured_output:
+                self.output_data({"jobs": [], "total": 0, "message": "No jobs found"})
+            else:
+                self.display_info("No jobs found.")
+            return
+        
+        if self.structured_output:
+            jobs_data = []
+            for job in response.jobs:
+                # Extract name and type from check_parameters
+                name = None
+                check_type = None
+                host = None
+                url = None
                 
-                # Include pagination info from response
-                pagination_info = {}
-                if hasattr(response, 'pagination') and response.pagination:
-                    pagination_info = {
-                        "page": response.pagination.get('page', page),
-                        "per_page": response.pagination.get('per_page', page_size),
-                        "total": response.pagination.get('total', len(jobs_data)),
-                        "pages": response.pagination.get('pages', 1),
-                        "has_next": response.pagination.get('has_next', False),
-                        "has_prev": response.pagination.get('has_prev', False)
-                    }
+                if hasattr(job, 'check_parameters') and job.check_parameters:
+                    params = job.check_parameters
+                    name = params.get('name')
+                    check_type = params.get('type')
+                    host = params.get('host')
+                    # For web checks, construct URL from host/url
+                    if check_type == 'web' and 'url' in params:
+                        url = params['url']
+                    elif host:
+                        url = host
                 
-                self.output_data({
-                    "jobs": jobs_data,
-                    "pagination": pagination_info if pagination_info else {"page": page, "per_page": page_size, "total": len(jobs_data)}
-                })
-            else:
-                table = Table(title="Check Jobs")
-                table.add_column("Job ID", style="cyan")
-                table.add_column("Name", style="green")
-                table.add_column("Type", style="blue")
-                table.add_column("Target", style="yellow")
-                table.add_column("Status", style="magenta")
-                table.add_column("Job Type", style="dim")
-                table.add_column("Created", style="dim")
+                job_dict = {
+                    "job_id": str(job.id) if job.id else None,
+                    "name": name,
+                    "type": check_type,
+                    "url": url,
+                    "host": host,
+                    "status": job.status if hasattr(job, 'status') else None,
+                    "job_type": job.job_type if hasattr(job, 'job_type') else None,
+                    "check_id": job.check_id if hasattr(job, 'check_id') else None,
+                    "created_at": job.created_at.isoformat() if hasattr(job, 'created_at') and job.created_at else None,
+                    "started_at": job.started_at.isoformat() if hasattr(job, 'started_at') and job.started_at else None,
+                    "completed_at": job.completed_at.isoformat() if hasattr(job, 'completed_at') and job.completed_at else None,
+                    "error_message": job.error_message if hasattr(job, 'error_message') else None
+                }
+                jobs_data.append(job_dict)
+            
+            # Include pagination info from response
+            pagination_info = {}
+            if hasattr(response, 'pagination') and response.pagination:
+                pagination_info = {
+                    "page": response.pagination.get('page', page),
+                    "per_page": response.pagination.get('per_page', page_size),
+                    "total": response.pagination.get('total', len(jobs_data)),
+                    "pages": response.pagination.get('pages', 1),
+                    "has_next": response.pagination.get('has_next', False),
+                    "has_prev": response.pagination.get('has_prev', False)
+                }
+            
+            self.output_data({
+                "jobs": jobs_data,
+                "pagination": pagination_info if pagination_info else {"page": page, "per_page": page_size, "total": len(jobs_data)}
+            })
+        else:
+            table = Table(title="Check Jobs")
+            table.add_column("Job ID", style="cyan")
+            table.add_column("Name", style="green")
+            table.add_column("Type", style="blue")
+            table.add_column("Target", style="yellow")
+            table.add_column("Status", style="magenta")
+            table.add_column("Job Type", style="dim")
+            table.add_column("Created", style="dim")
+            
+            for job in response.jobs:
+                # Extract details from check_parameters
+                name = "Unknown"
+                check_type = "Unknown"
+                target = "Unknown"
                 
-                for job in response.jobs:
-                    # Extract details from check_parameters
-                    name = "Unknown"
-                    check_type = "Unknown"
-                    target = "Unknown"
-                    
-                    if hasattr(job, 'check_parameters') and job.check_parameters:
-                        params = job.check_parameters
-                        name = params.get('name', 'Unknown')
-                        check_type = params.get('type', 'Unknown')
-                        
-                        # Determine target based on check type
-                        if check_type == 'web' and 'url' in params:
-                            target = params['url']
-                        elif 'host' in params:
-                            port = params.get('port')
-                            target = f"{params['host']}" + (f":{port}" if port else "")
-                        else:
-                            target = params.get('url', params.get('host', 'Unknown'))
-                    
-                    # Status with color coding
-                    status_color = "green" if hasattr(job, 'status') and job.status == 'completed' else "yellow" if hasattr(job, 'status') and job.status in ['running', 'pending'] else "red"
-                    status_display = f"[{status_color}]{job.status}[/{status_color}]" if hasattr(job, 'status') and job.status else "-"
+                if hasattr(job, 'check_parameters') and job.check_parameters:
+                    params = job.check_parameters
+                    name = params.get('name', 'Unknown')
+                    check_type = params.get('type', 'Unknown')
                     
-                    table.add_row(
-                        str(job.id) if job.id else "-",
-                        name,
-                        check_type,
-                        target,
-                        status_display,
-                        job.job_type if hasattr(job, 'job_type') and job.job_type else "-",
-                        job.created_at.strftime("%Y-%m-%d %H:%M") if hasattr(job, 'created_at') and job.created_at else "Unknown"
-                    )
+                    # Determine target based on check type
+                    if check_type == 'web' and 'url' in params:
+                        target = params['url']
+                    elif 'host' in params:
+                        port = params.get('port')
+                        target = f"{params['host']}" + (f":{port}" if port else "")
+                    else:
+                        target = params.get('url', params.get('host', 'Unknown'))
                 
-                self.console.print(table)
+                # Status with color coding
+                status_color = "green" if hasattr(job, 'status') and job.status == 'completed' else "yellow" if hasattr(job, 'status') and job.status in ['running', 'pending'] else "red"
+                status_display = f"[{status_color}]{job.status}[/{status_color}]" if hasattr(job, 'status') and job.status else "-"
                 
-                # Show pagination info
-                if hasattr(response, 'pagination') and response.pagination:
-                    pagination = response.pagination
-                    total_items = pagination.get('total', len(response.jobs))
-                    total_pages = pagination.get('pages', 1)
-                    current_page = pagination.get('page', page)
-                    per_page = pagination.get('per_page', page_size)
-                    
-                    self.console.print(f"\n[dim]Showing {len(response.jobs)} jobs • Page {current_page} of {total_pages} • {total_items} total items • {per_page} per page[/dim]")
-                else:
-                    self.console.print(f"\n[dim]Found {len(response.jobs)} jobs[/dim]")
+                table.add_row(
+                    str(job.id) if job.id else "-",
+                    name,
+                    check_type,
+                    target,
+                    status_display,
+                    job.job_type if hasattr(job, 'job_type') and job.job_type else "-",
+                    job.created_at.strftime("%Y-%m-%d %H:%M") if hasattr(job, 'created_at') and job.created_at else "Unknown"
+                )
+            
+            self.console.print(table)
+            
+            # Show pagination info
+            if hasattr(response, 'pagination') and response.pagination:
+                pagination = response.pagination
+                total_items = pagination.get('total', len(response.jobs))
+                total_pages = pagination.get('pages', 1)
+                current_page = pagination.get('page', page)
+                per_page = pagination.get('per_page', page_size)
                 
-                # Add helpful tip about getting job details
-                self.console.print(f"\n[dim]💡 For detailed job information, use: [white]pngr checks jobs status <job_id>[/white][/dim]")
-                self.console.print(f"[dim]💡 For detailed result information, use: [white]pngr checks results --result-id <result_id>[/white][/dim]")
+                self.console.print(f"\n[dim]Showing {len(response.jobs)} jobs • Page {current_page} of {total_pages} • {total_items} total items • {per_page} per page[/dim]")
+            else:
+                self.console.print(f"\n[dim]Found {len(response.jobs)} jobs[/dim]")
             
-        except Exception as e:
-            self.display_error(f"Failed to list jobs: {str(e)}")
-            raise typer.Exit(1)
+            # Add helpful tip about getting job details
+            self.console.print(f"\n[dim]💡 For detailed job information, use: [white]pngr checks jobs status <job_id>[/white][/dim]")
+            self.console.print(f"[dim]💡 For detailed result information, use: [white]pngr checks results --result-id <result_id>[/white][/dim]")
 
     def get_job_status(self, job_id: str):
         """Get job status"""
         try:
+            annotate(job_id=job_id)
             checks_api = self.get_client()
             
             # Get job status
             job_status = checks_api.v1_checks_jobs_job_id_get(job_id=job_id)
             
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 # Include full job data for JSON/YAML output
                 job_data = {
                     "job_id": job_id,
@@ -473,6 +560,10 @@ class OnDemandChecksCommand(BaseCommand):
                     "check_parameters": job_status.check_parameters if hasattr(job_status, 'check_parameters') else None,
                     "result": job_status.result if hasattr(job_status, 'result') else None
                 }
+                result = job_data["result"]
+                if self.details and isinstance(result, dict) and result.get('regional_summary'):
+                    result_ids = [region['result_id'] for region in result['regional_summary'] if region.get('result_id')]
+                    job_data["regional_results"] = self._regional_result_records(result_ids, self._fetch_regional_results(result_ids))
                 self.output_data(job_data)
             else:
                 # Rich formatted detailed view - fetch and display with results
@@ -484,8 +575,6 @@ class OnDemandChecksCommand(BaseCommand):
 
     def _fetch_and_display_job_result(self, job_id: str, job_status, verbose: bool = False):
         """Fetch detailed results from the new results endpoint and display them"""
-        import time
-        
         try:
             # Extract result_id(s) from job response
             result_ids = []
@@ -495,7 +584,7 @@ class OnDemandChecksCommand(BaseCommand):
                 result = job_status.result
                 
                 # Debug: Print the raw result to see what we're getting (only in verbose mode)
-                if verbose and self.output_format not in ['json', 'yaml']:
+                if verbose and not self.structured_output:
                     import json
                     self.console.print(f"[dim]DEBUG: Raw result from job status:[/dim]")
                     self.console.print(f"[dim]{json.dumps(result, indent=2, default=str)}[/dim]")
@@ -503,46 +592,14 @@ class OnDemandChecksCommand(BaseCommand):
                 # Check if this is a multi-region result
                 if isinstance(result, dict):
                     if 'regional_summary' in result and result['regional_summary']:
-                        # Multi-region execution
+                        # Multi-region execution; the last regions can land a moment after the job is done
                         is_multi_region = True
-                        regional_summary = result['regional_summary']
+                        job_status = self._wait_for_regions(job_id, job_status, verbose=verbose)
+                        regional_summary, _, _ = self._regional_progress(job_status)
+                        result_ids = [regional_result['result_id'] for regional_result in regional_summary]
                         
-                        # Debug: Show what we found (only in verbose mode)
-                        if verbose and self.output_format not in ['json', 'yaml']:
-                            self.console.print(f"[dim]DEBUG: Found {len(regional_summary)} regions in regional_summary[/dim]")
-                        
-                        for regional_result in regional_summary:
-                            if 'result_id' in regional_result:
-                                result_ids.append(regional_result['result_id'])
-                        
-                        # Check if we might be missing results (race condition detection)
-                        total_regions = result.get('total_regions', len(regional_summary))
-                        completed_regions = result.get('completed_regions', len(regional_summary))
-                        
-                        if verbose and self.output_format not in ['json', 'yaml']:
-                            self.console.print(f"[dim]DEBUG: total_regions={total_regions}, completed_regions={completed_regions}, found result_ids={len(result_ids)}[/dim]")
-                        
-                        # If we're missing results, wait a bit and refetch
-                        if len(result_ids) < total_regions:
-                            if self.output_format not in ['json', 'yaml']:
-                                self.console.print(f"[yellow]⚠ Race condition detected: {len(result_ids)}/{total_regions} results ready. Waiting 2s and retrying...[/yellow]")
-                            time.sleep(2)
-                            
-                            # Refetch job status
-                            checks_api = self.get_client()
-                            job_status = checks_api.v1_checks_jobs_job_id_get(job_id=job_id)
-                            
-                            # Re-extract result_ids
-                            result_ids = []
-                            if hasattr(job_status, 'result') and job_status.result:
-                                result = job_status.result
-                                if isinstance(result, dict) and 'regional_summary' in result:
-                                    for regional_result in result['regional_summary']:
-                                        if 'result_id' in regional_result:
-                                            result_ids.append(regional_result['result_id'])
-                                    
-                                    if verbose and self.output_format not in ['json', 'yaml']:
-                                        self.console.print(f"[dim]DEBUG: After retry, found {len(result_ids)} result_ids[/dim]")
+                        if verbose and not self.structured_output:
+                            self.console.print(f"[dim]DEBUG: Found {len(result_ids)} result_ids in regional_summary[/dim]")
                     
                     elif 'result_id' in result:
                         # Single-region execution
@@ -559,15 +616,10 @@ class OnDemandChecksCommand(BaseCommand):
                 self.display_error("API key not found. Use 'pngr auth login --api-key <key>' to set it.")
                 raise typer.Exit(1)
             
-            from pingera import ApiClient, Configuration
             from pingera.api import ChecksUnifiedResultsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
             
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-            api_client = ApiClient(configuration)
-            checks_api = ChecksUnifiedResultsApi(api_client)
+            checks_api = ChecksUnifiedResultsApi(get_api_client(api_key))
             
             # Fetch detailed results for each result_id
             if is_multi_region:
@@ -590,11 +642,88 @@ class OnDemandChecksCommand(BaseCommand):
             self.display_warning(f"Could not fetch detailed results: {str(e)}")
             self._display_detailed_job_status(job_status, job_id)
     
+    @staticmethod
+    def _regional_progress(job_status):
+        """
+        Regional progress of a multi-region job
+
+        Returns:
+            tuple: Regional summary entries that have a result, total regions, completed regions
+        """
+        result = getattr(job_status, 'result', None)
+        if not isinstance(result, dict):
+            return [], 0, 0
+        summary = [region for region in result.get('regional_summary') or [] if isinstance(region, dict) and region.get('result_id')]
+        total = result.get('total_regions') or len(summary)
+        completed = result.get('completed_regions', len(summary))
+        return summary, total, completed
+
+    def _wait_for_regions(self, job_id: str, job_status, timeout: float = REGIONS_WAIT_TIMEOUT, verbose: bool = False):
+        """
+        Wait until every region of a multi-region job has reported
+
+        A job can be done a moment before its last regional results are
+        attached. The job status is fetched again after a short delay that
+        grows from REGIONS_POLL_DELAY to REGIONS_POLL_MAX_DELAY, until
+        completed_regions reaches total_regions with a result for each, or
+        the timeout (or command deadline) passes. Regions are listed as they
+        report, so fast ones are not held back by the slowest.
+
+        Returns:
+            The latest job status, which may still be incomplete
+        """
+        import time
+        from ..utils.client import time_remaining
+
+        summary, total, completed = self._regional_progress(job_status)
+        if len(summary) >= total and completed >= total:
+            return job_status
+
+        remaining = time_remaining()
+        started = time.monotonic()
+        deadline = started + (min(timeout, remaining) if remaining is not None else timeout)
+        delay = REGIONS_POLL_DELAY
+        announced = set()
+        checks_api = self.get_client()
+
+        while True:
+            self._announce_regions(summary, total, announced)
+            if (len(summary) >= total and completed >= total) or time.monotonic() >= deadline:
+                break
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 2, REGIONS_POLL_MAX_DELAY)
+            try:
+                with span('poll', 'poll regional results', job_id=job_id, regions_reported=len(summary), regions_total=total):
+                    job_status = checks_api.v1_checks_jobs_job_id_get(job_id=job_id)
+            except Exception as e:
+                if verbose and not self.structured_output:
+                    self.console.print(f"[dim]DEBUG: Polling regional results failed: {e}[/dim]")
+                break
+            summary, total, completed = self._regional_progress(job_status)
+
+        if len(summary) < total and not self.structured_output:
+            self.display_warning(f"{len(summary)} of {total} regions reported within {time.monotonic() - started:.0f}s; showing partial results.\nUse 'pngr checks jobs status {job_id}' later for the rest.")
+        return job_status
+
+    def _announce_regions(self, summary: list, total: int, announced: set):
+        """Print the regions that reported since the last call"""
+        if self.structured_output:
+            return
+        for region in summary:
+            if region['result_id'] in announced:
+                continue
+            announced.add(region['result_id'])
+            ok = region.get('status') == 'ok'
+            response_time = f" {region['response_time']}ms" if region.get('response_time') else ""
+            self.console.print(f"[{'green' if ok else 'red'}]{'✓' if ok else '✗'}[/{'green' if ok else 'red'}] {region.get('region', 'Unknown')}: {region.get('status', 'unknown')}{response_time} [dim]({len(announced)}/{total})[/dim]")
+
     def _display_multi_region_results(self, job_status, job_id: str, result_ids: list, checks_api):
-        """Display aggregated multi-region results"""
+        """Display aggregated multi-region results, with every region's full result if details were asked for"""
         from rich.table import Table
         
-        if self.output_format in ['json', 'yaml']:
+        regional_results = self._fetch_regional_results(result_ids, checks_api) if self.details else None
+        
+        if self.structured_output:
             # For JSON/YAML, include full job data with regional summary
             job_data = {
                 "job_id": job_id,
@@ -610,6 +739,9 @@ class OnDemandChecksCommand(BaseCommand):
                 if 'regional_summary' in result:
                     job_data['regional_summary'] = result['regional_summary']
             
+            if regional_results is not None:
+                job_data['regional_results'] = self._regional_result_records(result_ids, regional_results)
+            
             self.output_data(job_data)
             return
         
@@ -679,9 +811,13 @@ class OnDemandChecksCommand(BaseCommand):
                 self.console.print("\n")
                 self.console.print(table)
                 
-                # Add guidance for detailed results
-                self.console.print(f"\n[dim]💡 To see detailed results for a specific region, use:[/dim]")
-                self.console.print(f"[dim]   pngr checks results --result-id <result_id>[/dim]")
+                if regional_results is not None:
+                    regions = {region_result.get('result_id'): region_result.get('region', 'Unknown') for region_result in regional_summary}
+                    self._display_regional_details(result_ids, regional_results, regions)
+                else:
+                    # Add guidance for detailed results
+                    self.console.print(f"\n[dim]💡 To see detailed results for all regions, add --details, or for one region use:[/dim]")
+                    self.console.print(f"[dim]   pngr checks results --result-id <result_id>[/dim]")
             else:
                 # Fallback if no regional_summary
                 self._display_detailed_job_status(job_status, job_id)
@@ -689,6 +825,91 @@ class OnDemandChecksCommand(BaseCommand):
             # Fallback to basic job status
             self._display_detailed_job_status(job_status, job_id)
     
+    def _fetch_regional_results(self, result_ids: list, checks_api=None) -> dict:
+        """
+        Fetch the full result of every region at once
+
+        One request per result ID, all in flight together on the pooled
+        client, so the wait is about one round trip however many regions ran.
+
+        Returns:
+            dict: Result ID -> result object, or the exception its fetch raised
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from ..utils.bulk import MAX_CONCURRENCY
+
+        if checks_api is None:
+            from pingera.api import ChecksUnifiedResultsApi
+            from ..utils.client import get_api_client
+            checks_api = ChecksUnifiedResultsApi(get_api_client(get_api_key()))
+
+        def fetch(result_id):
+            response = checks_api.v1_checks_all_results_get(result_id=result_id)
+            results = getattr(response, 'results', None)
+            if not results:
+                raise LookupError(f"Result {result_id} not found")
+            return results[0]
+
+        result_ids = list(dict.fromkeys(result_ids))
+        if not result_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(result_ids), MAX_CONCURRENCY), thread_name_prefix='pngr-details') as executor:
+            futures = {result_id: executor.submit(fetch, result_id) for result_id in result_ids}
+        return {result_id: future.exception() or future.result() for result_id, future in futures.items()}
+
+    @staticmethod
+    def _regional_result_records(result_ids: list, regional_results: dict) -> list:
+        """Full regional results as plain dicts for JSON/YAML output"""
+        from ..utils.fields import project
+        from .checks import RESULT_FIELD_GETTERS
+
+        records = []
+        for result_id in dict.fromkeys(result_ids):
+            result = regional_results.get(result_id)
+            if isinstance(result, Exception):
+                records.append({"id": result_id, "error": str(result)})
+            elif result is not None:
+                records.append(project(result, RESULT_FIELD_GETTERS))
+        return records
+
+    def _display_regional_details(self, result_ids: list, regional_results: dict, regions: dict):
+        """Show each region's full result in a panel, as many side by side as the terminal fits"""
+        from rich.columns import Columns
+        from rich.panel import Panel
+        from ..formatters.registry import FormatterRegistry
+
+        registry = FormatterRegistry(verbose=self.verbose)
+        panels = []
+        for result_id in dict.fromkeys(result_ids):
+            result = regional_results.get(result_id)
+            region = regions.get(result_id, 'Unknown')
+            if result is None:
+                continue
+            if isinstance(result, Exception):
+                panels.append(Panel(f"[red]Could not fetch result {result_id}: {result}[/red]", title=f"🌍 {region}", border_style="red"))
+                continue
+
+            ok = getattr(result, 'status', None) == 'ok'
+            lines = [f"• Status: [{'green' if ok else 'red'}]{'✅' if ok else '❌'} {getattr(result, 'status', 'Unknown')}[/{'green' if ok else 'red'}]"]
+            if getattr(result, 'response_time', None):
+                lines.append(f"• Response Time: [yellow]{result.response_time}ms[/yellow]")
+            server = getattr(result, 'check_server', None)
+            if server:
+                lines.append(f"• Server: [white]{getattr(server, 'ip_address', 'Unknown')} ({getattr(server, 'country', 'Unknown')})[/white]")
+            if getattr(result, 'error_message', None):
+                lines.append(f"• Error: [red]{result.error_message}[/red]")
+            metadata = getattr(result, 'check_metadata', None)
+            if isinstance(metadata, dict) and metadata:
+                lines.extend(registry.iter_lines({**metadata, 'result_id': result_id}))
+
+            panels.append(Panel("\n".join(lines), title=f"🌍 {region}", subtitle=f"[dim]{result_id}[/dim]", border_style="green" if ok else "red"))
+
+        if not panels:
+            return
+        per_row = max(1, min(len(panels), self.console.width // DETAILS_MIN_WIDTH))
+        self.console.print(f"\n[bold cyan]Regional Details:[/bold cyan]")
+        self.console.print(Columns(panels, width=self.console.width // per_row - 1))
+
     def _display_detailed_result_with_job_info(self, job_status, job_id: str, detailed_result):
         """Display detailed result information combined with job info"""
         from rich.panel import Panel
@@ -724,26 +945,10 @@ class OnDemandChecksCommand(BaseCommand):
 [bold red]Error Information:[/bold red]
 • Error: [red]{detailed_result.error_message}[/red]"""
         
-        # Metadata analysis using formatters
-        metadata_info = ""
-        if hasattr(detailed_result, 'check_metadata') and detailed_result.check_metadata:
-            metadata = detailed_result.check_metadata
-            
-            if isinstance(metadata, dict):
-                # Add result_id to metadata for formatters to use in truncation notice
-                metadata_with_id = metadata.copy()
-                if hasattr(detailed_result, 'id'):
-                    metadata_with_id['result_id'] = detailed_result.id
-                
-                registry = FormatterRegistry(verbose=self.verbose)
-                metadata_info = registry.format_metadata(metadata_with_id)
-        
         # Combine all sections
         full_info = basic_info
         if error_info:
             full_info += error_info
-        if metadata_info:
-            full_info += metadata_info
         
         panel = Panel(
             full_info,
@@ -753,6 +958,21 @@ class OnDemandChecksCommand(BaseCommand):
         )
         
         self.console.print(panel)
+        
+        # Metadata analysis using formatters, streamed line by line so large
+        # port scans and log lists start printing immediately
+        if hasattr(detailed_result, 'check_metadata') and detailed_result.check_metadata:
+            metadata = detailed_result.check_metadata
+            
+            if isinstance(metadata, dict):
+                # Add result_id to metadata for formatters to use in truncation notice
+                metadata_with_id = metadata.copy()
+                if hasattr(detailed_result, 'id'):
+                    metadata_with_id['result_id'] = detailed_result.id
+                
+                registry = FormatterRegistry(verbose=self.verbose)
+                for line in registry.iter_lines(metadata_with_id):
+                    self.console.print(line)
     
     def _display_detailed_job_status(self, job_status, job_id: str):
         """Display detailed job status information in a rich format"""
@@ -891,22 +1111,49 @@ class OnDemandChecksCommand(BaseCommand):
         
         self.console.print(panel)
 
+    def _job_wait_strategies(self, checks_api) -> list:
+        """
+        Ways to wait for a job, for select_strategy to pick from
+
+        The API offers neither long-polling nor job callbacks yet, so the
+        long-poll and webhook strategies have no hooks and only interval
+        polling is available.
+        """
+        from ..utils.job_wait import IntervalPoller, LongPoller, WebhookReceiver
+
+        def get_status(job_id):
+            with span('poll', 'poll job status', job_id=job_id) as poll:
+                job_status = checks_api.v1_checks_jobs_job_id_get(job_id=job_id)
+                poll['attributes']['job_status'] = getattr(job_status, 'status', None)
+            return job_status
+
+        return [
+            WebhookReceiver(get_status, register=None),
+            LongPoller(long_poll=None),
+            IntervalPoller(get_status, interval=JOB_POLL_INTERVAL),
+        ]
+
     def _wait_and_show_result(self, job_id: str, initial_details: list):
         """Wait for job completion and display the result"""
         import time
         from rich.progress import Progress, SpinnerColumn, TextColumn
         
-        if self.output_format not in ['json', 'yaml']:
+        if not self.structured_output:
             # Show initial success message
             self.display_success(
                 f"On-demand check queued successfully!\n" + "\n".join(initial_details) + f"\n\nWaiting for result...",
                 "✅ Check Queued"
             )
         
-        # Polling logic with progress indicator
-        max_wait_time = 300  # 5 minutes maximum wait
-        poll_interval = 2    # Poll every 2 seconds
-        elapsed_time = 0
+        from ..utils.client import time_remaining
+        from ..utils.job_wait import TERMINAL_STATUSES, select_strategy
+
+        # 5 minutes maximum wait, or less if the command has a deadline
+        max_wait_time = JOB_WAIT_TIMEOUT
+        remaining = time_remaining()
+        if remaining is not None:
+            max_wait_time = min(max_wait_time, int(remaining))
+        started = time.monotonic()
         
         with Progress(
             SpinnerColumn(),
@@ -914,50 +1161,48 @@ class OnDemandChecksCommand(BaseCommand):
             console=self.console,
             transient=True
         ) as progress:
-            if self.output_format not in ['json', 'yaml']:
-                task = progress.add_task("⏳ Waiting for job completion...", total=None)
+            task = None if self.structured_output else progress.add_task("⏳ Waiting for job completion...", total=None)
             
-            while elapsed_time < max_wait_time:
-                try:
-                    checks_api = self.get_client()
-                    job_status = checks_api.v1_checks_jobs_job_id_get(job_id=job_id)
-                    
-                    if hasattr(job_status, 'status'):
-                        if job_status.status in ['completed', 'failed', 'error']:
-                            # Job is finished, fetch and show the result
-                            if self.output_format not in ['json', 'yaml']:
-                                progress.update(task, description=f"✅ Job {job_status.status}!")
-                                time.sleep(0.5)  # Brief pause to show completion
-                            
-                            # Fetch and display the actual result
-                            self._fetch_and_display_job_result(job_id, job_status, verbose=self.verbose)
-                            return
-                        
-                        elif job_status.status == 'running':
-                            if self.output_format not in ['json', 'yaml']:
-                                progress.update(task, description=f"🏃 Job running... ({elapsed_time}s elapsed)")
-                        
-                        else:  # pending, queued, etc.
-                            if self.output_format not in ['json', 'yaml']:
-                                progress.update(task, description=f"⏳ Job {job_status.status}... ({elapsed_time}s elapsed)")
-                    
-                    time.sleep(poll_interval)
-                    elapsed_time += poll_interval
-                    
-                except Exception as e:
-                    if self.output_format in ['json', 'yaml']:
-                        self.output_data({
-                            "error": f"Failed to poll job status: {str(e)}",
-                            "job_id": job_id,
-                            "elapsed_time": elapsed_time
-                        })
-                    else:
-                        self.display_error(f"Error polling job status: {str(e)}")
-                        self.display_info(f"You can manually check status with: pngr checks jobs status {job_id}")
+            def on_status(job_status, elapsed):
+                if task is None:
                     return
+                status = getattr(job_status, 'status', None)
+                if status in TERMINAL_STATUSES:
+                    progress.update(task, description=f"✅ Job {status}!")
+                elif status == 'running':
+                    progress.update(task, description=f"🏃 Job running... ({elapsed:.0f}s elapsed)")
+                else:  # pending, queued, etc.
+                    progress.update(task, description=f"⏳ Job {status}... ({elapsed:.0f}s elapsed)")
+            
+            try:
+                strategy = select_strategy(self._job_wait_strategies(self.get_client()))
+                annotate(job_wait=strategy.name)
+                job_status, elapsed_time = strategy.wait(job_id, max_wait_time, on_status)
+            except Exception as e:
+                elapsed_time = time.monotonic() - started
+                if self.structured_output:
+                    self.output_data({
+                        "error": f"Failed to poll job status: {str(e)}",
+                        "job_id": job_id,
+                        "elapsed_time": round(elapsed_time)
+                    })
+                else:
+                    self.display_error(f"Error polling job status: {str(e)}")
+                    self.display_info(f"You can manually check status with: pngr checks jobs status {job_id}")
+                return
+            
+            if job_status is not None:
+                if not self.structured_output:
+                    time.sleep(0.5)  # Brief pause to show completion
+                
+                # Fetch and display the actual result
+                self._fetch_and_display_job_result(job_id, job_status, verbose=self.verbose)
+                return
+            
+            elapsed_time = round(elapsed_time)
             
             # Timeout reached
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data({
                     "timeout": True,
                     "message": f"Job did not complete within {max_wait_time} seconds",
@@ -1007,6 +1252,7 @@ def run_custom_check(
     pw_script_file: Optional[str] = typer.Option(None, "--pw-script-file", help="Path to file containing Playwright script for synthetic/multistep checks"),
     from_file: Optional[str] = typer.Option(None, "--from-file", "-f", help="Path to JSON or YAML file containing check configuration"),
     no_wait: bool = typer.Option(False, "--no-wait", help="Don't wait for job completion, just queue the check and return job ID"),
+    details: bool = typer.Option(False, "--details", help="For multi-region runs, fetch every region's full result (with metadata) at once and show them side by side"),
 ):
     """Execute custom on-demand check. Can be executed from command line options or from a JSON/YAML file.
     
@@ -1025,7 +1271,7 @@ def run_custom_check(
     - synthetic/multistep: --pw-script-file or --parameters with pw_script required
     
     Timeout is optional - if not specified, backend will use appropriate defaults for each check type."""
-    on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode())
+    on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode(), details=details)
     on_demand_cmd.execute_custom_check(url, check_type, host, port, timeout, name, regions, parameters, pw_script_file, from_file, not no_wait, ports)
 
 
@@ -1033,26 +1279,32 @@ def run_custom_check(
 def run_existing_check(
     check_id: str = typer.Argument(..., help="Existing check ID to execute"),
     no_wait: bool = typer.Option(False, "--no-wait", help="Don't wait for job completion, just queue the check and return job ID"),
+    details: bool = typer.Option(False, "--details", help="For multi-region runs, fetch every region's full result (with metadata) at once and show them side by side"),
 ):
     """Execute existing check on demand. By default, waits for job completion and shows result immediately (max 5 minutes). Use --no-wait to just queue the check."""
-    on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode())
+    on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode(), details=details)
     on_demand_cmd.execute_existing_check(check_id, not no_wait)
 
 
 @jobs_app.command("list")
 def list_jobs(
     page: int = typer.Option(1, "--page", "-p", help="Page number"),
-    page_size: int = typer.Option(20, "--page-size", "-s", help="Items per page"),
+    page_size: Optional[int] = typer.Option(None, "--page-size", "-s", help="Items per page (default: 20, or sized to --limit)"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter expression, e.g. \"status=failed and created_at>=1d\" (see docs for the syntax)"),
+    all_pages: bool = typer.Option(False, "--all", help="Go through every page from --page on (needed for --where to look past one page)"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", min=1, help="Stop after this many jobs, fetching only the pages needed"),
+    since_last: bool = typer.Option(False, "--since-last", help="Only jobs created since the last --since-last run for this account (the first run lists every job)"),
 ):
     """List check jobs"""
     on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode())
-    on_demand_cmd.list_jobs(page, page_size)
+    on_demand_cmd.list_jobs(page, page_size, where, all_pages, limit, since_last)
 
 
 @jobs_app.command("status")
 def get_job_status(
     job_id: str = typer.Argument(..., help="Job ID to get status for"),
+    details: bool = typer.Option(False, "--details", help="For multi-region runs, fetch every region's full result (with metadata) at once and show them side by side"),
 ):
     """Get job status and results. For multi-region executions, shows aggregated statistics and regional summary."""
-    on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode())
+    on_demand_cmd = OnDemandChecksCommand(get_output_format(), verbose=get_verbose_mode(), details=details)
     on_demand_cmd.get_job_status(job_id)
@@ -32,18 +32,10 @@ class PagesCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import StatusPagesApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            return StatusPagesApi(api_client)
+            return StatusPagesApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -51,29 +43,29 @@ class PagesCommand(BaseCommand):
             self.display_error(f"Failed to initialize client: {str(e)}")
             raise typer.Exit(1)
 
-    def list_pages(self, page: int = 1, page_size: int = 20):
+    def list_pages(self, page: int = 1, page_size: Optional[int] = None, where: Optional[str] = None, all_pages: bool = False, limit: Optional[int] = None):
         """List status pages"""
+        query = self.compile_where(where)
+        page_size = self.page_size_for(page_size, page, limit, query)
+
         try:
             pages_api = self.get_client()
 
-            # Build parameters for the API call
-            params = {
-                "page": page,
-                "page_size": page_size
-            }
-
             # Make API call
-            response = pages_api.v1_pages_get(**params)
+            response = self.fetch_listing(
+                lambda number: pages_api.v1_pages_get(page=number, page_size=page_size),
+                'pages', page, page_size, query, all_pages, limit
+            )
 
             if not hasattr(response, 'pages') or not response.pages:
-                if self.output_format in ['json', 'yaml']:
+                if self.structured_output:
                     self.output_data({"pages": [], "total": 0, "message": "No pages found"})
                 else:
                     self.display_info("No status pages found.")
                 return
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 pages_data = []
                 for page_obj in response.pages:
                     page_dict = {
@@ -154,7 +146,7 @@ class PagesCommand(BaseCommand):
             page = pages_api.v1_pages_page_id_get(page_id=page_id)
 
             # Prepare data for different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 page_data = {
                     "id": str(page.id) if hasattr(page, 'id') and page.id else None,
                     "name": page.name if hasattr(page, 'name') and page.name else None,
@@ -436,29 +428,16 @@ class PagesCommand(BaseCommand):
     def get_client_optional_auth(self, require_auth: bool = False):
         """Get Pingera SDK client with optional authentication"""
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import StatusPagesApi, StatusPagesIncidentsApi, StatusPagesComponentsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            
             # Only add API key if required or available
-            if require_auth:
-                api_key = get_api_key()
-                if not api_key:
-                    self.display_error("API key not found. Use 'pngr auth login --api-key <key>' to set it.")
-                    raise typer.Exit(1)
-                configuration.api_key['apiKeyAuth'] = api_key
-            else:
-                # Try to get API key but don't fail if not available
-                api_key = get_api_key()
-                if api_key:
-                    configuration.api_key['apiKeyAuth'] = api_key
+            api_key = get_api_key()
+            if require_auth and not api_key:
+                self.display_error("API key not found. Use 'pngr auth login --api-key <key>' to set it.")
+                raise typer.Exit(1)
 
-            # Create API client
-            api_client = ApiClient(configuration)
+            api_client = get_api_client(api_key)
             return {
                 'pages': StatusPagesApi(api_client),
                 'incidents': StatusPagesIncidentsApi(api_client),
@@ -473,6 +452,9 @@ class PagesCommand(BaseCommand):
 
     def show_page_by_domain(self, domain: str):
         """Show page status by domain with incidents and components"""
+        from .incidents import UNRESOLVED_WHERE
+        from ..utils.where import compile_where
+
         try:
             # Determine what to send to the API
             # If it ends with .pingera.ru, send only the subdomain
@@ -509,9 +491,7 @@ class PagesCommand(BaseCommand):
             try:
                 all_incidents = clients['incidents'].v1_pages_page_id_incidents_get(page_id=page_id)
                 if all_incidents:
-                    for incident in all_incidents:
-                        if hasattr(incident, 'status') and incident.status and incident.status != 'resolved':
-                            unresolved_incidents.append(incident)
+                    unresolved_incidents = list(compile_where(UNRESOLVED_WHERE).filter(all_incidents))
             except Exception:
                 # Incidents might not be accessible, continue anyway
                 pass
@@ -527,7 +507,7 @@ class PagesCommand(BaseCommand):
                 pass
 
             # Prepare output based on format
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 # JSON/YAML output
                 page_data = {
                     "page": {
@@ -665,12 +645,15 @@ app.add_typer(incidents.app, name="incidents")
 @app.command("list")
 def list_pages(
     page: int = typer.Option(1, "--page", "-p", help="Page number"),
-    page_size: int = typer.Option(20, "--page-size", "-s", help="Items per page"),
+    page_size: Optional[int] = typer.Option(None, "--page-size", "-s", help="Items per page (default: 20, or sized to --limit)"),
+    where: Optional[str] = typer.Option(None, "--where", "-w", help="Filter expression, e.g. \"name~docs or domain!=null\" (see docs for the syntax)"),
+    all_pages: bool = typer.Option(False, "--all", help="Go through every page from --page on (needed for --where to look past one page)"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", min=1, help="Stop after this many pages, fetching only the API pages needed"),
 ):
     """List status pages"""
     from ..utils.config import get_output_format
     pages_cmd = PagesCommand(get_output_format())
-    pages_cmd.list_pages(page, page_size)
+    pages_cmd.list_pages(page, page_size, where, all_pages, limit)
 
 
 @app.command("get")
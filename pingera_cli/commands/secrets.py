@@ -31,18 +31,10 @@ class SecretsCommand(BaseCommand):
             raise typer.Exit(1)
 
         try:
-            from pingera import ApiClient, Configuration
             from pingera.api import SecretsApi
-            from ..utils.config import get_config
+            from ..utils.client import get_api_client
 
-            # Configure the client
-            configuration = Configuration()
-            configuration.host = get_config().get('base_url', 'https://api.pingera.ru')
-            configuration.api_key['apiKeyAuth'] = api_key
-
-            # Create API client
-            api_client = ApiClient(configuration)
-            return SecretsApi(api_client)
+            return SecretsApi(get_api_client(api_key))
         except ImportError:
             self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
             raise typer.Exit(1)
@@ -70,7 +62,7 @@ class SecretsCommand(BaseCommand):
                 pagination = {}
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 # Convert to dict for JSON/YAML output
                 secrets_data = {
                     'secrets': [secret.to_dict() for secret in secrets],
@@ -127,7 +119,7 @@ class SecretsCommand(BaseCommand):
             secret = secrets_api.v1_secrets_secret_id_get(secret_id)
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data(secret.to_dict())
             else:
                 # Table format
@@ -171,7 +163,7 @@ class SecretsCommand(BaseCommand):
             created_secret = secrets_api.v1_secrets_post(secret_data)
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data(created_secret.to_dict())
             else:
                 self.display_success(f"Secret '{name}' created successfully with ID: {created_secret.id}")
@@ -206,7 +198,7 @@ class SecretsCommand(BaseCommand):
             updated_secret = secrets_api.v1_secrets_secret_id_patch(secret_id, secret_update)
             
             # Handle different output formats
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data(updated_secret.to_dict())
             else:
                 self.display_success(f"Secret '{updated_secret.secret_name}' updated successfully")
@@ -250,7 +242,7 @@ class SecretsCommand(BaseCommand):
             # Make API call
             secrets_api.v1_secrets_secret_id_delete(secret_id)
             
-            if self.output_format in ['json', 'yaml']:
+            if self.structured_output:
                 self.output_data({"message": f"Secret '{secret_name}' deleted successfully", "secret_id": secret_id})
             else:
                 self.display_success(f"Secret '{secret_name}' deleted successfully")
@@ -0,0 +1,241 @@
+"""
+Interactive shell for PingeraCLI
+"""
+
+import shlex
+from typing import Callable, Dict, List, Optional
+
+from .base import BaseCommand
+from ..utils.config import get_api_key, get_config_path
+
+try:
+    import readline
+except ImportError:  # pragma: no cover - readline is unavailable on Windows
+    readline = None
+
+HISTORY_LENGTH = 1000
+BUILTINS = ['exit', 'quit', 'help', 'refresh']
+
+
+class IdIndex:
+    """
+    Session cache of resource IDs used for argument completion
+
+    Each resource list is fetched once, on first completion, through the shared
+    pooled client; 'refresh' drops the cache.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, List[str]] = {}
+        self._loaders: Dict[str, Callable[[], List[str]]] = {
+            'check_id': self._load_check_ids,
+            'group_id': self._load_group_ids,
+            'page_id': self._load_page_ids,
+        }
+
+    def supports(self, param_name: str) -> bool:
+        """Check if IDs for this parameter can be completed"""
+        return param_name in self._loaders or param_name[:-1] in self._loaders
+
+    def get(self, param_name: str) -> List[str]:
+        """Get the cached IDs for a parameter, loading them on first use"""
+        if param_name not in self._loaders:
+            # Bulk commands take several IDs of one kind, e.g. check_ids
+            param_name = param_name[:-1]
+        if param_name not in self._ids:
+            try:
+                self._ids[param_name] = self._loaders[param_name]()
+            except Exception:
+                # Completion must never break the prompt
+                self._ids[param_name] = []
+        return self._ids[param_name]
+
+    def clear(self):
+        """Forget all cached IDs"""
+        self._ids.clear()
+
+    def _api(self, api_name: str):
+        import pingera.api
+        from ..utils.client import get_api_client
+
+        api_key = get_api_key()
+        if not api_key:
+            raise RuntimeError("API key not configured")
+        return getattr(pingera.api, api_name)(get_api_client(api_key))
+
+    def _load_check_ids(self) -> List[str]:
+        response = self._api('ChecksApi').v1_checks_get(page=1, page_size=100)
+        return [str(check.id) for check in (response.checks or [])]
+
+    def _load_group_ids(self) -> List[str]:
+        response = self._api('CheckGroupsApi').v1_check_groups_get(page=1, page_size=100)
+        return [str(group.id) for group in (getattr(response, 'groups', None) or [])]
+
+    def _load_page_ids(self) -> List[str]:
+        response = self._api('StatusPagesApi').v1_pages_get(page=1, page_size=100)
+        return [str(page.id) for page in (getattr(response, 'pages', None) or [])]
+
+
+class ShellCompleter:
+    """Readline completer walking the Typer command tree"""
+
+    def __init__(self, root_command, id_index: IdIndex):
+        self.root_command = root_command
+        self.id_index = id_index
+        self._matches: List[str] = []
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        """Readline completion hook"""
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_begidx()]
+            try:
+                words = shlex.split(line)
+            except ValueError:
+                words = line.split()
+            self._matches = [
+                candidate + ' ' for candidate in self.candidates(words)
+                if candidate.startswith(text)
+            ]
+        return self._matches[state] if state < len(self._matches) else None
+
+    def candidates(self, words: List[str]) -> List[str]:
+        """Get completion candidates for the word following `words`"""
+        command = self.root_command
+        positional = 0
+
+        for word in words:
+            subcommands = getattr(command, 'commands', None)
+            if subcommands and word in subcommands:
+                command = subcommands[word]
+                positional = 0
+            elif not word.startswith('-'):
+                positional += 1
+
+        subcommands = getattr(command, 'commands', None)
+        if subcommands:
+            names = sorted(name for name, cmd in subcommands.items() if not getattr(cmd, 'hidden', False))
+            return names + (BUILTINS if command is self.root_command else [])
+
+        candidates = []
+        arguments = [param for param in command.params if param.param_type_name == 'argument']
+        if arguments and positional >= len(arguments) and arguments[-1].nargs == -1:
+            # A variadic last argument takes every remaining word
+            positional = len(arguments) - 1
+        if positional < len(arguments) and self.id_index.supports(arguments[positional].name):
+            candidates.extend(self.id_index.get(arguments[positional].name))
+
+        for param in command.params:
+            if param.param_type_name == 'option':
+                candidates.extend(opt for opt in param.opts if opt.startswith('--'))
+
+        if words and words[-1].startswith('--') and self.id_index.supports(words[-1][2:].replace('-', '_')):
+            return self.id_index.get(words[-1][2:].replace('-', '_'))
+        return candidates
+
+
+class ShellCommand(BaseCommand):
+    """
+    Interactive shell dispatching pngr commands in-process
+    """
+
+    def __init__(self, output_format: Optional[str] = None, verbose: bool = False):
+        super().__init__(output_format)
+        self.verbose = verbose
+        self.id_index = IdIndex()
+        self.history_path = get_config_path().parent / 'shell_history'
+
+    def run(self):
+        """Read and dispatch command lines until exit"""
+        from ..utils.dispatch import invoke_cli
+
+        self._setup_readline()
+        self.display_info(
+            "Type pngr commands without the 'pngr' prefix, e.g. [white]checks list[/white].\n"
+            "Use [white]help[/white] for commands, [white]refresh[/white] to reload completion IDs, "
+            "[white]exit[/white] or Ctrl+D to leave.",
+            title="🐚 pngr shell"
+        )
+
+        try:
+            while True:
+                try:
+                    line = input('pngr> ')
+                except KeyboardInterrupt:
+                    self.console.print()
+                    continue
+                except EOFError:
+                    self.console.print()
+                    break
+
+                args = self._parse_line(line)
+                if args is None:
+                    continue
+                if args[0] in ('exit', 'quit'):
+                    break
+                if args[0] == 'refresh':
+                    self.id_index.clear()
+                    self.console.print("[dim]Completion IDs will be reloaded on next use[/dim]")
+                    continue
+                if args[0] == 'help':
+                    args = args[1:] + ['--help']
+                if args[0] == 'shell':
+                    self.display_warning("Already in the pngr shell")
+                    continue
+
+                exit_code = invoke_cli(self._with_session_options(args))
+                if exit_code == 130:
+                    self.console.print("\n[yellow]⚠ Operation cancelled by user[/yellow]")
+        finally:
+            self._save_history()
+
+    def _parse_line(self, line: str) -> Optional[List[str]]:
+        """Split a command line, reporting quoting errors"""
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            self.display_error(f"Invalid command line: {str(e)}")
+            return None
+        if args and args[0] == 'pngr':
+            args = args[1:]
+        return args or None
+
+    def _with_session_options(self, args: List[str]) -> List[str]:
+        """Apply the shell's global options unless the line sets its own"""
+        if args[0].startswith('-'):
+            return args
+        session_options = ['--output', self.output_format]
+        if self.verbose:
+            session_options.append('--verbose')
+        return session_options + args
+
+    def _setup_readline(self):
+        """Load history and install completion"""
+        if readline is None:
+            return
+
+        import typer.main
+        from ..main import app
+
+        try:
+            readline.read_history_file(str(self.history_path))
+        except (OSError, IOError):
+            pass
+        readline.set_history_length(HISTORY_LENGTH)
+
+        completer = ShellCompleter(typer.main.get_command(app), self.id_index)
+        readline.set_completer(completer.complete)
+        readline.set_completer_delims(' \t\n')
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+
+    def _save_history(self):
+        """Persist history for the next session"""
+        if readline is None:
+            return
+        try:
+            readline.write_history_file(str(self.history_path))
+        except (OSError, IOError):
+            pass
+
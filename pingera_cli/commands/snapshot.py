@@ -0,0 +1,444 @@
+"""
+Snapshot export/import commands for PingeraCLI
+
+A snapshot holds the configuration of an account: check groups, checks, their
+group assignments and secret associations (secret IDs only, never values),
+status pages, components and incidents. Export fetches the lists concurrently
+and streams each page into a compressed archive (see utils.archive) as it
+arrives; import streams the records back and recreates them level by level so
+references (group, page, component IDs) can be mapped to the IDs of the newly
+created resources.
+"""
+
+import json
+import os
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import typer
+from rich.table import Table
+
+from .base import BaseCommand
+from .. import __version__
+from ..utils.archive import ArchiveReader, ArchiveWriter
+from ..utils.bulk import DEFAULT_CONCURRENCY
+from ..utils.config import get_api_key
+
+SNAPSHOT_FORMAT = 'pngr-snapshot'
+SNAPSHOT_VERSION = 1
+
+# Items requested per page when listing checks, groups and pages
+EXPORT_PAGE_SIZE = 100
+
+# Resource types in a snapshot, in the order they are recreated
+RESOURCES = ['check_groups', 'checks', 'check_secrets', 'pages', 'components', 'incidents']
+
+RESOURCE_LABELS = {
+    'check_groups': 'Check groups',
+    'checks': 'Checks',
+    'check_secrets': 'Secret associations',
+    'pages': 'Status pages',
+    'components': 'Components',
+    'incidents': 'Incidents',
+}
+
+
+def _record(model: Any, **extra) -> Dict[str, Any]:
+    """Convert an SDK model to a JSON-ready dict that keeps its ID"""
+    data = model.to_dict() if hasattr(model, 'to_dict') else dict(model)
+    data = json.loads(json.dumps(data, default=str))
+    if getattr(model, 'id', None) is not None:
+        data['id'] = str(model.id)
+    data.update({key: value for key, value in extra.items() if value is not None})
+    return data
+
+
+def _payload(record: Dict[str, Any], model_name: str, drop: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Keep the fields of a record that the SDK create model accepts"""
+    import pingera.models
+
+    fields = getattr(pingera.models, model_name).model_fields
+    return {key: value for key, value in record.items() if key in fields and key not in ('id',) + drop and value is not None}
+
+
+class _JsonSnapshot:
+    """Snapshot written as a single JSON document by earlier versions"""
+
+    def __init__(self, path: str):
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                document = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} is not a valid snapshot: {e}")
+        if not isinstance(document, dict) or document.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a pngr snapshot")
+        self.metadata = {'kind': 'snapshot', 'exported_at': document.get('exported_at')}
+        self._resources = document.get('resources') or {}
+
+    def count(self, resource: str) -> int:
+        return len(self._resources.get(resource) or [])
+
+    def records(self, resource: str):
+        return iter(self._resources.get(resource) or [])
+
+    def close(self):
+        pass
+
+
+def open_snapshot(path: str):
+    """
+    Open a snapshot for streaming its records
+
+    Reads archives written by 'pngr export' and, for compatibility, single
+    JSON snapshot documents.
+
+    Raises:
+        ValueError: If the path is not a snapshot this version can import
+    """
+    if path.endswith('.json') and os.path.isfile(path):
+        return _JsonSnapshot(path)
+
+    reader = ArchiveReader(path)
+    metadata = reader.metadata
+    if metadata.get('kind') != 'snapshot':
+        reader.close()
+        raise ValueError(f"{path} is not a pngr snapshot")
+    if metadata.get('snapshot_version', 0) > SNAPSHOT_VERSION:
+        reader.close()
+        raise ValueError(f"{path} was written by a newer pngr (snapshot version {metadata['snapshot_version']}); upgrade to import it")
+
+    problems = reader.verify()
+    if problems:
+        reader.close()
+        raise ValueError(f"{path} is damaged: {'; '.join(problems)}")
+    return reader
+
+
+class SnapshotCommand(BaseCommand):
+    """
+    Commands for exporting and importing account snapshots
+    """
+
+    def __init__(self, output_format: Optional[str] = None):
+        super().__init__(output_format)
+
+    def get_clients(self) -> Dict[str, Any]:
+        """Get the SDK API clients used by snapshots, sharing one pooled client"""
+        api_key = get_api_key()
+        if not api_key:
+            self.display_error("API key not found. Use 'pngr auth login --api-key <key>' to set it.")
+            raise typer.Exit(1)
+
+        try:
+            from pingera.api import (
+                CheckGroupsApi, CheckSecretsApi, ChecksApi, StatusPagesApi,
+                StatusPagesComponentsApi, StatusPagesIncidentsApi,
+            )
+            from ..utils.client import get_api_client
+
+            api_client = get_api_client(api_key)
+            return {
+                'checks': ChecksApi(api_client),
+                'groups': CheckGroupsApi(api_client),
+                'secrets': CheckSecretsApi(api_client),
+                'pages': StatusPagesApi(api_client),
+                'components': StatusPagesComponentsApi(api_client),
+                'incidents': StatusPagesIncidentsApi(api_client),
+            }
+        except ImportError:
+            self.display_error("Pingera SDK not installed. Install with: pip install pingera-sdk")
+            raise typer.Exit(1)
+        except Exception as e:
+            self.display_error(f"Failed to initialize client: {str(e)}")
+            raise typer.Exit(1)
+
+    def export_snapshot(self, path: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY, compression: str = 'gzip'):
+        """Export the account configuration to a snapshot archive"""
+        path = path or f"pngr-snapshot-{datetime.now().strftime('%Y%m%d-%H%M%S')}.tar"
+        try:
+            clients = self.get_clients()
+            metadata = {'kind': 'snapshot', 'snapshot_version': SNAPSHOT_VERSION, 'cli_version': __version__, 'exported_at': datetime.now().astimezone().isoformat()}
+            with ArchiveWriter(path, compression, resources=RESOURCES, metadata=metadata) as writer:
+                with self.error_console.status("Exporting account configuration...") if not self.structured_output else nullcontext():
+                    self._collect(clients, concurrency, writer)
+                counts = writer.counts()
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.display_error(f"Failed to export snapshot: {str(e)}")
+            raise typer.Exit(1)
+
+        if self.structured_output:
+            self.output_data({"path": path, "resources": counts})
+            return
+
+        table = Table(title=f"📦 Snapshot written to {path}", title_justify="left")
+        table.add_column("Resource", style="cyan")
+        table.add_column("Exported", justify="right", style="green")
+        for resource in RESOURCES:
+            table.add_row(RESOURCE_LABELS[resource], str(counts[resource]))
+        self.console.print(table)
+
+    def _collect(self, clients: Dict[str, Any], concurrency: int, writer: ArchiveWriter):
+        """Fetch every resource into the archive, listing independent collections concurrently"""
+        check_ids: List[str] = []
+        page_ids: List[str] = []
+
+        def collect(resource: str, ids: Optional[List[str]] = None):
+            def on_page(items):
+                writer.write_many(resource, (_record(item) for item in items))
+                if ids is not None:
+                    ids.extend(str(item.id) for item in items)
+            return on_page
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='pngr-export') as pool:
+            # Top-level lists run on their own threads; their page fetches share the pool
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix='pngr-export-list') as lists:
+                futures = [
+                    lists.submit(self._fetch_pages, pool, lambda page: clients['groups'].v1_check_groups_get(page=page, page_size=EXPORT_PAGE_SIZE), 'groups', collect('check_groups')),
+                    lists.submit(self._fetch_pages, pool, lambda page: clients['checks'].v1_checks_get(page=page, page_size=EXPORT_PAGE_SIZE), 'checks', collect('checks', check_ids)),
+                    lists.submit(self._fetch_pages, pool, lambda page: clients['pages'].v1_pages_get(page=page, page_size=EXPORT_PAGE_SIZE), 'pages', collect('pages', page_ids)),
+                ]
+                for future in futures:
+                    future.result()
+
+            # Per-check and per-page collections depend on the lists above
+            def fetch_secrets(check_id):
+                writer.write_many('check_secrets', (
+                    {'check_id': check_id, 'secret_id': association.secret_id, 'env_variable': association.env_variable}
+                    for association in (clients['secrets'].v1_checks_check_id_secrets_get(check_id) or [])
+                ))
+
+            def fetch_components(page_id):
+                writer.write_many('components', (
+                    _record(component, page_id=page_id, group_id=getattr(component, 'group_id', None))
+                    for component in (clients['components'].v1_pages_page_id_components_get(page_id=page_id) or [])
+                ))
+
+            def fetch_incidents(page_id):
+                writer.write_many('incidents', (
+                    _record(incident, page_id=page_id)
+                    for incident in (clients['incidents'].v1_pages_page_id_incidents_get(page_id=page_id) or [])
+                ))
+
+            futures = [pool.submit(fetch_secrets, check_id) for check_id in check_ids]
+            futures += [pool.submit(fetch, page_id) for page_id in page_ids for fetch in (fetch_components, fetch_incidents)]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _fetch_pages(pool: ThreadPoolExecutor, fetch_page: Callable[[int], Any], attribute: str, on_page: Callable[[list], None]):
+        """
+        Fetch all pages of a list endpoint, handing each page over as it arrives
+
+        When the first page reports the page count, the remaining pages are
+        fetched concurrently; otherwise pages are read until a short one.
+        """
+        first = fetch_page(1)
+        items = list(getattr(first, attribute, None) or [])
+        on_page(items)
+        pagination = getattr(first, 'pagination', None) or {}
+        total_pages = pagination.get('total_pages') or pagination.get('pages') if isinstance(pagination, dict) else None
+
+        if isinstance(total_pages, int):
+            for response in pool.map(fetch_page, range(2, total_pages + 1)):
+                on_page(list(getattr(response, attribute, None) or []))
+            return
+
+        page = 1
+        while len(items) >= EXPORT_PAGE_SIZE:
+            page += 1
+            items = list(getattr(fetch_page(page), attribute, None) or [])
+            on_page(items)
+
+    def import_snapshot(self, path: str, confirm: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+        """Recreate the resources of a snapshot in the current account"""
+        try:
+            snapshot = open_snapshot(path)
+        except (OSError, ValueError) as e:
+            self.display_error(str(e))
+            raise typer.Exit(1)
+
+        try:
+            self._import(snapshot, path, confirm, concurrency)
+        finally:
+            snapshot.close()
+
+    def _import(self, snapshot, path: str, confirm: bool, concurrency: int):
+        from collections import Counter
+        from rich.prompt import Confirm
+        from ..utils.bulk import run_concurrently
+
+        counts = {resource: snapshot.count(resource) for resource in RESOURCES}
+        if not any(counts.values()):
+            self.display_info(f"Snapshot {path} is empty; nothing to import.")
+            return
+
+        if not confirm:
+            table = Table(title=f"📦 Snapshot {path} (exported {snapshot.metadata.get('exported_at') or 'unknown'})", title_justify="left")
+            table.add_column("Resource", style="cyan")
+            table.add_column("To create", justify="right", style="green")
+            for resource in RESOURCES:
+                table.add_row(RESOURCE_LABELS[resource], str(counts[resource]))
+            self.console.print(table)
+            if not Confirm.ask(f"Create {sum(counts.values())} resources in this account?"):
+                self.console.print("[yellow]Operation cancelled.[/yellow]")
+                return
+
+        clients = self.get_clients()
+        id_map: Dict[str, Dict[str, str]] = {resource: {} for resource in RESOURCES}
+        created = {resource: 0 for resource in RESOURCES}
+        failures: List[Tuple[str, str, str]] = []
+
+        secret_counts = Counter(association['check_id'] for association in snapshot.records('check_secrets'))
+
+        # Each level only references resources created by earlier levels
+        for level, operations in enumerate(self._import_levels(snapshot, clients, id_map), start=1):
+            if not operations:
+                continue
+            succeeded, failed = run_concurrently(
+                [(key, label) for key, (label, _) in operations.items()],
+                lambda key: operations[key][1](),
+                f"Importing (step {level} of 4)",
+                concurrency=concurrency,
+                console=self.error_console,
+                show_progress=not self.structured_output,
+            )
+            for key, _ in succeeded:
+                resource, old_id = key.split(':', 1)
+                if resource == 'check_secrets':
+                    created[resource] += secret_counts[old_id]
+                elif ':' not in old_id:
+                    # Group assignments ('checks:<id>:group') are not creations
+                    created[resource] += 1
+            failures.extend(failed)
+
+        if self.structured_output:
+            self.output_data({
+                "created": created,
+                "failed": [{"resource": key.split(':', 1)[0], "id": key.split(':', 1)[1], "name": label, "error": error} for key, label, error in failures],
+                "id_map": id_map,
+            })
+        else:
+            table = Table(title=f"📥 Imported {path}", title_justify="left")
+            table.add_column("Resource", style="cyan")
+            table.add_column("Created", justify="right", style="green")
+            table.add_column("Failed", justify="right", style="red")
+            for resource in RESOURCES:
+                failed_count = sum(1 for key, _, _ in failures if key.startswith(f"{resource}:"))
+                table.add_row(RESOURCE_LABELS[resource], str(created[resource]), str(failed_count) if failed_count else "-")
+            self.console.print(table)
+
+            if failures:
+                report = Table(title=f"❌ {len(failures)} resources failed to import", show_header=True, header_style="bold magenta")
+                report.add_column("Resource", style="cyan")
+                report.add_column("Snapshot ID")
+                report.add_column("Name", style="green")
+                report.add_column("Error", style="red")
+                for key, label, error in failures:
+                    resource, old_id = key.split(':', 1)
+                    report.add_row(RESOURCE_LABELS[resource], old_id, label, error)
+                self.error_console.print(report)
+
+        if failures:
+            raise typer.Exit(1)
+
+    def _import_levels(self, snapshot, clients: Dict[str, Any], id_map: Dict[str, Dict[str, str]]):
+        """
+        Yield the import operations level by level
+
+        Operations are keyed '<resource>:<snapshot id>' and map to (label,
+        function). A level is built only after the previous one ran, so its
+        functions can look up the new IDs of what they reference.
+        """
+
+        def create(resource: str, old_id: str, call: Callable[[], Any]):
+            def operation():
+                id_map[resource][old_id] = str(call().id)
+            return operation
+
+        def mapped(resource: str, old_id: Optional[str]) -> str:
+            if old_id not in id_map[resource]:
+                raise ValueError(f"{RESOURCE_LABELS[resource][:-1].lower()} {old_id} was not imported")
+            return id_map[resource][old_id]
+
+        # 1. Check groups and status pages
+        level = {}
+        for group in snapshot.records('check_groups'):
+            payload = _payload(group, 'CheckGroup1')
+            level[f"check_groups:{group['id']}"] = (group.get('name', ''), create('check_groups', group['id'], lambda payload=payload: clients['groups'].v1_check_groups_post(check_group1=payload)))
+        for page in snapshot.records('pages'):
+            payload = _payload(page, 'Page')
+            level[f"pages:{page['id']}"] = (page.get('name', ''), create('pages', page['id'], lambda payload=payload: clients['pages'].v1_pages_post(page=payload)))
+        yield level
+
+        # 2. Checks, and components that are not inside a component group
+        level = {}
+        for check in snapshot.records('checks'):
+            payload = _payload(check, 'MonitorCheck', drop=('group_id', 'secrets'))
+            level[f"checks:{check['id']}"] = (check.get('name', ''), create('checks', check['id'], lambda payload=payload: clients['checks'].v1_checks_post(monitor_check=payload)))
+        for component in snapshot.records('components'):
+            if not component.get('group_id'):
+                level[f"components:{component['id']}"] = (component.get('name', ''), self._create_component(clients, component, id_map, create, mapped))
+        yield level
+
+        # 3. Group assignments, secret associations and grouped components
+        level = {}
+        for check in snapshot.records('checks'):
+            if check.get('group_id') and check['id'] in id_map['checks']:
+                level[f"checks:{check['id']}:group"] = (f"{check.get('name', '')} (group assignment)", lambda check=check: clients['groups'].v1_checks_check_id_group_patch(
+                    check_id=id_map['checks'][check['id']], generated={'group_id': mapped('check_groups', check['group_id'])}))
+        associations: Dict[str, list] = {}
+        for association in snapshot.records('check_secrets'):
+            associations.setdefault(association['check_id'], []).append({'secret_id': association['secret_id'], 'env_variable': association['env_variable']})
+        for check_id, check_secrets in associations.items():
+            level[f"check_secrets:{check_id}"] = (f"{len(check_secrets)} secrets", lambda check_id=check_id, check_secrets=check_secrets: clients['secrets'].v1_checks_check_id_secrets_put(
+                mapped('checks', check_id), check_secrets))
+        for component in snapshot.records('components'):
+            if component.get('group_id'):
+                level[f"components:{component['id']}"] = (component.get('name', ''), self._create_component(clients, component, id_map, create, mapped))
+        yield level
+
+        # 4. Incidents, which reference pages and components
+        level = {}
+        for incident in snapshot.records('incidents'):
+            level[f"incidents:{incident['id']}"] = (incident.get('name', ''), create('incidents', incident['id'], lambda incident=incident: clients['incidents'].v1_pages_page_id_incidents_post(
+                page_id=mapped('pages', incident['page_id']), incident_create=self._incident_payload(incident, id_map))))
+        yield level
+
+    @staticmethod
+    def _create_component(clients, component: Dict[str, Any], id_map, create, mapped) -> Callable[[], None]:
+        """Build the operation creating one component (or component group) on its new page"""
+        payload = _payload(component, 'Component', drop=('page_id', 'group_id'))
+        if component.get('group_id'):
+            payload['group_id'] = component['group_id']
+
+        def call():
+            page_id = mapped('pages', component['page_id'])
+            if 'group_id' in payload:
+                payload['group_id'] = mapped('components', component['group_id'])
+            if component.get('group'):
+                return clients['components'].v1_pages_page_id_component_groups_post(page_id=page_id, component=payload)
+            return clients['components'].v1_pages_page_id_components_post(page_id=page_id, component=payload)
+
+        return create('components', component['id'], call)
+
+    @staticmethod
+    def _incident_payload(incident: Dict[str, Any], id_map) -> Dict[str, Any]:
+        """Build an incident create body, mapping component IDs and muting notifications"""
+        payload = _payload(incident, 'IncidentCreate', drop=('components',))
+        # Replaying history must not notify the page's subscribers again
+        payload['deliver_notifications'] = False
+
+        components = incident.get('components')
+        if isinstance(components, list):
+            components = {str(item.get('id')): item.get('status') for item in components if isinstance(item, dict) and item.get('id')}
+        if isinstance(components, dict):
+            payload['components'] = {
+                id_map['components'][old_id]: status
+                for old_id, status in components.items()
+                if old_id in id_map['components'] and status
+            }
+        return payload
@@ -4,7 +4,7 @@ Base formatter class for check results
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 
 
 class BaseFormatter(ABC):
@@ -19,9 +19,13 @@ class BaseFormatter(ABC):
         pass
     
     @abstractmethod
+    def iter_format(self, metadata: Dict[str, Any]) -> Iterator[str]:
+        """Yield the formatted metadata as rich markup chunks"""
+        pass
+    
     def format(self, metadata: Dict[str, Any]) -> str:
         """Format the metadata into a rich string"""
-        pass
+        return "".join(self.iter_format(metadata))
     
     def _truncate_text(self, text: str, max_length: int = 100) -> str:
         """Truncate text if it's too long"""
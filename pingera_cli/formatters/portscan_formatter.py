@@ -2,37 +2,44 @@
 Port scan check result formatter
 """
 
-from typing import Dict, Any, List
+from collections import Counter
+from itertools import islice
+from typing import Dict, Any, Generator, List, Iterator
 from .base_formatter import BaseFormatter
 
 
 class PortscanFormatter(BaseFormatter):
     """Formatter for port scan check results"""
 
+    # Non-verbose limits: open ports listed per host and services summarized
+    # when the rest are collapsed
+    TOP_PORTS = 10
+    TOP_SERVICES = 5
+
     def can_format(self, metadata: Dict[str, Any]) -> bool:
         """Check if this is portscan metadata"""
         return 'scan_results' in metadata and 'summary' in metadata
 
-    def format(self, metadata: Dict[str, Any]) -> str:
+    def iter_format(self, metadata: Dict[str, Any]) -> Iterator[str]:
         """Format portscan check metadata"""
-        info = "\n[bold cyan]Port Scan Results:[/bold cyan]"
+        yield "\n[bold cyan]Port Scan Results:[/bold cyan]"
 
         # Target information
         if 'target' in metadata:
-            info += f"\n• Target: [white]{metadata['target']}[/white]"
+            yield f"\n• Target: [white]{metadata['target']}[/white]"
 
         # Execution details
         if 'execution_type' in metadata:
-            info += f"\n• Execution Type: [white]{metadata['execution_type']}[/white]"
+            yield f"\n• Execution Type: [white]{metadata['execution_type']}[/white]"
         if 'provider' in metadata:
-            info += f"\n• Provider: [white]{metadata['provider']}[/white]"
+            yield f"\n• Provider: [white]{metadata['provider']}[/white]"
         if 'region' in metadata:
-            info += f"\n• Region: [white]{metadata['region']}[/white]"
+            yield f"\n• Region: [white]{metadata['region']}[/white]"
 
         # Summary statistics
         if 'summary' in metadata:
             summary = metadata['summary']
-            info += "\n\n[bold cyan]Scan Summary:[/bold cyan]"
+            yield "\n\n[bold cyan]Scan Summary:[/bold cyan]"
 
             hosts_up = summary.get('hosts_up', 0)
             hosts_down = summary.get('hosts_down', 0)
@@ -40,60 +47,74 @@ class PortscanFormatter(BaseFormatter):
             total_ports = summary.get('total_open_ports', 0)
 
             hosts_up_color = "green" if hosts_up > 0 else "dim"
-            info += f"\n• Hosts Up: [{hosts_up_color}]{hosts_up}[/{hosts_up_color}] / [white]{total_hosts}[/white]"
+            yield f"\n• Hosts Up: [{hosts_up_color}]{hosts_up}[/{hosts_up_color}] / [white]{total_hosts}[/white]"
 
             if hosts_down > 0:
-                info += f"\n• Hosts Down: [red]{hosts_down}[/red]"
+                yield f"\n• Hosts Down: [red]{hosts_down}[/red]"
 
             ports_color = "green" if total_ports > 0 else "yellow"
-            info += f"\n• Total Open Ports: [{ports_color}]{total_ports}[/{ports_color}]"
+            yield f"\n• Total Open Ports: [{ports_color}]{total_ports}[/{ports_color}]"
 
         # Scan results for each host
+        has_truncation = False
         if 'scan_results' in metadata and metadata['scan_results']:
-            info += "\n\n[bold cyan]Host Details:[/bold cyan]"
+            yield "\n\n[bold cyan]Host Details:[/bold cyan]"
+
+            # In non-verbose mode hosts without open ports are collapsed into a count
+            collapsed_hosts = 0
 
             for host_result in metadata['scan_results']:
                 hostname = host_result.get('hostname', 'Unknown')
                 ip = host_result.get('ip', 'Unknown')
                 state = host_result.get('state', 'unknown')
+                open_ports = host_result.get('open_ports', [])
+
+                if not open_ports and not self.verbose:
+                    collapsed_hosts += 1
+                    continue
 
                 state_color = "green" if state == 'up' else "red"
-                info += f"\n\n[bold]Host:[/bold] [white]{hostname}[/white]"
+                yield f"\n\n[bold]Host:[/bold] [white]{hostname}[/white]"
                 if hostname != ip:
-                    info += f" ([white]{ip}[/white])"
-                info += f"\n• State: [{state_color}]{state.upper()}[/{state_color}]"
+                    yield f" ([white]{ip}[/white])"
+                yield f"\n• State: [{state_color}]{state.upper()}[/{state_color}]"
 
                 # Open ports
-                open_ports = host_result.get('open_ports', [])
                 if open_ports:
-                    info += f"\n• Open Ports: [green]{len(open_ports)}[/green]"
-                    info += self._format_open_ports(open_ports)
+                    yield f"\n• Open Ports: [green]{len(open_ports)}[/green]"
+                    if (yield from self._format_open_ports(open_ports)):
+                        has_truncation = True
                 else:
-                    info += "\n• Open Ports: [yellow]None detected[/yellow]"
+                    yield "\n• Open Ports: [yellow]None detected[/yellow]"
 
                 # OS detection
                 os_matches = host_result.get('os_matches', [])
                 if os_matches and self.verbose:
-                    info += self._format_os_matches(os_matches)
+                    yield from self._format_os_matches(os_matches)
+
+            if collapsed_hosts:
+                yield f"\n\n[dim]{collapsed_hosts} host(s) with no open ports hidden (use --verbose to list them)[/dim]"
 
         # Vulnerabilities
         if 'vulnerabilities' in metadata:
             vulns = metadata['vulnerabilities']
             if vulns:
-                info += "\n\n[bold red]Vulnerabilities:[/bold red]"
+                yield "\n\n[bold red]Vulnerabilities:[/bold red]"
                 for vuln in vulns:
-                    info += f"\n• [red]{vuln}[/red]"
+                    yield f"\n• [red]{vuln}[/red]"
             elif self.verbose:
-                info += "\n\n[bold green]Vulnerabilities:[/bold green]"
-                info += "\n• [green]No vulnerabilities detected[/green]"
+                yield "\n\n[bold green]Vulnerabilities:[/bold green]"
+                yield "\n• [green]No vulnerabilities detected[/green]"
 
-        return info
+        if has_truncation:
+            yield "\n\n" + self._get_truncation_notice(metadata.get('result_id'))
 
-    def _format_open_ports(self, ports: List[Dict[str, Any]]) -> str:
-        """Format open ports information"""
-        info = ""
+    def _format_open_ports(self, ports: List[Dict[str, Any]]) -> Generator[str, None, bool]:
+        """Format open ports information. Returns has_truncation"""
+        limit = None if self.verbose else self.TOP_PORTS
 
-        for port_info in ports:
+        # Only the ports that are displayed get formatted
+        for port_info in islice(ports, limit):
             port = port_info.get('port', '?')
             protocol = port_info.get('protocol', 'tcp')
             service = port_info.get('service', 'unknown')
@@ -102,26 +123,49 @@ class PortscanFormatter(BaseFormatter):
             extrainfo = port_info.get('extrainfo', '')
 
             # Build port display
-            info += f"\n  [green]•[/green] Port [cyan]{port}/{protocol}[/cyan] - [yellow]{service}[/yellow]"
+            yield f"\n  [green]•[/green] Port [cyan]{port}/{protocol}[/cyan] - [yellow]{service}[/yellow]"
 
             # Add product and version if available
             if product:
-                info += f" ([white]{product}"
-                if version:
-                    info += f" {version}"
-                info += "[/white])"
+                yield f" ([white]{product} {version}[/white])" if version else f" ([white]{product}[/white])"
             elif version:
-                info += f" ([white]{version}[/white])"
+                yield f" ([white]{version}[/white])"
 
             # Add extra info if available and verbose
             if extrainfo and self.verbose:
-                info += f"\n    [dim]{extrainfo}[/dim]"
-
-        return info
-
-    def _format_os_matches(self, os_matches: List[Dict[str, Any]]) -> str:
+                yield f"\n    [dim]{extrainfo}[/dim]"
+
+        if limit is None or len(ports) <= limit:
+            return False
+
+        # Summarize the hidden ports by service instead of listing them
+        hidden = ports[limit:]
+        services = Counter(port_info.get('service', 'unknown') for port_info in hidden)
+        top_services = ", ".join(f"{service} ({count})" for service, count in services.most_common(self.TOP_SERVICES))
+        yield f"\n  [dim]... and {len(hidden)} more open ports: {top_services}[/dim]"
+        if len(services) > self.TOP_SERVICES:
+            yield f"\n  [dim]  plus {len(services) - self.TOP_SERVICES} other service(s)[/dim]"
+        return True
+
+    def iter_port_records(self, metadata: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield one flat, machine-readable record per open port"""
+        for host_result in metadata.get('scan_results') or []:
+            for port_info in host_result.get('open_ports', []):
+                yield {
+                    'hostname': host_result.get('hostname'),
+                    'ip': host_result.get('ip'),
+                    'state': host_result.get('state'),
+                    'port': port_info.get('port'),
+                    'protocol': port_info.get('protocol', 'tcp'),
+                    'service': port_info.get('service'),
+                    'product': port_info.get('product') or None,
+                    'version': port_info.get('version') or None,
+                    'extrainfo': port_info.get('extrainfo') or None,
+                }
+
+    def _format_os_matches(self, os_matches: List[Dict[str, Any]]) -> Iterator[str]:
         """Format OS detection matches"""
-        info = "\n• OS Detection:"
+        yield "\n• OS Detection:"
 
         # Show top 3 matches
         for i, os_match in enumerate(os_matches[:3]):
@@ -129,19 +173,17 @@ class PortscanFormatter(BaseFormatter):
             accuracy = os_match.get('accuracy', 0)
 
             accuracy_color = "green" if accuracy >= 90 else "yellow" if accuracy >= 70 else "dim"
-            info += f"\n  [{accuracy_color}]{i+1}. {name} ({accuracy}% confidence)[/{accuracy_color}]"
+            yield f"\n  [{accuracy_color}]{i+1}. {name} ({accuracy}% confidence)[/{accuracy_color}]"
 
         if len(os_matches) > 3:
-            info += f"\n  [dim]... and {len(os_matches) - 3} more matches[/dim]"
+            yield f"\n  [dim]... and {len(os_matches) - 3} more matches[/dim]"
 
-        return info
-
-    def _format_port_results(self, results: list) -> str:
+    def _format_port_results(self, results: list) -> Iterator[str]:
         """Format port scan results"""
         if not results:
-            return ""
+            return
 
-        info = "\n\n[bold cyan]Port Scan Results:[/bold cyan]"
+        yield "\n\n[bold cyan]Port Scan Results:[/bold cyan]"
 
         # Group by status
         open_ports = [r for r in results if r.get('status') == 'open']
@@ -149,26 +191,24 @@ class PortscanFormatter(BaseFormatter):
         filtered_ports = [r for r in results if r.get('status') == 'filtered']
 
         if open_ports:
-            info += "\n\n[green]Open Ports:[/green]"
+            yield "\n\n[green]Open Ports:[/green]"
             # In non-verbose mode, show first 10 open ports
             display_ports = open_ports if self.verbose else open_ports[:10]
             for port in display_ports:
                 port_num = port.get('port', 'Unknown')
                 service = port.get('service', 'unknown')
-                info += f"\n• Port {port_num}: [green]{service}[/green]"
+                yield f"\n• Port {port_num}: [green]{service}[/green]"
 
             if not self.verbose and len(open_ports) > 10:
-                info += f"\n[dim]... and {len(open_ports) - 10} more open ports[/dim]"
-                info += "\n\n[dim]💡 Some details truncated. Use --verbose flag or view full results at:[/dim]"
-                info += "\n[dim]   https://app.pingera.ru (navigate to the job ID from your check execution)[/dim]"
+                yield f"\n[dim]... and {len(open_ports) - 10} more open ports[/dim]"
+                yield "\n\n[dim]💡 Some details truncated. Use --verbose flag or view full results at:[/dim]"
+                yield "\n[dim]   https://app.pingera.ru (navigate to the job ID from your check execution)[/dim]"
 
         if closed_ports and self.verbose:
-            info += f"\n\n[red]Closed Ports:[/red] {len(closed_ports)} ports"
+            yield f"\n\n[red]Closed Ports:[/red] {len(closed_ports)} ports"
 
         if filtered_ports and self.verbose:
-            info += f"\n\n[yellow]Filtered Ports:[/yellow] {len(filtered_ports)} ports"
-
-        return info
+            yield f"\n\n[yellow]Filtered Ports:[/yellow] {len(filtered_ports)} ports"
 
     def _get_truncation_notice(self, result_id: str) -> str:
         """
@@ -3,7 +3,7 @@
 Formatter registry for managing different check result formatters
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator
 from .base_formatter import BaseFormatter
 from .ssl_formatter import SSLFormatter
 from .synthetic_formatter import SyntheticFormatter
@@ -33,9 +33,30 @@ class FormatterRegistry:
     
     def format_metadata(self, metadata: Dict[str, Any]) -> str:
         """Format metadata using the appropriate formatter"""
+        return "".join(self.iter_metadata(metadata))
+    
+    def iter_metadata(self, metadata: Dict[str, Any]) -> Iterator[str]:
+        """Yield formatted metadata chunks from the appropriate formatter"""
         for formatter in self.formatters:
             if formatter.can_format(metadata):
-                return formatter.format(metadata)
+                return formatter.iter_format(metadata)
         
         # This should never happen since GenericFormatter can handle anything
-        return "\n[bold cyan]Check Metadata:[/bold cyan]\n• [dim]No formatter available[/dim]"
+        return iter(["\n[bold cyan]Check Metadata:[/bold cyan]\n• [dim]No formatter available[/dim]"])
+    
+    def iter_lines(self, metadata: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield formatted metadata one printable line at a time.
+        
+        Formatters emit chunks that start a new line with a leading newline and
+        may append to the current line otherwise; chunks are grouped so every
+        yielded line carries balanced markup and can be printed on its own.
+        """
+        line = []
+        for chunk in self.iter_metadata(metadata):
+            if chunk.startswith("\n") and line:
+                yield "".join(line)
+                line = []
+            line.append(chunk[1:] if not line and chunk.startswith("\n") else chunk)
+        if line:
+            yield "".join(line)
@@ -0,0 +1,162 @@
+"""
+Thin pngr launcher that forwards invocations to a running daemon
+
+This module must stay importable without Typer, Rich or the Pingera SDK: it is
+the console script entry point, and the point of the daemon is to skip those
+imports. If no daemon is listening, the CLI runs in-process as usual.
+"""
+
+import io
+import json
+import os
+import shutil
+import socket
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Environment forwarded to the daemon for each request
+FORWARDED_ENV_PREFIXES = ('PINGERA_', 'PNGR_')
+FORWARDED_ENV_KEYS = ('XDG_CONFIG_HOME', 'NO_COLOR', 'TERM', 'TRACEPARENT')
+
+CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_path() -> Path:
+    """
+    Get the path of the daemon Unix socket
+
+    Returns:
+        Path: PNGR_DAEMON_SOCKET if set, otherwise daemon.sock in the config directory
+    """
+    override = os.getenv('PNGR_DAEMON_SOCKET')
+    if override:
+        return Path(override)
+
+    config_dir = os.getenv('XDG_CONFIG_HOME')
+    if config_dir:
+        return Path(config_dir) / 'pingera-cli' / 'daemon.sock'
+    return Path.home() / '.config' / 'pingera-cli' / 'daemon.sock'
+
+
+def connect(socket_path: Optional[Path] = None) -> Optional[socket.socket]:
+    """Connect to the daemon, returning None if it is not running"""
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    path = socket_path or get_socket_path()
+    if not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def send_message(sock: socket.socket, message: Dict) -> None:
+    """Send one newline-delimited JSON message"""
+    sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+def iter_messages(sock: socket.socket):
+    """Yield newline-delimited JSON messages until the connection closes"""
+    with sock.makefile('r', encoding='utf-8') as stream:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_request(argv: List[str]) -> Dict:
+    """Build a run request describing this invocation"""
+    env = {
+        key: value for key, value in os.environ.items()
+        if key.startswith(FORWARDED_ENV_PREFIXES) or key in FORWARDED_ENV_KEYS
+    }
+    # stdin is only forwarded when a command explicitly reads it via '-',
+    # so a caller's pipe is never drained by accident
+    stdin = sys.stdin.read() if '-' in argv else ''
+    return {
+        'argv': argv,
+        'cwd': os.getcwd(),
+        'env': env,
+        'width': shutil.get_terminal_size().columns,
+        'stdin': stdin,
+    }
+
+
+def should_use_daemon(argv: List[str]) -> bool:
+    """Decide whether this invocation may be forwarded to the daemon"""
+    if os.getenv('PNGR_NO_DAEMON'):
+        return False
+    # Daemon management always runs locally
+    if argv and argv[0] == 'daemon':
+        return False
+    # Interactive sessions run in-process so prompts and pagers keep working
+    if sys.stdin is None or sys.stdin.isatty():
+        return False
+    return True
+
+
+def run_via_daemon(argv: List[str]) -> Optional[int]:
+    """
+    Run a CLI invocation in the daemon, streaming its output
+
+    Returns:
+        Optional[int]: Exit code, or None if no daemon is available
+    """
+    sock = connect()
+    if sock is None:
+        return None
+
+    request = build_request(argv)
+    received = False
+    with sock:
+        try:
+            send_message(sock, {'run': request})
+            for message in iter_messages(sock):
+                received = True
+                if 'exit' in message:
+                    return int(message['exit'])
+                stream = sys.stderr if message.get('stream') == 'stderr' else sys.stdout
+                try:
+                    stream.write(message.get('data', ''))
+                    stream.flush()
+                except BrokenPipeError:
+                    # Our reader went away (e.g. piped into head)
+                    return 1
+        except (OSError, ValueError):
+            pass
+
+    if received:
+        sys.stderr.write("pngr: lost connection to the daemon\n")
+        return 1
+
+    # Nothing was run remotely; hand any consumed stdin back for the local run
+    if '-' in argv:
+        sys.stdin = io.StringIO(request['stdin'])
+    return None
+
+
+def main():
+    """Console script entry point"""
+    argv = sys.argv[1:]
+    if should_use_daemon(argv):
+        try:
+            exit_code = run_via_daemon(argv)
+        except KeyboardInterrupt:
+            sys.exit(130)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from .main import cli_entry_point
+    cli_entry_point()
+
+
+if __name__ == '__main__':
+    main()
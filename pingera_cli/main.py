@@ -12,12 +12,15 @@ from rich.panel import Panel
 from rich.text import Text
 
 from . import __version__
+from .utils import trace as _trace  # imported first so CLI startup time can be traced
 from .commands.base import BaseCommand
 from .commands.auth import auth_cmd
 from .commands.checks import app as checks_app
 from .commands.secrets import app as secrets_app
 from .commands.pages import app as pages_app
 from .commands.on_demand_checks import app as on_demand_app
+from .commands.daemon import app as daemon_app
+from .utils.bulk import DEFAULT_CONCURRENCY, MAX_CONCURRENCY
 from .utils.console import console, error_console
 from .utils.config import get_config
 
@@ -38,6 +41,7 @@ app.add_typer(auth_cmd.app, name="auth")
 app.add_typer(checks_app, name="checks")
 app.add_typer(secrets_app, name="secrets")
 app.add_typer(pages_app, name="pages")
+app.add_typer(daemon_app, name="daemon")
 
 
 # Quick command aliases (separate help section)
@@ -262,6 +266,48 @@ def multistep_alias(
     )
 
 
+@app.command("shell")
+def shell():
+    """
+    Start an interactive shell that reuses one session across commands
+    """
+    from .commands.shell import ShellCommand
+    from .utils.config import get_output_format, get_verbose_mode
+
+    shell_cmd = ShellCommand(get_output_format(), verbose=get_verbose_mode())
+    shell_cmd.run()
+
+
+@app.command("export")
+def export_snapshot(
+    path: Optional[str] = typer.Argument(None, help="Snapshot to write: a .tar file or a directory (default: pngr-snapshot-<timestamp>.tar)"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of API requests in flight"),
+    compression: str = typer.Option("gzip", "--compression", help="Compression of the NDJSON files: gzip, zstd (needs the zstandard package) or none"),
+):
+    """
+    Export checks, groups, secret associations, status pages, components and incidents to a snapshot
+    """
+    from .commands.snapshot import SnapshotCommand
+    from .utils.config import get_output_format
+
+    SnapshotCommand(get_output_format()).export_snapshot(path, concurrency, compression)
+
+
+@app.command("import")
+def import_snapshot(
+    path: str = typer.Argument(..., help="Snapshot written by 'pngr export'"),
+    confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
+    concurrency: int = typer.Option(DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, max=MAX_CONCURRENCY, help="Maximum number of API requests in flight"),
+):
+    """
+    Recreate the resources of a snapshot in the current account
+    """
+    from .commands.snapshot import SnapshotCommand
+    from .utils.config import get_output_format
+
+    SnapshotCommand(get_output_format()).import_snapshot(path, confirm, concurrency)
+
+
 @app.command("version")
 def version():
     """
@@ -332,13 +378,13 @@ Run [cyan]pngr --help[/cyan] to see available commands.
 def config(
     show: bool = typer.Option(False, "--show", "-s", help="Show current configuration"),
     set_api_key: Optional[str] = typer.Option(None, "--api-key", help="Set Pingera API key"),
-    set_output_format: Optional[str] = typer.Option(None, "--output-format", help="Set output format (table, json, yaml)"),
+    set_output_format: Optional[str] = typer.Option(None, "--output-format", help="Set output format (table, json, yaml, csv, tsv)"),
     set_base_url: Optional[str] = typer.Option(None, "--base-url", help="Set Pingera API base URL"),
 ):
     """
     Manage pngr configuration
     """
-    from .utils.config import set_output_format as save_output_format, get_config, save_config
+    from .utils.config import OUTPUT_FORMATS, set_output_format as save_output_format, get_config, save_config
 
     if set_api_key:
         # In a real implementation, this would save to a config file
@@ -347,13 +393,13 @@ def config(
         return
 
     if set_output_format:
-        if set_output_format in ['table', 'json', 'yaml']:
+        if set_output_format in OUTPUT_FORMATS:
             if save_output_format(set_output_format):
                 console.print(f"[green]✓[/green] Output format set to: {set_output_format}")
             else:
                 console.print(f"[red]✗[/red] Failed to save output format")
         else:
-            console.print(f"[red]✗[/red] Invalid output format. Use: table, json, or yaml")
+            console.print(f"[red]✗[/red] Invalid output format. Use: {', '.join(OUTPUT_FORMATS)}")
         return
 
     if set_base_url:
@@ -401,7 +447,14 @@ def main(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-V", help="Show version and exit"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
-    output: str = typer.Option("table", "--output", "-o", help="Output format: table, json, yaml"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format: table, json, yaml, csv, tsv"),
+    timeout: Optional[float] = typer.Option(None, "--timeout", help="Overall time limit for the command in seconds (default: command_timeout from config)"),
+    trace: bool = typer.Option(False, "--trace", help="Print a timing summary (startup, config, API calls, rendering) to stderr"),
+    trace_file: Optional[str] = typer.Option(None, "--trace-file", help="Write the timing summary as JSON to this file"),
+    otlp_file: Optional[str] = typer.Option(None, "--otlp-file", envvar="PNGR_OTLP_FILE", help="Append the command's spans in OTLP/JSON to this file"),
+    otlp_endpoint: Optional[str] = typer.Option(None, "--otlp-endpoint", envvar="PNGR_OTLP_ENDPOINT", help="Send the command's spans to an OTLP/HTTP collector (e.g. http://localhost:4318)"),
+    profile: bool = typer.Option(False, "--profile", help="Profile the command, writing pstats and flamegraph (collapsed stack) files"),
+    profile_output: Optional[str] = typer.Option(None, "--profile-output", help="Base path for --profile files (default: ./pngr-profile)"),
 ):
     """
     🚀 pngr - a nice CLI for Pingera platform
@@ -415,6 +468,10 @@ def main(
 
     Built with ❤️ using Typer and Rich for the best CLI experience.
     """
+    # Start the command deadline (always reset: the shell and daemon run many commands per process)
+    from .utils.client import set_deadline
+    set_deadline(timeout if timeout is not None else get_config().get('command_timeout'))
+
     if version:
         console.print(f"[bold blue]PingeraCLI[/bold blue] v{__version__}")
         raise typer.Exit()
@@ -424,6 +481,12 @@ def main(
         console.print(ctx.get_help())
         raise typer.Exit()
 
+    if trace or trace_file or otlp_file or otlp_endpoint:
+        _start_trace(ctx, print_summary=trace, trace_file=trace_file, otlp_file=otlp_file, otlp_endpoint=otlp_endpoint)
+
+    if profile or profile_output:
+        _start_profile(ctx, profile_output)
+
     if verbose:
         console.print("[dim]Verbose mode enabled[/dim]")
 
@@ -433,11 +496,81 @@ def main(
     set_verbose_mode(verbose)
 
 
+def _start_trace(ctx: typer.Context, print_summary: bool, trace_file: Optional[str],
+                 otlp_file: Optional[str] = None, otlp_endpoint: Optional[str] = None):
+    """Trace the invoked command and report or export it when its context closes"""
+    _trace.start_tracing(_trace.command_name(ctx.invoked_subcommand))
+
+    def finish():
+        tracer = _trace.stop_tracing()
+        if tracer is None:
+            return
+        summary = tracer.summary()
+
+        if print_summary:
+            _trace.render_summary(summary, error_console)
+        if trace_file:
+            import json
+            try:
+                with open(trace_file, 'w') as f:
+                    json.dump(summary, f, indent=2, default=str)
+            except OSError as e:
+                error_console.print(f"[red]Failed to write trace file:[/red] {str(e)}")
+
+        if otlp_file or otlp_endpoint:
+            from .utils.otlp import build_export_request, send_export_request, write_export_request
+            export_request = build_export_request(tracer)
+            if otlp_file:
+                try:
+                    write_export_request(export_request, otlp_file)
+                except OSError as e:
+                    error_console.print(f"[red]Failed to write OTLP file:[/red] {str(e)}")
+            if otlp_endpoint:
+                try:
+                    send_export_request(export_request, otlp_endpoint)
+                except (OSError, ValueError) as e:
+                    error_console.print(f"[yellow]⚠ Could not export spans to {otlp_endpoint}: {str(e)}[/yellow]")
+
+    ctx.call_on_close(finish)
+
+
+def _start_profile(ctx: typer.Context, output: Optional[str]):
+    """Profile the invoked command and write the results when its context closes"""
+    from .utils.profiling import CommandProfiler
+
+    profiler = CommandProfiler(output)
+
+    def finish():
+        try:
+            pstats_path, collapsed_path = profiler.stop()
+        except OSError as e:
+            error_console.print(f"[red]Failed to write profile:[/red] {str(e)}")
+            return
+
+        from rich.table import Table
+        table = Table(title=f"🔬 Profile ({profiler.elapsed * 1000:.0f} ms, top functions by cumulative time)", title_justify='left')
+        table.add_column("Function", style="cyan")
+        table.add_column("Calls", justify="right")
+        table.add_column("Own (ms)", justify="right")
+        table.add_column("Cumulative (ms)", justify="right", style="white")
+        for label, calls, own, cumulative in profiler.top_functions():
+            table.add_row(label, str(calls), f"{own * 1000:.1f}", f"{cumulative * 1000:.1f}")
+        error_console.print(table)
+        error_console.print(
+            f"[dim]pstats: {pstats_path} (python -m pstats {pstats_path})\n"
+            f"Collapsed stacks: {collapsed_path} (flamegraph.pl, speedscope or inferno)[/dim]"
+        )
+
+    ctx.call_on_close(finish)
+    profiler.start()
+
+
 def cli_entry_point():
     """
     Entry point for the CLI application
     """
     try:
+        _trace.set_invocation_args(sys.argv[1:])
         app()
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠ Operation cancelled by user[/yellow]")
@@ -0,0 +1,326 @@
+"""
+Streamed, compressed archives of NDJSON records
+
+An archive holds one compressed NDJSON file per resource type plus a
+manifest.json with record counts and SHA-256 checksums. It is either a
+directory or, for paths ending in '.tar', a tar file with the manifest first.
+
+Records are compressed as they are written and decompressed as they are read,
+so memory use does not grow with the size of the export. Tar archives stage
+their members in a temporary directory next to the target, since tar needs
+each member's size before its data.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+ARCHIVE_FORMAT = 'pngr-archive'
+ARCHIVE_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# Compression name -> member file suffix
+COMPRESSIONS = {
+    'gzip': '.ndjson.gz',
+    'zstd': '.ndjson.zst',
+    'none': '.ndjson',
+}
+
+# Buffer size for checksumming members
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _zstandard():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise ValueError("zstd compression requires the zstandard package. Install with: pip install zstandard")
+
+
+def is_archive(path: str) -> bool:
+    """Check if a path is an archive written by ArchiveWriter"""
+    if os.path.isdir(path):
+        return os.path.exists(os.path.join(path, MANIFEST_NAME))
+    return path.endswith('.tar') and os.path.isfile(path)
+
+
+class _HashingWriter(io.RawIOBase):
+    """Write to a file while hashing and counting the bytes"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.raw.write(data)
+        self.sha256.update(data)
+        self.size += len(data)
+        return len(data)
+
+
+class _MemberWriter:
+    """One resource's compressed NDJSON stream"""
+
+    def __init__(self, path: str, compression: str):
+        self.file = open(path, 'wb')
+        self.hashing = _HashingWriter(self.file)
+        if compression == 'gzip':
+            self.stream = gzip.GzipFile(fileobj=self.hashing, mode='wb', mtime=0)
+        elif compression == 'zstd':
+            self.stream = _zstandard().ZstdCompressor().stream_writer(self.hashing, closefd=False)
+        else:
+            self.stream = self.hashing
+        self.count = 0
+
+    def write(self, record: Dict[str, Any]):
+        self.stream.write((json.dumps(record, default=str, separators=(',', ':')) + '\n').encode('utf-8'))
+        self.count += 1
+
+    def close(self):
+        if self.stream is not self.hashing:
+            self.stream.close()
+        self.file.close()
+
+
+class ArchiveWriter:
+    """
+    Write records of several resource types into an archive
+
+    Use as a context manager; the manifest is written (and a tar assembled)
+    on a clean exit, and partial output is removed if an exception escapes.
+    Writes are thread-safe, so concurrent fetches can stream into one archive.
+    """
+
+    def __init__(self, path: str, compression: str = 'gzip', resources: Iterable[str] = (), metadata: Optional[Dict[str, Any]] = None):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}'. Use one of: {', '.join(COMPRESSIONS)}")
+        if compression == 'zstd':
+            _zstandard()
+
+        self.path = path
+        self.compression = compression
+        self.metadata = dict(metadata or {})
+        self.is_tar = path.endswith('.tar')
+        self._resources: List[str] = list(resources)
+        self._members: Dict[str, _MemberWriter] = {}
+        self._lock = threading.Lock()
+
+        if self.is_tar:
+            self._dir = tempfile.mkdtemp(prefix='.pngr-archive-', dir=os.path.dirname(os.path.abspath(path)))
+        else:
+            os.makedirs(path, exist_ok=True)
+            self._dir = path
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _member(self, resource: str) -> _MemberWriter:
+        member = self._members.get(resource)
+        if member is None:
+            member = _MemberWriter(os.path.join(self._dir, resource + COMPRESSIONS[self.compression]), self.compression)
+            self._members[resource] = member
+            if resource not in self._resources:
+                self._resources.append(resource)
+        return member
+
+    def write(self, resource: str, record: Dict[str, Any]):
+        """Append one record to a resource's stream"""
+        with self._lock:
+            self._member(resource).write(record)
+
+    def write_many(self, resource: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Append records to a resource's stream, returning how many were written"""
+        with self._lock:
+            member = self._member(resource)
+            before = member.count
+            for record in records:
+                member.write(record)
+            return member.count - before
+
+    def counts(self) -> Dict[str, int]:
+        """Records written so far per resource"""
+        with self._lock:
+            return {resource: self._members[resource].count if resource in self._members else 0 for resource in self._resources}
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish all streams and write the manifest
+
+        Returns:
+            Dict[str, Any]: The manifest
+        """
+        with self._lock:
+            for resource in self._resources:
+                self._member(resource)
+            for member in self._members.values():
+                member.close()
+
+            manifest = {
+                'format': ARCHIVE_FORMAT,
+                'version': ARCHIVE_VERSION,
+                'created_at': datetime.now().astimezone().isoformat(),
+                'compression': self.compression,
+                'metadata': self.metadata,
+                'resources': {
+                    resource: {
+                        'file': resource + COMPRESSIONS[self.compression],
+                        'count': self._members[resource].count,
+                        'bytes': self._members[resource].hashing.size,
+                        'sha256': self._members[resource].hashing.sha256.hexdigest(),
+                    }
+                    for resource in self._resources
+                },
+            }
+            with open(os.path.join(self._dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+                f.write('\n')
+
+            if self.is_tar:
+                try:
+                    with tarfile.open(self.path, 'w') as tar:
+                        tar.add(os.path.join(self._dir, MANIFEST_NAME), arcname=MANIFEST_NAME)
+                        for entry in manifest['resources'].values():
+                            tar.add(os.path.join(self._dir, entry['file']), arcname=entry['file'])
+                finally:
+                    shutil.rmtree(self._dir, ignore_errors=True)
+            return manifest
+
+    def abort(self):
+        """Close the streams and remove what was written"""
+        with self._lock:
+            for member in self._members.values():
+                try:
+                    member.close()
+                except Exception:
+                    pass
+            if self.is_tar:
+                shutil.rmtree(self._dir, ignore_errors=True)
+            else:
+                for member in self._members.values():
+                    try:
+                        os.remove(member.file.name)
+                    except OSError:
+                        pass
+
+
+class ArchiveReader:
+    """
+    Stream records back out of an archive
+
+    Raises:
+        ValueError: If the path is not an archive this version can read
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tar: Optional[tarfile.TarFile] = None
+
+        try:
+            if os.path.isdir(path):
+                with open(os.path.join(path, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            else:
+                self._tar = tarfile.open(path, 'r:')
+                manifest_file = self._tar.extractfile(MANIFEST_NAME)
+                manifest = json.load(manifest_file)
+        except (OSError, KeyError, tarfile.TarError, json.JSONDecodeError) as e:
+            self.close()
+            raise ValueError(f"{path} is not a pngr archive: {e}")
+
+        if manifest.get('format') != ARCHIVE_FORMAT:
+            self.close()
+            raise ValueError(f"{path} is not a pngr archive")
+        if manifest.get('version', 0) > ARCHIVE_VERSION:
+            self.close()
+            raise ValueError(f"{path} was written by a newer pngr (archive version {manifest['version']}); upgrade to read it")
+        self.manifest = manifest
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.manifest.get('metadata') or {}
+
+    def count(self, resource: str) -> int:
+        """Number of records of a resource, from the manifest"""
+        return (self.manifest['resources'].get(resource) or {}).get('count', 0)
+
+    def _open_member(self, name: str):
+        if self._tar is not None:
+            return self._tar.extractfile(name)
+        return open(os.path.join(self.path, name), 'rb')
+
+    def records(self, resource: str) -> Iterator[Dict[str, Any]]:
+        """Yield a resource's records one at a time; nothing if it is not in the archive"""
+        entry = self.manifest['resources'].get(resource)
+        if not entry:
+            return
+
+        raw = self._open_member(entry['file'])
+        try:
+            compression = self.manifest.get('compression', 'gzip')
+            if compression == 'gzip':
+                stream = gzip.GzipFile(fileobj=raw, mode='rb')
+            elif compression == 'zstd':
+                stream = _zstandard().ZstdDecompressor().stream_reader(raw, closefd=False)
+            else:
+                stream = raw
+
+            for line in io.TextIOWrapper(io.BufferedReader(stream) if compression == 'zstd' else stream, encoding='utf-8'):
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            raw.close()
+
+    def verify(self) -> List[str]:
+        """
+        Check every member against the manifest checksums
+
+        Returns:
+            List[str]: Problems found (empty if the archive is intact)
+        """
+        problems = []
+        for resource, entry in self.manifest['resources'].items():
+            try:
+                raw = self._open_member(entry['file'])
+            except (OSError, KeyError):
+                problems.append(f"{resource}: {entry['file']} is missing")
+                continue
+
+            sha256 = hashlib.sha256()
+            with raw:
+                for chunk in iter(lambda: raw.read(_CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+            if sha256.hexdigest() != entry.get('sha256'):
+                problems.append(f"{resource}: checksum mismatch in {entry['file']}")
+        return problems
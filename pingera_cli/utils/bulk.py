@@ -0,0 +1,135 @@
+"""
+Bulk operations over many resources
+
+Runs one API call per item on a bounded thread pool. The workers share the
+pooled API client, so its connection pool and rate limiter also bound the
+request rate, and failures are collected per item instead of stopping the run.
+"""
+
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List, Optional, Tuple
+
+DEFAULT_CONCURRENCY = 8
+MAX_CONCURRENCY = 32
+
+# Placeholder ID argument meaning "read IDs from stdin"
+STDIN_MARKER = '-'
+
+
+def read_ids(ids: Optional[Iterable[str]], stream=None) -> Tuple[List[str], bool]:
+    """
+    Expand ID arguments, reading IDs from stdin in place of '-'
+
+    Stdin may hold one or more whitespace-separated IDs per line; blank lines
+    and '#' comments are skipped. Duplicates are dropped, keeping order.
+
+    Args:
+        ids: ID arguments from the command line
+        stream: Stream to read for '-' (default: stdin)
+
+    Returns:
+        Tuple[List[str], bool]: The IDs, and whether stdin was read
+    """
+    result: List[str] = []
+    used_stdin = False
+    for item in ids or []:
+        if item != STDIN_MARKER:
+            result.append(item)
+            continue
+        if used_stdin:
+            continue
+        used_stdin = True
+        for line in (stream or sys.stdin):
+            result.extend(line.split('#', 1)[0].split())
+    return list(dict.fromkeys(result)), used_stdin
+
+
+def compile_name_pattern(pattern: Optional[str]) -> Optional['re.Pattern']:
+    """
+    Compile a --name regular expression (case-insensitive, matched anywhere)
+
+    Raises:
+        ValueError: If the pattern is not a valid regular expression
+    """
+    if not pattern:
+        return None
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid --name pattern '{pattern}': {e}")
+
+
+def error_message(error: BaseException) -> str:
+    """Shorten an exception to one line for the failure report"""
+    status = getattr(error, 'status', None)
+    reason = getattr(error, 'reason', None)
+    if status is not None and reason:
+        return f"HTTP {status}: {reason}"
+    message = str(error).strip().splitlines()
+    return message[0] if message else type(error).__name__
+
+
+def run_concurrently(
+    items: List[Tuple[str, str]],
+    operation: Callable[[str], object],
+    description: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    console=None,
+    show_progress: bool = True,
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str, str]]]:
+    """
+    Run an operation for every item with at most `concurrency` in flight
+
+    Args:
+        items: (id, label) pairs; the operation is called with the id
+        operation: Function performing the API call for one id
+        description: Progress bar description
+        concurrency: Maximum number of concurrent operations
+        console: Console to draw the progress bar on
+        show_progress: Whether to draw a progress bar
+
+    Returns:
+        Tuple: Succeeded (id, label) pairs and failed (id, label, error) triples, in input order
+    """
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    order = {item_id: index for index, (item_id, _) in enumerate(items)}
+    succeeded: List[Tuple[str, str]] = []
+    failed: List[Tuple[str, str, str]] = []
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+        disable=not show_progress,
+    )
+    executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, MAX_CONCURRENCY)), thread_name_prefix='pngr-bulk')
+    futures = {}
+    try:
+        with progress:
+            task = progress.add_task(description, total=len(items))
+            for item_id, label in items:
+                futures[executor.submit(operation, item_id)] = (item_id, label)
+            for future in as_completed(futures):
+                item_id, label = futures[future]
+                error = future.exception()
+                if error is None:
+                    succeeded.append((item_id, label))
+                else:
+                    failed.append((item_id, label, error_message(error)))
+                progress.advance(task)
+    finally:
+        # On Ctrl+C, drop the queued operations; the ones in flight finish
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+    succeeded.sort(key=lambda item: order[item[0]])
+    failed.sort(key=lambda item: order[item[0]])
+    return succeeded, failed
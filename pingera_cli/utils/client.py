@@ -0,0 +1,346 @@
+"""
+Shared Pingera SDK client factory
+"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .config import get_config
+from .trace import get_tracer, span
+
+DEFAULT_BASE_URL = 'https://api.pingera.ru'
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+# Retry policy: exponential backoff (0.5s, 1s, 2s, ... capped) with jitter on
+# connection errors and these statuses; Retry-After is honored up to a cap
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_MAX = 20.0
+RETRY_BACKOFF_JITTER = 0.5
+RETRY_AFTER_MAX = 60.0
+
+# One ApiClient per (api_key, base_url, policy) so every API class shares the
+# same urllib3 connection pool within a process (and across daemon requests)
+_clients: Dict[Tuple[Any, ...], Any] = {}
+_clients_lock = threading.Lock()
+
+# Requests per account are throttled process-wide, across clients and threads
+_rate_limiters: Dict[float, 'TokenBucket'] = {}
+
+# Monotonic time by which the current command must finish, if any
+_deadline: Optional[float] = None
+_deadline_seconds: Optional[float] = None
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an API call would start after the command deadline"""
+
+    def __init__(self, seconds: float):
+        super().__init__(f"Command timed out after {seconds:g}s")
+        self.seconds = seconds
+
+
+def set_deadline(seconds: Optional[float]):
+    """
+    Set the overall deadline for the current command
+
+    Args:
+        seconds: Time budget from now, or None to remove the deadline
+    """
+    global _deadline, _deadline_seconds
+    _deadline_seconds = seconds
+    _deadline = time.monotonic() + seconds if seconds else None
+
+
+def time_remaining() -> Optional[float]:
+    """Get the seconds left before the command deadline, or None if unbounded"""
+    if _deadline is None:
+        return None
+    return max(0.0, _deadline - time.monotonic())
+
+
+def request_timeout(connect_timeout: float, read_timeout: float) -> Tuple[float, float]:
+    """
+    Get the (connect, read) timeouts for the next request, bounded by the deadline
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    remaining = time_remaining()
+    if remaining is None:
+        return (connect_timeout, read_timeout)
+    _check_deadline()
+    return (min(connect_timeout, remaining), min(read_timeout, remaining))
+
+
+def _check_deadline():
+    """Raise DeadlineExceeded if the command deadline has passed"""
+    remaining = time_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded(_deadline_seconds)
+
+
+def _within_deadline(seconds: float) -> float:
+    """Cap a wait at the time left before the command deadline"""
+    remaining = time_remaining()
+    return seconds if remaining is None else min(seconds, remaining)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the request rate
+
+    Holds up to `capacity` tokens, refilled at `rate` tokens per second; each
+    request takes one token, waiting for it if the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def build_retry(retries: int):
+    """
+    Build the urllib3 retry policy used by every API client
+
+    Only idempotent methods are retried, except on 429 where the server
+    rejected the request without processing it. The final failed response is
+    returned rather than raised, so commands still get the SDK's ApiException.
+
+    Retries happen inside a single urllib3 call, so the sleeps between them
+    (backoff and Retry-After) are capped at the time left before the command
+    deadline, and retrying stops with DeadlineExceeded once it has passed.
+
+    Args:
+        retries: Maximum number of retries per request (0 disables retrying)
+
+    Returns:
+        urllib3.util.Retry: Retry policy
+    """
+    from urllib3.util import Retry
+
+    class _PingeraRetry(Retry):
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+            if status_code == 429 and self.total:
+                return True
+            return super().is_retry(method, status_code, has_retry_after)
+
+        def get_retry_after(self, response) -> Optional[float]:
+            retry_after = super().get_retry_after(response)
+            return _within_deadline(min(retry_after, RETRY_AFTER_MAX)) if retry_after is not None else None
+
+        def get_backoff_time(self) -> float:
+            return _within_deadline(super().get_backoff_time())
+
+        def sleep(self, response=None):
+            _check_deadline()
+            super().sleep(response)
+            _check_deadline()
+
+    return _PingeraRetry(
+        total=retries,
+        redirect=0,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=RETRY_BACKOFF_MAX,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        respect_retry_after_header=True,
+        raise_on_redirect=False,
+        raise_on_status=False,
+    )
+
+
+def get_rate_limiter(rate_limit: Optional[float]) -> Optional[TokenBucket]:
+    """Get the shared token bucket for a rate limit, or None if unlimited"""
+    if not rate_limit or rate_limit <= 0:
+        return None
+
+    with _clients_lock:
+        limiter = _rate_limiters.get(rate_limit)
+        if limiter is None:
+            limiter = TokenBucket(rate_limit)
+            _rate_limiters[rate_limit] = limiter
+    return limiter
+
+
+def _apply_request_policy(rest_client, limiter: Optional[TokenBucket], connect_timeout: float, read_timeout: float):
+    """Make every request of a REST client wait for a rate limit token and carry timeouts"""
+    request = rest_client.request
+
+    def policy_request(method, url, *args, **kwargs):
+        if kwargs.get('_request_timeout') is None:
+            kwargs['_request_timeout'] = request_timeout(connect_timeout, read_timeout)
+
+        tracer = get_tracer()
+        if tracer is None:
+            if limiter:
+                limiter.acquire()
+            return request(method, url, *args, **kwargs)
+
+        with tracer.span('api', f"{method} {urlsplit(url).path}", method=method, endpoint=urlsplit(url).path) as record:
+            attributes = record['attributes']
+            if limiter:
+                wait_start = time.perf_counter()
+                limiter.acquire()
+                attributes['throttle_ms'] = round((time.perf_counter() - wait_start) * 1000, 2)
+
+            start = time.perf_counter()
+            response = request(method, url, *args, **kwargs)
+            headers_at = time.perf_counter()
+
+            # Read the body now (the SDK reuses it) to split TTFB from transfer time
+            body = response.read()
+            attributes['status'] = response.status
+            attributes['bytes'] = len(body or b'')
+            attributes['body_ms'] = round((time.perf_counter() - headers_at) * 1000, 2)
+            setup_ms = (attributes.get('connect_ms') or 0) + (attributes.get('tls_ms') or 0)
+            attributes['ttfb_ms'] = round(max(0.0, (headers_at - start) * 1000 - setup_ms), 2)
+
+            retries = getattr(response.response, 'retries', None)
+            if retries is not None and retries.history:
+                attributes['retries'] = len(retries.history)
+            return response
+
+    rest_client.request = policy_request
+
+
+@lru_cache(maxsize=None)
+def _timed_pool_classes() -> Dict[str, Any]:
+    """urllib3 pool classes whose connections report connect/TLS time to the tracer"""
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def record(name: str, start: float) -> float:
+        elapsed = (time.perf_counter() - start) * 1000
+        tracer = get_tracer()
+        current = tracer.current() if tracer else None
+        if current is not None:
+            current['attributes'][name] = round(elapsed, 2)
+        return elapsed
+
+    class TimedHTTPConnection(HTTPConnection):
+        def _new_conn(self):
+            start = time.perf_counter()
+            try:
+                return super()._new_conn()
+            finally:
+                record('connect_ms', start)
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        def _new_conn(self):
+            start = time.perf_counter()
+            try:
+                return super()._new_conn()
+            finally:
+                self._pngr_connect_ms = record('connect_ms', start)
+
+        def connect(self):
+            self._pngr_connect_ms = 0.0
+            start = time.perf_counter()
+            try:
+                return super().connect()
+            finally:
+                tracer = get_tracer()
+                current = tracer.current() if tracer else None
+                if current is not None:
+                    tls_ms = (time.perf_counter() - start) * 1000 - self._pngr_connect_ms
+                    current['attributes']['tls_ms'] = round(tls_ms, 2)
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    return {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+
+def _install_connection_timing(pool_manager):
+    """Swap in timed pool classes (plain and HTTP proxy managers only)"""
+    import urllib3
+
+    if type(pool_manager) in (urllib3.PoolManager, urllib3.ProxyManager):
+        pool_manager.pool_classes_by_scheme = _timed_pool_classes()
+
+
+def get_api_client(api_key: Optional[str] = None):
+    """
+    Get a pooled Pingera SDK ApiClient for the configured base URL
+
+    Retries, rate limiting and timeouts follow the `retries`, `rate_limit`,
+    `connect_timeout` and `timeout` settings in the config file; requests are
+    also bounded by the command deadline (see set_deadline).
+
+    Args:
+        api_key: API key to authenticate with, or None for public endpoints
+
+    Returns:
+        pingera.ApiClient: Shared client instance
+
+    Raises:
+        ImportError: If the Pingera SDK is not installed
+    """
+    from pingera import ApiClient, Configuration
+
+    config = get_config()
+    base_url = config.get('base_url', DEFAULT_BASE_URL)
+    retries = int(config.get('retries') or 0)
+    rate_limit = config.get('rate_limit')
+    connect_timeout = float(config.get('connect_timeout') or DEFAULT_CONNECT_TIMEOUT)
+    read_timeout = float(config.get('timeout') or DEFAULT_READ_TIMEOUT)
+    cache_key = (api_key or '', base_url, retries, rate_limit, connect_timeout, read_timeout)
+
+    limiter = get_rate_limiter(rate_limit)
+
+    with _clients_lock:
+        api_client = _clients.get(cache_key)
+        if api_client is None:
+            with span('client', 'client setup', base_url=base_url):
+                configuration = Configuration()
+                configuration.host = base_url
+                configuration.retries = build_retry(retries)
+                if api_key:
+                    configuration.api_key['apiKeyAuth'] = api_key
+
+                api_client = ApiClient(configuration)
+                _install_connection_timing(api_client.rest_client.pool_manager)
+                _apply_request_policy(api_client.rest_client, limiter, connect_timeout, read_timeout)
+            _clients[cache_key] = api_client
+
+    return api_client
+
+
+def clear_api_clients():
+    """Drop all pooled clients and close their connections"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _rate_limiters.clear()
+
+    for api_client in clients:
+        try:
+            api_client.rest_client.pool_manager.clear()
+        except Exception:
+            pass
@@ -8,6 +8,16 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 from .console import console, error_console
+from .trace import span
+
+
+# Formats accepted by --output; all but 'table' are meant for other programs
+OUTPUT_FORMATS = ['table', 'json', 'yaml', 'csv', 'tsv']
+STRUCTURED_FORMATS = ['json', 'yaml', 'csv', 'tsv']
+
+# Parsed config file, keyed by path, modification time and size, so long-lived
+# processes (shell, daemon) only re-read the file when it changes
+_config_cache: Dict[str, Any] = {}
 
 
 def get_config_path() -> Path:
@@ -49,7 +59,10 @@ def get_config() -> Dict[str, Any]:
         'verbose': False,
         'color': True,
         'timeout': 30.0,
+        'connect_timeout': 10.0,
+        'command_timeout': None,
         'retries': 3,
+        'rate_limit': 10.0,
         'config_path': str(get_config_path()),
     }
 
@@ -59,8 +72,7 @@ def get_config() -> Dict[str, Any]:
         return default_config
 
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = _read_config_file(config_path)
 
         # Merge with defaults to ensure all keys are present
         merged_config = default_config.copy()
@@ -72,6 +84,22 @@ def get_config() -> Dict[str, Any]:
         return default_config
 
 
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """Read and parse the config file, reusing the cached copy if unchanged"""
+    stat = config_path.stat()
+    cache_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    if _config_cache.get('key') == cache_key:
+        return _config_cache['config']
+
+    with span('config', 'config load', path=str(config_path)):
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+
+    _config_cache['key'] = cache_key
+    _config_cache['config'] = config
+    return config
+
+
 def save_config(config: Dict[str, Any]) -> bool:
     """
     Save configuration to file
@@ -83,6 +111,7 @@ def save_config(config: Dict[str, Any]) -> bool:
         bool: True if saved successfully, False otherwise
     """
     config_path = get_config_path()
+    _config_cache.clear()
 
     try:
         with open(config_path, 'w') as f:
@@ -134,12 +163,12 @@ def set_output_format(output_format: str) -> bool:
     Set output format in configuration file
 
     Args:
-        output_format: Output format (table, json, yaml)
+        output_format: Output format (table, json, yaml, csv, tsv)
 
     Returns:
         bool: True if saved successfully, False otherwise
     """
-    if output_format not in ['table', 'json', 'yaml']:
+    if output_format not in OUTPUT_FORMATS:
         return False
 
     config = get_config()
@@ -0,0 +1,92 @@
+"""
+Sync cursors for incremental listings
+
+A cursor records how far a listing has been read, such as the newest job
+seen, so the next run only fetches what is new. Cursors are kept in the config
+directory, in one file per account, and each save replaces the file
+atomically. If a run fails before its output is written, the previous cursor
+is still there.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Directory under the config directory holding cursor files
+CURSORS_DIR = 'cursors'
+
+
+def account_id(api_key: Optional[str] = None, base_url: Optional[str] = None) -> str:
+    """
+    Name the account an API key belongs to, without revealing the key
+
+    Defaults to the configured API key and base URL.
+    """
+    from .config import get_api_key, get_config
+
+    if api_key is None:
+        api_key = get_api_key() or ''
+    if base_url is None:
+        base_url = get_config().get('base_url', '')
+    return hashlib.sha256(f"{base_url}\n{api_key}".encode('utf-8')).hexdigest()[:16]
+
+
+def cursor_path(account: Optional[str] = None) -> Path:
+    """Path of an account's cursor file"""
+    from .config import get_config_path
+
+    return get_config_path().parent / CURSORS_DIR / f"{account or account_id()}.json"
+
+
+def _read(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, 'r') as f:
+            cursors = json.load(f)
+        return cursors if isinstance(cursors, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Cannot read sync cursors from {path}: {e}")
+
+
+def load_cursor(name: str, account: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a cursor
+
+    Returns:
+        Optional[Dict[str, Any]]: The cursor, or None if there is none yet
+
+    Raises:
+        ValueError: If the cursor file is unreadable
+    """
+    return _read(cursor_path(account)).get(name)
+
+
+def save_cursor(name: str, cursor: Dict[str, Any], account: Optional[str] = None):
+    """
+    Save a cursor, replacing the account's cursor file in one step
+
+    The file is written to a temporary file next to it and renamed over it,
+    so readers see the old cursors or the new ones, never a partial file.
+    """
+    path = cursor_path(account)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cursors = _read(path)
+    cursors[name] = cursor
+
+    fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cursors, f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,232 @@
+"""
+Persistent pngr daemon serving CLI invocations over a Unix socket
+
+The daemon keeps Typer, Rich, the Pingera SDK and pooled API clients warm, so a
+forwarded invocation costs roughly one socket round trip plus the API calls.
+Requests are handled one at a time: commands share process-wide state such as
+the consoles, the working directory and the environment.
+"""
+
+import io
+import json
+import os
+import socketserver
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..launcher import FORWARDED_ENV_KEYS, FORWARDED_ENV_PREFIXES, connect, iter_messages, send_message
+from .console import console, error_console
+from .dispatch import invoke_cli
+
+
+class _StreamWriter(io.TextIOBase):
+    """Text stream that forwards writes to the client as framed messages"""
+
+    def __init__(self, wfile, stream: str):
+        self._wfile = wfile
+        self._stream = stream
+        self.closed_by_peer = False
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    @property
+    def encoding(self) -> str:
+        return 'utf-8'
+
+    def write(self, data) -> int:
+        if isinstance(data, bytes):
+            data = data.decode('utf-8', errors='replace')
+        if data and not self.closed_by_peer:
+            try:
+                self._wfile.write(json.dumps({'stream': self._stream, 'data': data}).encode('utf-8') + b'\n')
+                self._wfile.flush()
+            except OSError:
+                # Client went away; keep running the command but drop its output
+                self.closed_by_peer = True
+        return len(data)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one client connection"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return
+
+        reply = self.server.pngr_daemon.handle_message(message, self.wfile)
+        if reply is not None:
+            try:
+                self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+                self.wfile.flush()
+            except OSError:
+                pass
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    """Unix socket server that replaces stale socket files and is private to the owner"""
+
+    def server_bind(self):
+        path = Path(self.server_address)
+        if path.exists():
+            path.unlink()
+
+        # Only the owning user may talk to the daemon
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+
+class PngrDaemon:
+    """Serve pngr invocations from a warm process"""
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._stopping = False
+
+    def serve_forever(self):
+        """Listen on the socket until a stop request arrives"""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = _UnixServer(str(self.socket_path), _RequestHandler)
+        server.pngr_daemon = self
+
+        try:
+            while not self._stopping:
+                server.handle_request()
+        finally:
+            server.server_close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+            from .client import clear_api_clients
+            clear_api_clients()
+
+    def handle_message(self, message: Dict[str, Any], wfile) -> Optional[Dict[str, Any]]:
+        """Dispatch a control or run message, returning the final reply"""
+        if 'run' in message:
+            self.requests_served += 1
+            return {'exit': self.run(message['run'], wfile)}
+        if message.get('control') == 'status':
+            return self.status()
+        if message.get('control') == 'stop':
+            self._stopping = True
+            return {'stopped': True, 'pid': os.getpid()}
+        return {'error': 'unknown message'}
+
+    def status(self) -> Dict[str, Any]:
+        """Describe the running daemon"""
+        from .client import _clients
+
+        return {
+            'pid': os.getpid(),
+            'socket': str(self.socket_path),
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'requests_served': self.requests_served,
+            'pooled_clients': len(_clients),
+        }
+
+    def run(self, request: Dict[str, Any], wfile) -> int:
+        """Run one CLI invocation with its output streamed to the client"""
+        stdout = _StreamWriter(wfile, 'stdout')
+        stderr = _StreamWriter(wfile, 'stderr')
+
+        with _request_context(request, stdout, stderr):
+            try:
+                return invoke_cli(request.get('argv', []))
+            except Exception as e:
+                # Never leave a client without an exit code
+                stderr.write(f"pngr daemon: {str(e)}\n")
+                return 1
+
+
+@contextmanager
+def _request_context(request: Dict[str, Any], stdout, stderr):
+    """Temporarily adopt the client's cwd, environment, stdio and width"""
+    saved_cwd = os.getcwd()
+    saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+    saved_widths = (console._width, error_console._width)
+
+    forwarded = request.get('env', {})
+    saved_env = {
+        key: value for key, value in os.environ.items()
+        if key.startswith(FORWARDED_ENV_PREFIXES) or key in FORWARDED_ENV_KEYS
+    }
+
+    try:
+        for key in saved_env:
+            os.environ.pop(key, None)
+        os.environ.update(forwarded)
+
+        if request.get('cwd'):
+            os.chdir(request['cwd'])
+
+        sys.stdin = io.StringIO(request.get('stdin', ''))
+        sys.stdout = stdout
+        sys.stderr = stderr
+
+        if request.get('width'):
+            console.width = request['width']
+            error_console.width = request['width']
+
+        yield
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        console._width, error_console._width = saved_widths
+        os.chdir(saved_cwd)
+
+        for key in forwarded:
+            os.environ.pop(key, None)
+        os.environ.update(saved_env)
+
+
+def request_control(command: str, socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Send a control message to a running daemon
+
+    Args:
+        command: Control command ('status' or 'stop')
+        socket_path: Socket to connect to, defaults to the configured one
+
+    Returns:
+        Optional[Dict[str, Any]]: Daemon reply, or None if no daemon is running
+    """
+    sock = connect(socket_path)
+    if sock is None:
+        return None
+
+    with sock:
+        try:
+            send_message(sock, {'control': command})
+            for message in iter_messages(sock):
+                return message
+        except (OSError, ValueError):
+            return None
+    return None
+
+
+def wait_for_daemon(socket_path: Path, timeout: float = 10.0) -> bool:
+    """Wait until a freshly started daemon accepts connections"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if request_control('status', socket_path) is not None:
+            return True
+        time.sleep(0.1)
+    return False
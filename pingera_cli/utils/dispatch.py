@@ -0,0 +1,44 @@
+"""
+In-process dispatch of pngr command lines
+"""
+
+from typing import List
+
+from .console import error_console
+
+
+def invoke_cli(argv: List[str]) -> int:
+    """
+    Run the Typer app in-process and translate its outcome to an exit code
+
+    Used by long-lived front ends (daemon, shell) that run many command
+    lines in one process.
+
+    Args:
+        argv: Arguments as they would follow 'pngr' on the command line
+
+    Returns:
+        int: Exit code of the command
+    """
+    import typer
+    from ..main import app
+    from .trace import set_invocation_args
+
+    set_invocation_args(argv)
+    try:
+        result = app(args=list(argv), prog_name='pngr', standalone_mode=False)
+        return result if isinstance(result, int) else 0
+    except typer.Abort:
+        error_console.print("Aborted!")
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        # Click usage errors know how to render themselves
+        if hasattr(e, 'show') and hasattr(e, 'exit_code'):
+            e.show()
+            return e.exit_code
+        error_console.print(f"[red]Unexpected error:[/red] {str(e)}")
+        return 1
@@ -0,0 +1,70 @@
+"""
+Field projection for --fields
+
+A command describes its output records as a mapping of field name to getter.
+Only the getters of requested fields run, so unrequested fields (large check
+metadata in particular) are never copied, serialized or printed. Dotted fields
+such as check_server.region keep just that part of a nested value.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .tabular import lookup
+
+
+def parse_fields(spec: Optional[str], available: Sequence[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated --fields spec
+
+    Returns:
+        Optional[List[str]]: The fields, or None for all fields
+
+    Raises:
+        ValueError: If a field is not one of the available fields
+    """
+    if not spec:
+        return None
+
+    fields = list(dict.fromkeys(field.strip() for field in spec.split(',') if field.strip()))
+    if not fields:
+        raise ValueError(f"Invalid --fields '{spec}': no fields given")
+    unknown = [field for field in fields if field.split('.', 1)[0] not in available]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available fields: {', '.join(available)}")
+    return fields
+
+
+def project(obj: Any, getters: Dict[str, Callable[[Any], Any]], fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Build an output record with only the requested fields
+
+    Args:
+        obj: Source object (e.g. an SDK model)
+        getters: Field name -> function extracting it from obj, in output order
+        fields: Fields to include (default: all)
+    """
+    if not fields:
+        return {name: getter(obj) for name, getter in getters.items()}
+
+    whole = {field for field in fields if '.' not in field}
+    record: Dict[str, Any] = {}
+    values: Dict[str, Any] = {}
+    for field in fields:
+        name, _, path = field.partition('.')
+        if name not in values:
+            values[name] = getters[name](obj)
+        if not path:
+            record[name] = values[name]
+            continue
+        if name in whole:
+            continue
+
+        # Keep only the requested part of a nested value
+        target = record.get(name)
+        if not isinstance(target, dict):
+            target = record[name] = {}
+        parts = path.split('.')
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = lookup(values[name], path)
+    return record
@@ -0,0 +1,221 @@
+"""
+Waiting for on-demand check jobs to finish
+
+A wait strategy finds out when a job is done, using as few requests as the
+API allows:
+
+- IntervalPoller asks for the job status every few seconds. It works
+  everywhere.
+- LongPoller holds one request open until the status changes.
+- WebhookReceiver listens on a local port for the API to call back, and
+  then fetches the status once.
+
+select_strategy picks the cheapest strategy that is available. If the API
+gains long-polling or callbacks, only the list of strategies handed to it
+changes; the commands stay the same.
+"""
+
+import json
+import queue
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, List, Optional, Tuple
+
+# Job statuses after which nothing changes any more
+TERMINAL_STATUSES = ('completed', 'failed', 'error')
+
+# Called with every job status seen and the seconds waited so far
+StatusCallback = Callable[[Any, float], None]
+
+
+def is_finished(job_status) -> bool:
+    """Whether a job status is final"""
+    return getattr(job_status, 'status', None) in TERMINAL_STATUSES
+
+
+class WaitStrategy(ABC):
+    """A way to wait for a job to finish"""
+
+    name = 'base'
+    # Relative cost in requests and latency; select_strategy prefers the lowest
+    cost = 100
+
+    def available(self) -> bool:
+        """Whether the API supports this strategy"""
+        return True
+
+    @abstractmethod
+    def wait(self, job_id: str, timeout: float, on_status: Optional[StatusCallback] = None) -> Tuple[Optional[Any], float]:
+        """
+        Wait for a job to finish
+
+        Args:
+            job_id: The job
+            timeout: Seconds to wait at most
+            on_status: Called with each status seen and the seconds waited
+
+        Returns:
+            Tuple: The final job status (None if the timeout passed first) and the seconds waited
+
+        Raises:
+            Exception: Errors of the underlying requests
+        """
+        pass
+
+
+class IntervalPoller(WaitStrategy):
+    """Fetch the job status at a fixed interval"""
+
+    name = 'interval'
+    cost = 2
+
+    def __init__(self, get_status: Callable[[str], Any], interval: float = 2.0):
+        self.get_status = get_status
+        self.interval = interval
+
+    def wait(self, job_id: str, timeout: float, on_status: Optional[StatusCallback] = None) -> Tuple[Optional[Any], float]:
+        started = time.monotonic()
+        slept = 0.0
+        while True:
+            # Time spent sleeping counts even where sleep returns early
+            elapsed = max(slept, time.monotonic() - started)
+            if elapsed >= timeout:
+                return None, elapsed
+            job_status = self.get_status(job_id)
+            if on_status:
+                on_status(job_status, elapsed)
+            if is_finished(job_status):
+                return job_status, elapsed
+            time.sleep(self.interval)
+            slept += self.interval
+
+
+class LongPoller(WaitStrategy):
+    """
+    Hold a status request open until the job status changes
+
+    `long_poll(job_id, last_status, hold)` must return the job once its
+    status differs from last_status (None for the first call), or after
+    `hold` seconds with the status unchanged.
+    """
+
+    name = 'long-poll'
+    cost = 1
+
+    def __init__(self, long_poll: Optional[Callable[[str, Optional[str], float], Any]], hold: float = 25.0):
+        self.long_poll = long_poll
+        self.hold = hold
+
+    def available(self) -> bool:
+        return self.long_poll is not None
+
+    def wait(self, job_id: str, timeout: float, on_status: Optional[StatusCallback] = None) -> Tuple[Optional[Any], float]:
+        started = time.monotonic()
+        last_status = None
+        while True:
+            elapsed = time.monotonic() - started
+            if elapsed >= timeout:
+                return None, elapsed
+            job_status = self.long_poll(job_id, last_status, min(self.hold, timeout - elapsed))
+            last_status = getattr(job_status, 'status', None)
+            elapsed = time.monotonic() - started
+            if on_status:
+                on_status(job_status, elapsed)
+            if is_finished(job_status):
+                return job_status, elapsed
+
+
+class WebhookReceiver(WaitStrategy):
+    """
+    Receive a callback from the API when the job changes
+
+    `register(job_id, url)` asks the API to POST to url when the job
+    changes. The callback only prompts a status fetch and its body is not
+    trusted. The status is also fetched every `fallback_interval` seconds in
+    case a callback never arrives, for example because the API cannot reach
+    this host.
+    """
+
+    name = 'webhook'
+    cost = 0
+
+    def __init__(self, get_status: Callable[[str], Any], register: Optional[Callable[[str, str], None]],
+                 host: str = '127.0.0.1', port: int = 0, public_url: Optional[str] = None, fallback_interval: float = 30.0):
+        self.get_status = get_status
+        self.register = register
+        self.host = host
+        self.port = port
+        # URL the API should call if this host is reached through a tunnel or proxy
+        self.public_url = public_url
+        self.fallback_interval = fallback_interval
+
+    def available(self) -> bool:
+        return self.register is not None
+
+    def _server(self, path: str, notifications: 'queue.Queue[str]') -> ThreadingHTTPServer:
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != path:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    body = {}
+                notifications.put(str(body.get('job_id') or body.get('id') or ''))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return ThreadingHTTPServer((self.host, self.port), Handler)
+
+    def wait(self, job_id: str, timeout: float, on_status: Optional[StatusCallback] = None) -> Tuple[Optional[Any], float]:
+        started = time.monotonic()
+        notifications: 'queue.Queue[str]' = queue.Queue()
+        # An unguessable path, so other local processes cannot trigger fetches
+        path = f"/pngr/jobs/{secrets.token_urlsafe(16)}"
+        server = self._server(path, notifications)
+        thread = threading.Thread(target=server.serve_forever, name='pngr-webhook', daemon=True)
+        thread.start()
+        try:
+            base_url = self.public_url or f"http://{server.server_address[0]}:{server.server_address[1]}"
+            self.register(job_id, base_url.rstrip('/') + path)
+
+            while True:
+                # Fetched right after registering too, in case the job finished first
+                job_status = self.get_status(job_id)
+                elapsed = time.monotonic() - started
+                if on_status:
+                    on_status(job_status, elapsed)
+                if is_finished(job_status):
+                    return job_status, elapsed
+                if elapsed >= timeout:
+                    return None, elapsed
+                try:
+                    while notifications.get(timeout=min(self.fallback_interval, timeout - elapsed)) not in (job_id, ''):
+                        pass
+                except queue.Empty:
+                    pass
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def select_strategy(strategies: List[WaitStrategy]) -> WaitStrategy:
+    """
+    Pick the cheapest available strategy
+
+    Raises:
+        ValueError: If none is available
+    """
+    available = [strategy for strategy in strategies if strategy.available()]
+    if not available:
+        raise ValueError("No way to wait for jobs is available")
+    return min(available, key=lambda strategy: strategy.cost)
@@ -0,0 +1,167 @@
+"""
+OTLP/JSON export of pngr traces
+
+Converts a finished Tracer into an OpenTelemetry ExportTraceServiceRequest in
+the OTLP/JSON encoding, which collectors accept on /v1/traces and which can be
+written to a file when no collector is reachable. Uses the standard library
+only, so no OpenTelemetry packages are needed.
+"""
+
+import json
+import os
+import re
+import secrets
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import __version__
+from .trace import Tracer
+
+SCOPE_NAME = 'pingera-cli'
+SERVICE_NAME = 'pngr'
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_ERROR = 2
+
+_TRACEPARENT = re.compile(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$')
+
+# Trace record attributes exported under OpenTelemetry semantic convention names
+_ATTRIBUTE_NAMES = {
+    'method': 'http.request.method',
+    'endpoint': 'url.path',
+    'status': 'http.response.status_code',
+    'bytes': 'http.response.body.size',
+    'retries': 'http.request.resend_count',
+    'error': 'error.type',
+}
+
+
+def parent_from_environment() -> Tuple[str, Optional[str]]:
+    """
+    Get the trace ID and parent span ID to continue a caller's trace
+
+    Honors the W3C `TRACEPARENT` environment variable that CI systems and
+    `otel-cli` set, so pngr spans appear inside the pipeline's trace.
+
+    Returns:
+        Tuple[str, Optional[str]]: Trace ID, and parent span ID if any
+    """
+    match = _TRACEPARENT.match(os.getenv('TRACEPARENT', '').strip().lower())
+    if match and set(match.group(1)) != {'0'}:
+        return match.group(1), match.group(2)
+    return secrets.token_hex(16), None
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _attributes(attributes: Dict[str, Any], prefix: str = '') -> List[Dict[str, Any]]:
+    return [
+        {'key': _ATTRIBUTE_NAMES.get(key, f'{prefix}{key}'), 'value': _attribute_value(value)}
+        for key, value in attributes.items() if value is not None
+    ]
+
+
+def build_export_request(tracer: Tracer) -> Dict[str, Any]:
+    """
+    Build an OTLP/JSON ExportTraceServiceRequest for a finished invocation
+
+    The command is the root span; API calls, polling iterations, rendering and
+    the other phases are its children, nested as they were recorded.
+
+    Args:
+        tracer: Finished tracer
+
+    Returns:
+        Dict[str, Any]: JSON-serializable export request
+    """
+    trace_id, parent_span_id = parent_from_environment()
+    end = tracer.finished or tracer.started
+
+    def unix_nano(perf_time: float) -> str:
+        return str(int((tracer.started_unix + (perf_time - tracer.started)) * 1e9))
+
+    root_id = secrets.token_hex(8)
+    span_ids = {record['id']: secrets.token_hex(8) for record in tracer.records}
+
+    root = {
+        'traceId': trace_id,
+        'spanId': root_id,
+        'name': tracer.command or SERVICE_NAME,
+        'kind': SPAN_KIND_INTERNAL,
+        'startTimeUnixNano': unix_nano(tracer.started),
+        'endTimeUnixNano': unix_nano(end),
+        'attributes': _attributes(tracer.attributes, 'pngr.'),
+    }
+    if parent_span_id:
+        root['parentSpanId'] = parent_span_id
+
+    spans = [root]
+    for record in sorted(tracer.records, key=lambda record: record['start']):
+        if record['category'] == 'startup':
+            # Happened before the command started; the summary reports it instead
+            continue
+
+        span = {
+            'traceId': trace_id,
+            'spanId': span_ids[record['id']],
+            'parentSpanId': span_ids.get(record['parent_id'], root_id),
+            'name': record['name'],
+            'kind': SPAN_KIND_CLIENT if record['category'] == 'api' else SPAN_KIND_INTERNAL,
+            'startTimeUnixNano': unix_nano(record['start']),
+            'endTimeUnixNano': unix_nano(record['end']),
+            'attributes': _attributes({'category': record['category'], **record['attributes']}, 'pngr.'),
+        }
+        status = record['attributes'].get('status')
+        if 'error' in record['attributes'] or (isinstance(status, int) and status >= 500):
+            span['status'] = {'code': STATUS_CODE_ERROR}
+        spans.append(span)
+
+    return {
+        'resourceSpans': [{
+            'resource': {
+                'attributes': _attributes({
+                    'service.name': SERVICE_NAME,
+                    'service.version': __version__,
+                }),
+            },
+            'scopeSpans': [{
+                'scope': {'name': SCOPE_NAME, 'version': __version__},
+                'spans': spans,
+            }],
+        }],
+    }
+
+
+def write_export_request(request: Dict[str, Any], path: str):
+    """Append an export request to a file as one JSON line (OTLP file exporter format)"""
+    with open(path, 'a') as f:
+        f.write(json.dumps(request, separators=(',', ':')) + '\n')
+
+
+def send_export_request(request: Dict[str, Any], endpoint: str, timeout: float = 5.0):
+    """
+    POST an export request to an OTLP/HTTP collector
+
+    Args:
+        request: Export request from build_export_request
+        endpoint: Collector base URL (e.g. http://localhost:4318) or full /v1/traces URL
+        timeout: Request timeout in seconds
+
+    Raises:
+        OSError: If the collector cannot be reached or rejects the request
+        ValueError: If the endpoint is not a valid URL
+    """
+    from urllib.request import Request, urlopen
+
+    url = endpoint if endpoint.rstrip('/').endswith('/v1/traces') else endpoint.rstrip('/') + '/v1/traces'
+    data = json.dumps(request, separators=(',', ':')).encode('utf-8')
+    with urlopen(Request(url, data=data, headers={'Content-Type': 'application/json'}, method='POST'), timeout=timeout):
+        pass
@@ -0,0 +1,133 @@
+"""
+Parquet export of check results
+
+Results are written as typed columns (timestamps, integers, strings) rather
+than JSON, which makes files far smaller and lets DuckDB, pandas or Spark read
+just the columns a query needs. Column values are taken straight from the
+result objects into per-column lists, and a row group is written each time
+enough rows have built up, so memory is bounded by the row group size.
+
+Requires the optional pyarrow package.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+# Rows per row group; small groups make files larger and slower to scan
+ROW_GROUP_SIZE = 10000
+
+# Compression name (as used for archives) -> Parquet codec
+PARQUET_COMPRESSIONS = {
+    'zstd': 'zstd',
+    'gzip': 'gzip',
+    'snappy': 'snappy',
+    'none': 'none',
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow, pyarrow.parquet
+    except ImportError:
+        raise ValueError("Parquet export requires the pyarrow package. Install with: pip install pyarrow")
+
+
+def result_schema(pa):
+    """Arrow schema of exported results"""
+    return pa.schema([
+        ('id', pa.string()),
+        ('created_at', pa.timestamp('us', tz='UTC')),
+        ('check_id', pa.string()),
+        ('check_name', pa.string()),
+        ('check_type', pa.string()),
+        ('result_type', pa.string()),
+        ('region', pa.string()),
+        ('status', pa.string()),
+        ('response_time', pa.int64()),
+        ('error_message', pa.string()),
+        ('check_server_id', pa.string()),
+    ])
+
+
+class ParquetResultWriter:
+    """
+    Write check results to a Parquet file in row groups
+
+    Use as a context manager; the file only appears at its path once it is
+    complete, and nothing is left behind if an exception escapes.
+    """
+
+    def __init__(self, path: str, compression: str = 'zstd', metadata: Optional[Dict[str, Any]] = None, row_group_size: int = ROW_GROUP_SIZE):
+        if compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}'. Use one of: {', '.join(PARQUET_COMPRESSIONS)}")
+        self._pa, pq = _pyarrow()
+
+        self.path = path
+        self.rows = 0
+        self.row_group_size = row_group_size
+        self._partial = path + '.partial'
+        self._schema = result_schema(self._pa)
+        if metadata:
+            self._schema = self._schema.with_metadata({'pngr': json.dumps(metadata, default=str)})
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self._schema.names}
+        self._buffered = 0
+        self._writer = pq.ParquetWriter(self._partial, self._schema, compression=PARQUET_COMPRESSIONS[compression])
+
+    def __enter__(self) -> 'ParquetResultWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write(self, results: Iterable[Any]) -> int:
+        """
+        Append result objects, writing a row group whenever one is full
+
+        Returns:
+            int: Number of results appended
+        """
+        columns = self._columns
+        written = 0
+        for result in results:
+            for name, values in columns.items():
+                value = getattr(result, name, None)
+                values.append(str(value) if name == 'id' and value is not None else value)
+            written += 1
+        self._buffered += written
+        self.rows += written
+        if self._buffered >= self.row_group_size:
+            self._flush()
+        return written
+
+    def _flush(self):
+        if not self._buffered:
+            return
+        table = self._pa.Table.from_pydict(self._columns, schema=self._schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        for values in self._columns.values():
+            values.clear()
+        self._buffered = 0
+
+    def close(self):
+        """Write the last row group and move the file into place"""
+        self._flush()
+        self._writer.close()
+        os.replace(self._partial, self.path)
+
+    def abort(self):
+        """Close the file and remove it"""
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self._partial)
+        except OSError:
+            pass
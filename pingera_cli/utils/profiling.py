@@ -0,0 +1,139 @@
+"""
+Profiling of pngr invocations for `--profile`
+
+Runs cProfile for exact per-function statistics (pstats) alongside a sampling
+thread that records whole stacks in the collapsed format used by flamegraph
+tools (flamegraph.pl, speedscope, inferno).
+"""
+
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+DEFAULT_PROFILE_NAME = 'pngr-profile'
+SAMPLE_INTERVAL = 0.005
+
+
+def _frame_label(code) -> str:
+    """Label a frame as 'function (path:line)' with the path relative to sys.path"""
+    filename = code.co_filename
+    for entry in sorted((p for p in sys.path if p), key=len, reverse=True):
+        if filename.startswith(entry.rstrip(os.sep) + os.sep):
+            filename = filename[len(entry.rstrip(os.sep)) + 1:]
+            break
+    # ';' separates frames in collapsed stacks
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(';', ':')
+
+
+class StackSampler:
+    """Sample the stacks of all other threads at a fixed interval"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._labels: Dict[object, str] = {}
+
+    def start(self):
+        """Start sampling in a background thread"""
+        self._thread = threading.Thread(target=self._run, name='pngr-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                self.stacks[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+            self.samples += 1
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = _frame_label(code)
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(f"thread:{thread_name}".replace(' ', '_'))
+        return ';'.join(reversed(labels))
+
+    def write_collapsed(self, path: Path):
+        """Write stacks as 'frame;frame;frame count' lines"""
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class CommandProfiler:
+    """Profile one command, writing <base>.pstats and <base>.collapsed"""
+
+    def __init__(self, base_path: Optional[str] = None):
+        base = Path(base_path or DEFAULT_PROFILE_NAME)
+        if base.suffix in ('.pstats', '.prof', '.collapsed'):
+            base = base.with_suffix('')
+        self.pstats_path = base.with_name(base.name + '.pstats')
+        self.collapsed_path = base.with_name(base.name + '.collapsed')
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler()
+        self.started: Optional[float] = None
+        self.elapsed = 0.0
+
+    def start(self):
+        """Start profiling the calling thread and sampling all threads"""
+        self.started = time.perf_counter()
+        self.sampler.start()
+        self.profile.enable()
+
+    def stop(self) -> Tuple[Path, Path]:
+        """
+        Stop profiling and write the output files
+
+        Returns:
+            Tuple[Path, Path]: Paths of the pstats and collapsed stack files
+        """
+        self.profile.disable()
+        self.sampler.stop()
+        self.elapsed = time.perf_counter() - (self.started or time.perf_counter())
+
+        self.pstats_path.parent.mkdir(parents=True, exist_ok=True)
+        self.profile.dump_stats(str(self.pstats_path))
+        self.sampler.write_collapsed(self.collapsed_path)
+        return self.pstats_path, self.collapsed_path
+
+    def top_functions(self, limit: int = 10) -> list:
+        """
+        Get the functions with the highest cumulative time
+
+        Import machinery and Typer's dispatch frames are skipped; they wrap
+        everything and would fill the list.
+
+        Returns:
+            list: (function label, calls, own seconds, cumulative seconds) tuples
+        """
+        import pstats
+
+        stats = pstats.Stats(self.profile)
+        rows = []
+        for (filename, lineno, name), (_, calls, own, cumulative, _) in stats.stats.items():
+            if filename == __file__ or filename.startswith('<') or name.startswith('<') or f'{os.sep}typer{os.sep}' in filename:
+                continue
+            rows.append((f"{name} ({Path(filename).name}:{lineno})", calls, own, cumulative))
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:limit]
@@ -0,0 +1,149 @@
+"""
+CSV and TSV output
+
+Each record becomes one row. Nested objects are flattened into dotted columns
+(check_server.region) and lists are written as JSON. Rows are written and
+flushed as they are produced, so paged and followed results stream straight
+into spreadsheets and warehouse loaders.
+"""
+
+import csv
+import json
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+TABULAR_FORMATS = ('csv', 'tsv')
+
+# Keys that mark a dict as a listing wrapped with paging details
+_WRAPPER_KEYS = {'pagination', 'total', 'message'}
+
+
+def flatten(record: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Flatten nested dicts into one level with dotted keys"""
+    flat: Dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, name + '.'))
+        else:
+            flat[name] = value
+    return flat
+
+
+def lookup(record: Dict[str, Any], column: str) -> Any:
+    """Get a dotted column from a nested record, or None if any part is missing"""
+    value: Any = record
+    for part in column.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def parse_columns(spec: Optional[str], defaults: Optional[Sequence[str]] = None) -> Optional[List[str]]:
+    """
+    Parse a column spec: comma-separated dotted paths
+
+    A spec starting with '+' adds its columns to the defaults, e.g.
+    '+check_metadata.ssl_grade'. A column ending in '.*' stands for every
+    field under that prefix.
+
+    Raises:
+        ValueError: If the spec names no columns
+    """
+    if not spec:
+        return list(defaults) if defaults else None
+
+    extend = spec.startswith('+')
+    columns = [column.strip() for column in spec.lstrip('+').split(',') if column.strip()]
+    if not columns:
+        raise ValueError(f"Invalid column spec '{spec}': no columns given")
+    if extend:
+        columns = list(defaults or []) + [column for column in columns if column not in (defaults or [])]
+    return columns
+
+
+def records_of(data: Any) -> List[Dict[str, Any]]:
+    """
+    Pick the rows out of command output
+
+    Lists are rows as they are; a dict holding a list of records (like
+    {"checks": [...], "pagination": {...}}) yields that list, and any other
+    dict is a single row.
+    """
+    if isinstance(data, list):
+        return [item if isinstance(item, dict) else {'value': item} for item in data]
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list) and value and isinstance(value[0], dict):
+                return value
+        if _WRAPPER_KEYS.intersection(data):
+            # An empty listing, like {"checks": [], "total": 0}
+            for value in data.values():
+                if isinstance(value, list):
+                    return value
+        return [data]
+    return [{'value': data}]
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str, separators=(',', ':'))
+    return str(value)
+
+
+class TabularWriter:
+    """
+    Write records as CSV or TSV rows
+
+    The header is written with the first rows. Columns come from the spec,
+    or else from the flattened first record, and stay fixed afterwards.
+    """
+
+    def __init__(self, output_format: str = 'csv', columns: Optional[Sequence[str]] = None, stream=None):
+        if output_format not in TABULAR_FORMATS:
+            raise ValueError(f"Unknown tabular format '{output_format}'. Use one of: {', '.join(TABULAR_FORMATS)}")
+        self.stream = stream or sys.stdout
+        self.columns: Optional[List[str]] = list(columns) if columns else None
+        self.rows = 0
+        self._writer = csv.writer(self.stream, dialect='excel-tab' if output_format == 'tsv' else 'excel', lineterminator='\n')
+
+    def _resolve_columns(self, record: Dict[str, Any]) -> List[str]:
+        flat = flatten(record)
+        if self.columns is None:
+            return list(flat)
+
+        columns: List[str] = []
+        for column in self.columns:
+            if column.endswith('.*'):
+                prefix = column[:-1]
+                columns.extend(key for key in flat if key.startswith(prefix) and key not in columns)
+            elif column not in columns:
+                columns.append(column)
+        return columns
+
+    def write(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write rows and flush them
+
+        Returns:
+            int: Number of rows written
+        """
+        written = 0
+        for record in records:
+            if written == 0 and self.rows == 0:
+                self.columns = self._resolve_columns(record)
+                self._writer.writerow(self.columns)
+            self._writer.writerow([_cell(lookup(record, column)) for column in self.columns])
+            written += 1
+        self.rows += written
+        if written:
+            self.stream.flush()
+        return written
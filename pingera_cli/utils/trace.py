@@ -0,0 +1,341 @@
+"""
+Lightweight timing instrumentation for pngr invocations
+
+Tracing is off unless `--trace` or `--trace-file` is given; the hooks in the
+client factory, config loader and console are then near no-ops. Records form a
+tree (per thread) so they can be exported as spans as well as summarized.
+"""
+
+import itertools
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Set when this module is first imported, which main.py does before importing
+# the command modules, so the first trace can report CLI startup time
+_IMPORTED_AT = time.perf_counter()
+_startup_reported = False
+
+_tracer: Optional['Tracer'] = None
+
+# Arguments of the command line being run (set by the entry points), used to
+# name the trace since click consumes them before the root callback runs
+_invocation_args: List[str] = []
+
+# Console writes closer together than this are merged into one render record
+RENDER_MERGE_GAP = 0.005
+
+# Phases shown in the summary breakdown, in order
+PHASES = [
+    ('startup', 'CLI startup (imports)'),
+    ('config', 'Config load'),
+    ('sdk', 'SDK import'),
+    ('client', 'Client setup'),
+    ('api', 'API calls'),
+    ('render', 'Rendering'),
+]
+
+
+class Tracer:
+    """Collect timing records for one CLI invocation"""
+
+    def __init__(self, command: str = ''):
+        self.command = command
+        self.started = time.perf_counter()
+        self.started_unix = time.time()
+        self.finished: Optional[float] = None
+        self.records: List[Dict[str, Any]] = []
+        self.attributes: Dict[str, Any] = {}
+        self.render_seconds = 0.0
+        self.render_calls = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Dict[str, Any]]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        """Get the innermost open record of the calling thread"""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(self, category: str, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """Time a block, yielding its record so attributes can be added"""
+        stack = self._stack()
+        record = {
+            'id': next(self._ids),
+            'parent_id': stack[-1]['id'] if stack else None,
+            'category': category,
+            'name': name,
+            'start': time.perf_counter(),
+            'end': None,
+            'attributes': attributes,
+        }
+        stack.append(record)
+        try:
+            yield record
+        except BaseException as e:
+            record['attributes'].setdefault('error', type(e).__name__)
+            raise
+        finally:
+            record['end'] = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                self.records.append(record)
+
+    def add(self, category: str, name: str, start: float, end: float, **attributes):
+        """Add a record for an interval timed elsewhere"""
+        stack = self._stack()
+        with self._lock:
+            self.records.append({
+                'id': next(self._ids),
+                'parent_id': stack[-1]['id'] if stack else None,
+                'category': category,
+                'name': name,
+                'start': start,
+                'end': end,
+                'attributes': attributes,
+            })
+
+    def add_render(self, start: float, end: float):
+        """Account console output time, merging bursts of small writes into one record"""
+        stack = self._stack()
+        parent_id = stack[-1]['id'] if stack else None
+        with self._lock:
+            self.render_seconds += end - start
+            self.render_calls += 1
+
+            last = getattr(self._local, 'render_record', None)
+            if last is not None and last['parent_id'] == parent_id and start - last['end'] < RENDER_MERGE_GAP:
+                last['end'] = end
+                return
+
+            record = {
+                'id': next(self._ids),
+                'parent_id': parent_id,
+                'category': 'render',
+                'name': 'render',
+                'start': start,
+                'end': end,
+                'attributes': {},
+            }
+            self.records.append(record)
+            self._local.render_record = record
+
+    def finish(self):
+        """Mark the end of the invocation"""
+        if self.finished is None:
+            self.finished = time.perf_counter()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the invocation
+
+        Returns:
+            Dict[str, Any]: Total time, per-phase breakdown and API call details (ms)
+        """
+        end = self.finished or time.perf_counter()
+        records = sorted(self.records, key=lambda record: record['start'])
+
+        phases = {category: {'calls': 0, 'ms': 0.0} for category, _ in PHASES}
+        for record in records:
+            # Only top-level records count towards phases, so nothing is counted twice
+            if record['parent_id'] is None and record['category'] in phases:
+                phases[record['category']]['calls'] += 1
+                phases[record['category']]['ms'] += _ms(record['end'] - record['start'])
+        phases['render'] = {'calls': self.render_calls, 'ms': _ms(self.render_seconds)}
+
+        startup_ms = phases['startup']['ms']
+        total_ms = _ms(end - self.started) + startup_ms
+        phases['other'] = {'calls': 0, 'ms': round(max(0.0, total_ms - sum(phase['ms'] for phase in phases.values())), 2)}
+
+        return {
+            'command': self.command,
+            'attributes': dict(self.attributes),
+            'total_ms': round(total_ms, 2),
+            'phases': {name: {'calls': phase['calls'], 'ms': round(phase['ms'], 2)} for name, phase in phases.items()},
+            'api_calls': [
+                {
+                    'offset_ms': round(_ms(record['start'] - self.started), 2),
+                    'duration_ms': round(_ms(record['end'] - record['start']), 2),
+                    **record['attributes'],
+                }
+                for record in records if record['category'] == 'api'
+            ],
+        }
+
+
+def _ms(seconds: float) -> float:
+    return seconds * 1000.0
+
+
+def set_invocation_args(args: List[str]):
+    """Remember the arguments of the command line about to run"""
+    global _invocation_args
+    _invocation_args = list(args)
+
+
+def command_name(subcommand: Optional[str]) -> str:
+    """Name the running command, e.g. 'pngr checks list', from its arguments"""
+    words = ['pngr']
+    if subcommand and subcommand in _invocation_args:
+        for arg in _invocation_args[_invocation_args.index(subcommand):]:
+            if arg.startswith('-') or len(words) > 3:
+                break
+            words.append(arg)
+    elif subcommand:
+        words.append(subcommand)
+    return ' '.join(words)
+
+
+def start_tracing(command: str = '') -> Tracer:
+    """Start tracing the current invocation, replacing any previous tracer"""
+    global _tracer, _startup_reported
+    _tracer = Tracer(command)
+
+    if not _startup_reported:
+        # Only the first invocation in a process paid for the imports
+        _startup_reported = True
+        _tracer.add('startup', 'cli startup', _IMPORTED_AT, _tracer.started)
+
+    if 'pingera' not in sys.modules and not any(isinstance(finder, _SdkImportTimer) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _SdkImportTimer())
+
+    from .console import console, error_console
+    _instrument_console(console)
+    _instrument_console(error_console)
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop tracing and return the finished tracer, if any"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.finish()
+    sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, _SdkImportTimer)]
+
+    from .console import console, error_console
+    _uninstrument_console(console)
+    _uninstrument_console(error_console)
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the active tracer, or None if tracing is off"""
+    return _tracer
+
+
+def annotate(**attributes):
+    """Attach attributes (e.g. job_id, check_id) to the traced command"""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.attributes.update(attributes)
+
+
+@contextmanager
+def span(category: str, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+    """Time a block if tracing is on; yields a scratch dict otherwise"""
+    tracer = _tracer
+    if tracer is None:
+        yield {'attributes': {}}
+        return
+
+    with tracer.span(category, name, **attributes) as record:
+        yield record
+
+
+class _SdkImportTimer:
+    """Meta path finder timing the first import of the Pingera SDK, wherever it happens"""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != 'pingera':
+            return None
+
+        import importlib.util
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def timed_exec_module(module):
+            with span('sdk', 'sdk import'):
+                exec_module(module)
+
+        spec.loader.exec_module = timed_exec_module
+        return spec
+
+
+def _instrument_console(target):
+    """Time every print on a console while tracing"""
+    if 'print' in vars(target):
+        return
+    print_method = target.print
+
+    def traced_print(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return print_method(*args, **kwargs)
+        finally:
+            tracer = _tracer
+            if tracer is not None:
+                tracer.add_render(start, time.perf_counter())
+
+    target.print = traced_print
+
+
+def _uninstrument_console(target):
+    vars(target).pop('print', None)
+
+
+def render_summary(summary: Dict[str, Any], target_console):
+    """Print a trace summary as tables"""
+    from rich.table import Table
+
+    labels = dict(PHASES)
+    labels['other'] = 'Other (CLI logic, waits)'
+
+    phases = Table(title=f"⏱ Trace: {summary['command'] or 'pngr'} ({summary['total_ms']:.1f} ms)", title_justify='left')
+    phases.add_column("Phase", style="cyan")
+    phases.add_column("Calls", justify="right")
+    phases.add_column("Time (ms)", justify="right", style="white")
+    phases.add_column("Share", justify="right", style="dim")
+
+    total = summary['total_ms'] or 1.0
+    for name, phase in summary['phases'].items():
+        if phase['ms'] or phase['calls']:
+            phases.add_row(labels.get(name, name), str(phase['calls']) if phase['calls'] else '', f"{phase['ms']:.1f}", f"{phase['ms'] / total:.0%}")
+    target_console.print(phases)
+
+    if not summary['api_calls']:
+        return
+
+    calls = Table(title="API calls", title_justify='left')
+    for column in ["Method", "Endpoint", "Status", "Bytes", "Connect", "TLS", "TTFB", "Body", "Total (ms)"]:
+        calls.add_column(column, justify="left" if column in ("Method", "Endpoint") else "right")
+
+    def timing(value):
+        return f"{value:.1f}" if value is not None else "-"
+
+    for call in summary['api_calls']:
+        status = call.get('status')
+        calls.add_row(
+            call.get('method', ''),
+            call.get('endpoint', ''),
+            str(status) if status is not None else f"[red]{call.get('error', 'error')}[/red]",
+            str(call.get('bytes', '-')),
+            timing(call.get('connect_ms')),
+            timing(call.get('tls_ms')),
+            timing(call.get('ttfb_ms')),
+            timing(call.get('body_ms')),
+            f"{call['duration_ms']:.1f}",
+        )
+    target_console.print(calls)
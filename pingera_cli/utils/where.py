@@ -0,0 +1,321 @@
+"""
+--where filter expressions
+
+An expression such as
+
+    status!=resolved and (impact=major or impact=critical) and created_at>=7d
+
+is parsed once into a tree of Python closures, so filtering costs one function
+call per row and no re-parsing. Comparisons that an API can evaluate itself
+(top-level `field=value` terms on a pushdown field) are taken out of the local
+predicate and returned as query parameters instead.
+
+Operators: = (or ==), !=, >, >=, <, <=, ~ (case-insensitive regex search) and
+!~, combined with and, or, not and parentheses. Values may be quoted. Fields
+are dotted paths into the record. A value is compared as a number, boolean or
+date when the field holds one; dates accept ISO 8601 or an age such as 30m,
+12h, 7d or 2w. `null` matches missing fields. A list field matches when any
+of its values does, and != or !~ when none does.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Predicate = Callable[[Any], bool]
+Getter = Callable[[Any], Any]
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<paren>[()])
+      | (?P<op>==|!=|>=|<=|!~|=|>|<|~)
+      | "(?P<dquoted>[^"]*)"
+      | '(?P<squoted>[^']*)'
+      | (?P<word>[^\s()=!<>~"']+)
+    )""", re.VERBOSE)
+
+_AGE = re.compile(r'^(\d+(?:\.\d+)?)([smhdw])$')
+_AGE_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+_KEYWORDS = ('and', 'or', 'not')
+
+
+class Where:
+    """A compiled --where expression"""
+
+    def __init__(self, expression: str, predicate: Optional[Predicate], params: Dict[str, str]):
+        self.expression = expression
+        self._predicate = predicate
+        # Query parameters the API evaluates instead of the predicate
+        self.params = params
+
+    def __call__(self, record: Any) -> bool:
+        return self._predicate is None or self._predicate(record)
+
+    @property
+    def is_local(self) -> bool:
+        """Whether anything is left to evaluate on the client"""
+        return self._predicate is not None
+
+    def filter(self, records):
+        """Yield the records that match, lazily"""
+        if self._predicate is None:
+            yield from records
+            return
+        predicate = self._predicate
+        for record in records:
+            if predicate(record):
+                yield record
+
+
+def field_value(record: Any, path: str) -> Any:
+    """Get a dotted field from a dict or object, or None if any part is missing"""
+    value = record
+    for part in path.split('.'):
+        if value is None:
+            return None
+        value = value.get(part) if isinstance(value, dict) else getattr(value, part, None)
+    return value
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid --where expression at '{expression[position:].strip()}'")
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ('dquoted', 'squoted'):
+            tokens.append(('value', value))
+        elif kind == 'word' and value.lower() in _KEYWORDS:
+            tokens.append((value.lower(), value))
+        else:
+            tokens.append((kind, value))
+    return tokens
+
+
+def _parse_timestamp(text: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _as_datetime(text: str, now: datetime) -> Optional[datetime]:
+    age = _AGE.match(text)
+    if age:
+        return now - timedelta(**{_AGE_UNITS[age.group(2)]: float(age.group(1))})
+    return _parse_timestamp(text)
+
+
+def _as_number(text: str) -> Optional[float]:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _aware(value: datetime) -> datetime:
+    # API timestamps are UTC; treat naive ones as UTC so they compare with aware ones
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+_ORDERINGS = {
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+}
+
+
+def _comparison(field: str, op: str, text: str, now: datetime, getter: Optional[Getter] = None) -> Predicate:
+    """Compile one comparison; the literal is converted once, here"""
+    get = getter or (lambda record: field_value(record, field))
+    negate = op in ('!=', '!~')
+
+    if op in ('~', '!~'):
+        try:
+            pattern = re.compile(text, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern '{text}' for {field}: {e}")
+
+        def test(value):
+            return value is not None and pattern.search(str(value)) is not None
+        return _over_values(get, test, negate)
+
+    number = _as_number(text)
+    moment = _as_datetime(text, now)
+    moment = _aware(moment) if moment else None
+    lowered = text.lower()
+    is_null = lowered in ('null', 'none')
+
+    if op in ('=', '==', '!='):
+        def test(value):
+            if value is None:
+                return is_null
+            if isinstance(value, bool):
+                return lowered == ('true' if value else 'false')
+            if isinstance(value, (int, float)):
+                return number is not None and value == number
+            if isinstance(value, datetime):
+                return moment is not None and _aware(value) == moment
+            return str(value).lower() == lowered
+        return _over_values(get, test, negate)
+
+    order = _ORDERINGS[op]
+
+    def test(value):
+        if value is None or isinstance(value, bool):
+            return False
+        if isinstance(value, (int, float)):
+            return number is not None and order(value, number)
+        if isinstance(value, datetime):
+            return moment is not None and order(_aware(value), moment)
+        if moment is not None and isinstance(value, str):
+            # Some SDK fields hold timestamps as ISO strings
+            timestamp = _parse_timestamp(value)
+            if timestamp is not None:
+                return order(_aware(timestamp), moment)
+        return order(str(value), text)
+    return _over_values(get, test, negate)
+
+
+def _over_values(get: Getter, test: Callable[[Any], bool], negate: bool) -> Predicate:
+    """
+    Apply a test to a field; a list field matches if any of its values does
+
+    A negated operator (!=, !~) matches when no value passes the positive
+    test, so `component!=k1` means "not affecting k1". An empty list counts
+    as null.
+    """
+    def predicate(record):
+        value = get(record)
+        if isinstance(value, (list, tuple)):
+            result = any(test(item) for item in value) if value else test(None)
+        else:
+            result = test(value)
+        return result != negate
+    return predicate
+
+
+class _Parser:
+    """Recursive-descent parser building closures (and pushdown terms)"""
+
+    def __init__(self, tokens: List[Tuple[str, str]], now: datetime, fields: Optional[Dict[str, Getter]] = None):
+        self.tokens = tokens
+        self.position = 0
+        self.now = now
+        self.fields = fields or {}
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def take(self, *kinds: str, expected: str = '') -> Tuple[str, str]:
+        if self.position >= len(self.tokens):
+            raise ValueError(f"Incomplete --where expression: expected {expected or kinds[0]}")
+        kind, value = self.tokens[self.position]
+        if kind not in kinds:
+            raise ValueError(f"Invalid --where expression: unexpected '{value}'")
+        self.position += 1
+        return kind, value
+
+    def conjuncts(self) -> List[Any]:
+        """Parse the whole expression into top-level and-terms (predicates or comparison tuples)"""
+        terms = self.conjunction_terms()
+        if self.peek() == 'or':
+            # A top-level or leaves nothing that can be pushed down on its own
+            terms = [self.disjunction(self.join_and(terms))]
+        if self.peek() is not None:
+            raise ValueError(f"Invalid --where expression: unexpected '{self.tokens[self.position][1]}'")
+        return terms
+
+    def join_and(self, terms: List[Any]) -> Predicate:
+        predicates = [self.compiled(term) for term in terms]
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda record: all(predicate(record) for predicate in predicates)
+
+    def compiled(self, term: Any) -> Predicate:
+        if isinstance(term, tuple):
+            return _comparison(*term, self.now, self.fields.get(term[0]))
+        if isinstance(term, list):
+            return self.join_and(term)
+        return term
+
+    def disjunction(self, left: Predicate) -> Predicate:
+        while self.peek() == 'or':
+            self.take('or')
+            right, previous = self.join_and(self.conjunction_terms()), left
+            left = lambda record, previous=previous, right=right: previous(record) or right(record)
+        return left
+
+    def conjunction_terms(self) -> List[Any]:
+        terms: List[Any] = []
+        while True:
+            term = self.term()
+            # A parenthesized and-group joins this one, so its terms can still be pushed down
+            if isinstance(term, list):
+                terms.extend(term)
+            else:
+                terms.append(term)
+            if self.peek() != 'and':
+                return terms
+            self.take('and')
+
+    def term(self) -> Any:
+        kind = self.peek()
+        if kind == 'not':
+            self.take('not')
+            inner = self.compiled(self.term())
+            return lambda record: not inner(record)
+        if kind == 'paren':
+            _, value = self.take('paren')
+            if value != '(':
+                raise ValueError("Invalid --where expression: unexpected ')'")
+            inner = self.conjunction_terms()
+            if self.peek() == 'or':
+                inner = self.disjunction(self.join_and(inner))
+            _, value = self.take('paren', expected="')'")
+            if value != ')':
+                raise ValueError("Invalid --where expression: missing ')'")
+            return inner
+        _, field = self.take('word', expected='a field')
+        _, op = self.take('op', expected='an operator')
+        _, text = self.take('word', 'value', expected='a value')
+        return (field, op, text)
+
+
+def compile_where(expression: Optional[str], pushdown: Optional[Dict[str, str]] = None, now: Optional[datetime] = None,
+                  fields: Optional[Dict[str, Getter]] = None) -> Where:
+    """
+    Compile a --where expression
+
+    Args:
+        expression: The expression (None or empty matches everything)
+        pushdown: Field name -> API query parameter for equality terms the API can evaluate
+        now: Reference time for ages like 7d (default: now)
+        fields: Field name -> function computing it from a record, for fields
+            that are not plain attributes (such as ids taken from a list)
+
+    Raises:
+        ValueError: If the expression is invalid
+    """
+    if not expression or not expression.strip():
+        return Where(expression or '', None, {})
+
+    parser = _Parser(_tokenize(expression), now or datetime.now(timezone.utc), fields)
+    terms = parser.conjuncts()
+
+    params: Dict[str, str] = {}
+    local = []
+    for term in terms:
+        if (isinstance(term, tuple) and pushdown and term[0] in pushdown and term[1] in ('=', '==')
+                and term[2].lower() not in ('null', 'none') and pushdown[term[0]] not in params):
+            params[pushdown[term[0]]] = term[2]
+        else:
+            local.append(term)
+
+    return Where(expression, parser.join_and(local) if local else None, params)
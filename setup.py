@@ -59,10 +59,16 @@ setup(
             "flake8",
             "mypy",
         ],
+        "zstd": [
+            "zstandard",
+        ],
+        "parquet": [
+            "pyarrow",
+        ],
     },
     entry_points={
         "console_scripts": [
-            "pngr=pingera_cli.main:cli_entry_point",
+            "pngr=pingera_cli.launcher:main",
         ],
     },
     keywords="cli, pingera, network, monitoring, typer, rich, terminal",
@@ -14,6 +14,16 @@ from pingera_cli.main import app
 from pingera_cli.utils.config import get_config_path
 
 
+@pytest.fixture(autouse=True)
+def clear_api_clients():
+    """Make sure pooled SDK clients and command deadlines never leak between tests"""
+    from pingera_cli.utils.client import clear_api_clients, set_deadline
+    clear_api_clients()
+    yield
+    clear_api_clients()
+    set_deadline(None)
+
+
 @pytest.fixture
 def cli_runner():
     """Create a CLI runner for testing"""
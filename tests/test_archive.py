@@ -0,0 +1,59 @@
+"""
+Tests for NDJSON archives
+"""
+
+import os
+import tarfile
+
+import pytest
+
+from pingera_cli.utils.archive import ArchiveReader, ArchiveWriter
+
+
+class TestArchive:
+    """Test writing and reading archives"""
+
+    @pytest.mark.parametrize('name', ['export.tar', 'export'])
+    def test_round_trip(self, tmp_path, name):
+        """Test records, counts and metadata survive a tar or directory round trip"""
+        path = str(tmp_path / name)
+        with ArchiveWriter(path, resources=['checks', 'pages'], metadata={'kind': 'test'}) as writer:
+            assert writer.write_many('checks', ({'id': str(i)} for i in range(250))) == 250
+            writer.write('checks', {'id': 'last'})
+
+        with ArchiveReader(path) as reader:
+            assert reader.metadata == {'kind': 'test'}
+            assert reader.count('checks') == 251
+            assert reader.count('pages') == 0
+            assert [record['id'] for record in reader.records('checks')][-2:] == ['249', 'last']
+            assert list(reader.records('pages')) == []
+            assert reader.verify() == []
+
+        if name.endswith('.tar'):
+            with tarfile.open(path) as tar:
+                assert tar.getnames() == ['manifest.json', 'checks.ndjson.gz', 'pages.ndjson.gz']
+            assert os.listdir(tmp_path) == ['export.tar']
+
+    def test_verify_detects_tampering(self, tmp_path):
+        """Test a member changed after export fails verification"""
+        path = tmp_path / 'export'
+        with ArchiveWriter(str(path), compression='none') as writer:
+            writer.write('checks', {'id': 'c1'})
+        (path / 'checks.ndjson').write_text('{"id":"c2"}\n')
+
+        with ArchiveReader(str(path)) as reader:
+            assert reader.verify() == ['checks: checksum mismatch in checks.ndjson']
+
+    def test_failed_export_leaves_nothing_behind(self, tmp_path):
+        """Test an exception while writing removes the partial archive"""
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(str(tmp_path / 'export.tar')) as writer:
+                writer.write('checks', {'id': 'c1'})
+                raise RuntimeError("interrupted")
+
+        assert os.listdir(tmp_path) == []
+
+    def test_rejects_unknown_compression(self, tmp_path):
+        """Test an unknown compression is refused before anything is written"""
+        with pytest.raises(ValueError, match="Unknown compression"):
+            ArchiveWriter(str(tmp_path / 'export.tar'), compression='bz2')
@@ -0,0 +1,59 @@
+"""
+Tests for check groups commands
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from pingera_cli.main import app
+
+
+class TestGroupPauseResume:
+    """Test pausing and resuming all checks of a group"""
+
+    @staticmethod
+    def _check(check_id, active):
+        check = Mock()
+        check.id = check_id
+        check.name = f"Check {check_id}"
+        check.active = active
+        return check
+
+    def test_pause_skips_paused_checks_across_pages(self, cli_runner, mock_config_with_api_key):
+        """Test every page of the group is read and only active checks are patched"""
+        with patch('pingera_cli.commands.check_groups.CheckGroupsCommand.get_client') as mock_get_client, \
+             patch('pingera_cli.commands.check_groups.CheckGroupsCommand.get_checks_client') as mock_get_checks:
+            groups_api = Mock()
+            checks_api = Mock()
+            mock_get_client.return_value = groups_api
+            mock_get_checks.return_value = checks_api
+
+            first_page = [self._check(f'chk_{i}', i % 2 == 0) for i in range(100)]
+            second_page = [self._check('chk_100', True)]
+            groups_api.v1_check_groups_group_id_checks_get.side_effect = [Mock(checks=first_page), Mock(checks=second_page)]
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'groups', 'pause', 'grp_1'])
+
+            assert result.exit_code == 0
+            assert groups_api.v1_check_groups_group_id_checks_get.call_count == 2
+            report = json.loads(result.stdout)
+            assert len(report['succeeded']) == 51
+            assert len(report['skipped']) == 50
+            assert checks_api.v1_checks_check_id_patch.call_count == 51
+            assert all(call.kwargs['monitor_check1'] == {'active': False} for call in checks_api.v1_checks_check_id_patch.call_args_list)
+
+    def test_resume_nothing_to_do(self, cli_runner, mock_config_with_api_key):
+        """Test a group whose checks are all active makes no PATCH requests"""
+        with patch('pingera_cli.commands.check_groups.CheckGroupsCommand.get_client') as mock_get_client, \
+             patch('pingera_cli.commands.check_groups.CheckGroupsCommand.get_checks_client') as mock_get_checks:
+            groups_api = Mock()
+            checks_api = Mock()
+            mock_get_client.return_value = groups_api
+            mock_get_checks.return_value = checks_api
+            groups_api.v1_check_groups_group_id_checks_get.return_value = Mock(checks=[self._check('chk_1', True)])
+
+            result = cli_runner.invoke(app, ['checks', 'groups', 'resume', 'grp_1'])
+
+            assert result.exit_code == 0
+            assert "already in that state" in result.stdout
+            checks_api.v1_checks_check_id_patch.assert_not_called()
@@ -362,3 +362,544 @@ class TestChecksCommand:
             output_data = json.loads(result.stdout)
             assert output_data['regions'] == []
             assert output_data['total'] == 0
+
+
+class TestChecksWatch:
+    """Test following new results with checks watch"""
+
+    @staticmethod
+    def _result(result_id, minute, status='ok'):
+        result = Mock()
+        result.id = result_id
+        result.check_id = 'check_123'
+        result.check_name = 'API health'
+        result.check_type = 'web'
+        result.status = status
+        result.created_at = datetime(2025, 1, 1, 12, minute, 0)
+        result.response_time = 120
+        result.error_message = None
+        result.region = 'eu-west'
+        result.check_server = None
+        return result
+
+    def _response(self, *results):
+        response = Mock()
+        response.results = list(results)
+        return response
+
+    def test_watch_emits_only_new_results(self, cli_runner, mock_config_with_api_key):
+        """Test polls use the watermark and duplicates are dropped"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client, \
+             patch('time.sleep', side_effect=[None, None, KeyboardInterrupt]):
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = [
+                # Initial tail, newest first
+                self._response(self._result('r2', 2), self._result('r1', 1)),
+                # Poll 1: r2 comes back at the watermark, r3 is new
+                self._response(self._result('r3', 3, 'failed'), self._result('r2', 2)),
+                # Poll 2: nothing new
+                self._response(self._result('r3', 3, 'failed')),
+            ]
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'watch', 'check_123', '--interval', '1'])
+
+            assert result.exit_code == 0
+            records = [json.loads(line) for line in result.stdout.splitlines()]
+            assert [record['id'] for record in records] == ['r1', 'r2', 'r3']
+            assert records[2]['status'] == 'failed'
+
+            poll_kwargs = mock_api.v1_checks_all_results_get.call_args_list[1].kwargs
+            assert poll_kwargs['start_date'] == datetime(2025, 1, 1, 12, 2, 0)
+            assert poll_kwargs['check_id'] == 'check_123'
+            third_kwargs = mock_api.v1_checks_all_results_get.call_args_list[2].kwargs
+            assert third_kwargs['start_date'] == datetime(2025, 1, 1, 12, 3, 0)
+
+    def test_watch_lines_zero_starts_at_newest(self, cli_runner, mock_config_with_api_key):
+        """Test --lines 0 shows nothing at first, then results after the newest existing one"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client, \
+             patch('time.sleep', side_effect=[None, KeyboardInterrupt]):
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = [
+                self._response(self._result('r2', 2), self._result('r1', 1)),
+                self._response(self._result('r3', 3), self._result('r2', 2)),
+            ]
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'watch', '--lines', '0', '--interval', '1'])
+
+            assert result.exit_code == 0
+            assert [json.loads(line)['id'] for line in result.stdout.splitlines()] == ['r3']
+            assert mock_api.v1_checks_all_results_get.call_args_list[1].kwargs['start_date'] == datetime(2025, 1, 1, 12, 2, 0)
+
+    def test_watch_survives_errors_before_first_result(self, cli_runner, mock_config_with_api_key):
+        """Test a failed poll warns and keeps watching even before any result was seen"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client, \
+             patch('time.sleep', side_effect=[None, None, KeyboardInterrupt]):
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = [
+                self._response(),
+                Exception("503 Service Unavailable"),
+                self._response(self._result('r1', 1)),
+            ]
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'watch', '--interval', '1'])
+
+            assert result.exit_code == 0
+            assert "Failed to fetch new results" in result.stderr
+            assert [json.loads(line)['id'] for line in result.stdout.splitlines()] == ['r1']
+
+    def test_watch_table_lines(self, cli_runner, mock_config_with_api_key):
+        """Test table mode prints one line per result and a summary on Ctrl+C"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client, \
+             patch('time.sleep', side_effect=KeyboardInterrupt):
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.return_value = self._response(self._result('r1', 1))
+
+            result = cli_runner.invoke(app, ['checks', 'watch'])
+
+            assert result.exit_code == 0
+            assert 'r1' in result.stdout
+            assert 'Stopped watching after 1 results' in result.stdout
+
+
+class TestChecksExportResults:
+    """Test exporting results to an archive"""
+
+    def test_export_pages_until_short_page(self, cli_runner, mock_config_with_api_key, tmp_path):
+        """Test every page is streamed into the archive and paging stops on a short page"""
+        from pingera_cli.utils.archive import ArchiveReader
+
+        def page(page, page_size, **params):
+            response = Mock()
+            response.results = [TestChecksWatch._result(f"r{page}-{i}", 1) for i in range(page_size if page < 3 else 5)]
+            return response
+
+        path = str(tmp_path / 'results.tar')
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = page
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'export-results', path, '--check-id', 'check_123', '--status', 'failed'])
+
+            assert result.exit_code == 0
+            assert json.loads(result.stdout) == {'path': path, 'results': 205}
+            assert mock_api.v1_checks_all_results_get.call_count == 3
+            assert mock_api.v1_checks_all_results_get.call_args.kwargs == {'page': 3, 'page_size': 100, 'check_id': 'check_123', 'status': 'failed'}
+
+        with ArchiveReader(path) as reader:
+            assert reader.count('results') == 205
+            assert reader.metadata['filters'] == {'check_id': 'check_123', 'status': 'failed'}
+            assert next(reader.records('results'))['id'] == 'r1-0'
+
+
+    def test_export_parquet_row_groups(self, cli_runner, mock_config_with_api_key, tmp_path):
+        """Test results are written as typed Parquet columns"""
+        pq = pytest.importorskip('pyarrow.parquet')
+
+        def page(page, page_size, **params):
+            response = Mock()
+            response.results = [TestChecksWatch._result(f"r{page}-{i}", 1) for i in range(page_size if page == 1 else 3)]
+            for result in response.results:
+                result.result_type = 'scheduled'
+                result.check_server_id = None
+            return response
+
+        path = str(tmp_path / 'results.parquet')
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = page
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'export-results', path])
+
+            assert result.exit_code == 0
+            assert json.loads(result.stdout) == {'path': path, 'results': 103}
+
+        table = pq.read_table(path)
+        assert table.num_rows == 103
+        assert str(table.schema.field('created_at').type) == 'timestamp[us, tz=UTC]'
+        assert table.column('response_time').to_pylist()[0] == 120
+        assert table.column('id').to_pylist()[-1] == 'r2-2'
+
+
+class TestChecksTabularOutput:
+    """Test csv/tsv output of results"""
+
+    def test_results_csv_streams_all_pages(self, cli_runner, mock_config_with_api_key):
+        """Test --all writes one header and a row per result across pages, with flattened server columns"""
+        def page(page, page_size, **params):
+            response = Mock()
+            response.results = [TestChecksWatch._result(f"r{page}-{i}", 1) for i in range(page_size if page == 1 else 1)]
+            for result in response.results:
+                result.check_server = Mock(ip_address='10.0.0.1', country='DE', region='eu-central')
+                result.check_metadata = {'ssl_grade': 'A'}
+            return response
+
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = page
+
+            result = cli_runner.invoke(app, ['--output', 'csv', 'checks', 'results', '--all', '--page-size', '2', '--columns', 'id,check_server.*,check_metadata.ssl_grade'])
+
+            assert result.exit_code == 0
+            assert result.stdout.splitlines() == [
+                'id,check_server.ip_address,check_server.country,check_server.region,check_metadata.ssl_grade',
+                'r1-0,10.0.0.1,DE,eu-central,A',
+                'r1-1,10.0.0.1,DE,eu-central,A',
+                'r2-0,10.0.0.1,DE,eu-central,A',
+            ]
+            assert mock_api.v1_checks_all_results_get.call_count == 2
+
+    def test_watch_tsv_default_columns(self, cli_runner, mock_config_with_api_key):
+        """Test watch writes TSV rows with the default result columns"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client, \
+             patch('time.sleep', side_effect=KeyboardInterrupt):
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.return_value = TestChecksWatch()._response(TestChecksWatch._result('r1', 1))
+
+            result = cli_runner.invoke(app, ['--output', 'tsv', 'checks', 'watch'])
+
+            assert result.exit_code == 0
+            header, row = result.stdout.splitlines()
+            assert header.split('\t')[:5] == ['id', 'check_id', 'check_name', 'check_type', 'status']
+            assert row.split('\t')[:6] == ['r1', 'check_123', 'API health', 'web', 'ok', '2025-01-01T12:01:00']
+
+
+class TestChecksFields:
+    """Test --fields projection of results"""
+
+    def _api(self, mock_get_client):
+        mock_api = Mock()
+        mock_get_client.return_value = mock_api
+        result = TestChecksWatch._result('r1', 1)
+        result.check_metadata = {'ssl_grade': 'A', 'logs': ['x' * 1000] * 100}
+        result.check_server = Mock(ip_address='10.0.0.1', country='DE', region='eu-central')
+        response = TestChecksWatch()._response(result)
+        response.pagination = None
+        mock_api.v1_checks_all_results_get.return_value = response
+        return mock_api
+
+    def test_results_only_requested_fields(self, cli_runner, mock_config_with_api_key):
+        """Test JSON carries just the requested fields, including parts of nested values"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            self._api(mock_get_client)
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'results', '--fields', 'id,status,check_metadata.ssl_grade,check_server.region'])
+
+            assert result.exit_code == 0
+            assert json.loads(result.stdout)['results'] == [
+                {'id': 'r1', 'status': 'ok', 'check_metadata': {'ssl_grade': 'A'}, 'check_server': {'region': 'eu-central'}},
+            ]
+
+    def test_csv_columns_follow_fields(self, cli_runner, mock_config_with_api_key):
+        """Test csv output uses the projected fields as columns"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            self._api(mock_get_client)
+
+            result = cli_runner.invoke(app, ['--output', 'csv', 'checks', 'results', '--fields', 'id,response_time,check_server.region'])
+
+            assert result.exit_code == 0
+            assert result.stdout.splitlines() == ['id,response_time,check_server.region', 'r1,120,eu-central']
+
+    def test_unknown_field(self, cli_runner, mock_config_with_api_key):
+        """Test an unknown field is rejected before any request"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = self._api(mock_get_client)
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'results', '--fields', 'id,latency'])
+
+            assert result.exit_code == 1
+            assert 'Unknown field(s): latency' in result.output
+            mock_api.v1_checks_all_results_get.assert_not_called()
+
+
+class TestChecksWhere:
+    """Test --where filters on checks listings"""
+
+    def test_results_pushdown_and_local_filter_across_pages(self, cli_runner, mock_config_with_api_key):
+        """Test equality terms go to the API and the rest filters each page of --all"""
+        def page(page, page_size, **params):
+            response = Mock()
+            response.pagination = None
+            response.results = [TestChecksWatch._result(f"r{page}-{i}", 1, status='failed') for i in range(page_size if page == 1 else 1)]
+            for i, result in enumerate(response.results):
+                result.response_time = 100 + 1000 * i
+            return response
+
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = page
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'results', '--all', '--page-size', '2', '--fields', 'id', '--where', 'status=failed and response_time>500'])
+
+            assert result.exit_code == 0
+            assert [r['id'] for r in json.loads(result.stdout)['results']] == ['r1-1']
+            assert mock_api.v1_checks_all_results_get.call_count == 2
+            for call in mock_api.v1_checks_all_results_get.call_args_list:
+                assert call.kwargs['status'] == 'failed'
+
+    def test_explicit_option_is_not_overridden(self, cli_runner, mock_config_with_api_key):
+        """Test a term on a field also given as an option is evaluated locally"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            checks = [Mock(id='c1', type='web', status='ok', url='https://a', interval=60, created_at=None, group_id=None, group=None),
+                      Mock(id='c2', type='web', status='failed', url='https://b', interval=60, created_at=None, group_id=None, group=None)]
+            for check, name in zip(checks, ['API', 'Docs']):
+                check.name = name
+            response = Mock(checks=checks, pagination=None)
+            mock_api.v1_checks_get.return_value = response
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'list', '--type', 'web', '--where', 'type=api or name~doc'])
+
+            assert result.exit_code == 0
+            assert [c['id'] for c in json.loads(result.stdout)['checks']] == ['c2']
+            mock_api.v1_checks_get.assert_called_once_with(page=1, page_size=20, type='web')
+
+
+class TestChecksLimit:
+    """Test --limit on checks listings"""
+
+    @staticmethod
+    def _pages(total):
+        def page(page, page_size, **params):
+            response = Mock()
+            response.pagination = None
+            start = (page - 1) * page_size
+            response.results = [TestChecksWatch._result(f"r{i}", 1, status='failed' if i % 10 == 0 else 'ok') for i in range(start, min(start + page_size, total))]
+            return response
+        return page
+
+    def test_page_size_for_limit(self):
+        """Test pages are sized for the fewest requests without over-fetching"""
+        from pingera_cli.commands.checks import ChecksCommand
+
+        assert ChecksCommand.page_size_for(None, limit=150) == 75
+        assert ChecksCommand.page_size_for(None, limit=30) == 30
+        assert ChecksCommand.page_size_for(None, limit=201) == 67
+        assert ChecksCommand.page_size_for(None) == 20
+        assert ChecksCommand.page_size_for(50, limit=150) == 50
+        assert ChecksCommand.page_size_for(None, page=3, limit=150) == 20
+
+    def test_limit_stops_requests(self, cli_runner, mock_config_with_api_key):
+        """Test --limit fetches just the pages it needs"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = self._pages(1000)
+
+            result = cli_runner.invoke(app, ['--output', 'csv', 'checks', 'results', '--limit', '150', '--columns', 'id'])
+
+            assert result.exit_code == 0
+            assert len(result.stdout.splitlines()) == 151
+            assert [call.kwargs['page_size'] for call in mock_api.v1_checks_all_results_get.call_args_list] == [75, 75]
+
+    def test_limit_with_local_filter(self, cli_runner, mock_config_with_api_key):
+        """Test a local filter uses full pages and stops once enough results matched"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_all_results_get.side_effect = self._pages(1000)
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'results', '--limit', '12', '--fields', 'id', '--where', 'id~0$'])
+
+            assert result.exit_code == 0
+            ids = [r['id'] for r in json.loads(result.stdout)['results']]
+            assert ids == [f"r{i}" for i in range(0, 120, 10)]
+            assert [call.kwargs['page'] for call in mock_api.v1_checks_all_results_get.call_args_list] == [1, 2]
+            assert mock_api.v1_checks_all_results_get.call_args.kwargs['page_size'] == 100
+
+
+class TestChecksDashboard:
+    """Test the multi-check dashboard"""
+
+    def test_sparkline(self):
+        """Test values scale onto block characters"""
+        from pingera_cli.commands.checks import sparkline
+        assert sparkline([100, 200, None, 300]) == "▁▄ █"
+        assert sparkline([]) == ""
+
+    def test_dashboard_uses_one_results_query(self, cli_runner, mock_config_with_api_key):
+        """Test results for all checks come from one unified query"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client, \
+             patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_unified:
+            mock_api = Mock()
+            mock_unified = Mock()
+            mock_get_client.return_value = mock_api
+            mock_get_unified.return_value = mock_unified
+
+            checks = []
+            for check_id, check_name in [('c1', 'Website'), ('c2', 'API')]:
+                check = Mock()
+                check.id = check_id
+                check.name = check_name
+                check.type = 'web'
+                checks.append(check)
+            mock_api.v1_checks_get.return_value = Mock(checks=checks)
+
+            results = []
+            for result_id, check_id, minute, status, response_time in [
+                ('r3', 'c2', 3, 'failed', 900), ('r2', 'c1', 2, 'ok', 150), ('r1', 'c1', 1, 'ok', 100),
+            ]:
+                result = TestChecksWatch._result(result_id, minute, status)
+                result.check_id = check_id
+                result.response_time = response_time
+                results.append(result)
+            mock_unified.v1_checks_all_results_get.return_value = Mock(results=results)
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'dashboard', '--group-id', 'grp_1'])
+
+            assert result.exit_code == 0
+            assert mock_unified.v1_checks_all_results_get.call_count == 1
+            assert mock_api.v1_checks_get.call_args.kwargs['group_id'] == 'grp_1'
+
+            board = {entry['id']: entry for entry in json.loads(result.stdout)['checks']}
+            assert board['c1']['status'] == 'ok'
+            assert board['c1']['response_times'] == [100, 150]
+            assert board['c2']['status'] == 'failed'
+
+    @staticmethod
+    def _board(*check_ids):
+        checks = []
+        for check_id in check_ids:
+            check = Mock()
+            check.id = check_id
+            check.name = check_id
+            check.type = 'web'
+            checks.append(check)
+        return Mock(checks=checks)
+
+    def test_single_check_board_queries_its_results(self, cli_runner, mock_config_with_api_key):
+        """Test a board with one check asks only for that check's results"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client, \
+             patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_unified:
+            mock_get_client.return_value.v1_checks_get.return_value = self._board('c1')
+            mock_unified = mock_get_unified.return_value
+            mock_unified.v1_checks_all_results_get.return_value = Mock(results=[TestChecksWatch._result('r1', 1)])
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'dashboard', '--name', 'Website'])
+
+            assert result.exit_code == 0
+            assert mock_unified.v1_checks_all_results_get.call_args.kwargs['check_id'] == 'c1'
+
+    def test_truncated_history_is_reported(self, cli_runner, mock_config_with_api_key):
+        """Test a board whose results query ran out of pages says its history is incomplete"""
+        from pingera_cli.commands.checks import DASHBOARD_MAX_PAGES, WATCH_PAGE_SIZE
+
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client, \
+             patch('pingera_cli.commands.checks.ChecksCommand.get_unified_results_client') as mock_get_unified:
+            mock_get_client.return_value.v1_checks_get.return_value = self._board('c1', 'c2')
+            mock_unified = mock_get_unified.return_value
+            # Every page is full of results of checks that are not on the board
+            counter = iter(range(10 ** 6))
+
+            def full_page(**kwargs):
+                results = []
+                for _ in range(WATCH_PAGE_SIZE):
+                    off_board = TestChecksWatch._result(f"r{next(counter)}", 1)
+                    off_board.check_id = 'other'
+                    results.append(off_board)
+                return Mock(results=results)
+
+            mock_unified.v1_checks_all_results_get.side_effect = full_page
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'dashboard', '--group-id', 'grp_1'])
+
+            assert result.exit_code == 0
+            assert mock_unified.v1_checks_all_results_get.call_count == DASHBOARD_MAX_PAGES
+            assert json.loads(result.stdout)['history_truncated'] is True
+
+
+class TestChecksBulk:
+    """Test bulk delete and update"""
+
+    @staticmethod
+    def _check(check_id, name):
+        check = Mock()
+        check.id = check_id
+        check.name = name
+        return check
+
+    @pytest.mark.parametrize('args', [
+        ['checks', 'delete', 'chk_1', 'chk_2', '--confirm'],
+        ['checks', 'groups', 'delete', 'grp_1', 'grp_2', '--confirm'],
+        ['pages', 'components', 'delete', 'cmp_1', 'cmp_2', '--page-id', 'p1', '--confirm'],
+        ['checks', 'groups', 'pause', 'grp_1'],
+    ])
+    def test_bulk_without_api_key(self, cli_runner, temp_config_dir, args):
+        """Test a missing API key is reported once, without a second empty error"""
+        with patch.dict('os.environ', {}, clear=True):
+            result = cli_runner.invoke(app, args)
+
+        assert result.exit_code == 1
+        assert "API key not found" in result.stderr
+        assert "Failed to" not in result.stderr
+
+    def test_delete_ids_from_stdin(self, cli_runner, mock_config_with_api_key):
+        """Test '-' reads IDs from stdin and deletes each once"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+
+            result = cli_runner.invoke(app, ['checks', 'delete', '-', '--confirm'], input='chk_1\nchk_2 chk_3\n# comment\nchk_1\n')
+
+            assert result.exit_code == 0
+            assert "3 checks deleted successfully" in result.stdout
+            deleted = sorted(call.kwargs['check_id'] for call in mock_api.v1_checks_check_id_delete.call_args_list)
+            assert deleted == ['chk_1', 'chk_2', 'chk_3']
+
+    def test_delete_by_filters_reports_failures(self, cli_runner, mock_config_with_api_key):
+        """Test filters select checks and per-check failures are reported at the end"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_get.return_value = Mock(checks=[
+                self._check('chk_1', 'staging web'),
+                self._check('chk_2', 'production web'),
+                self._check('chk_3', 'Staging API'),
+            ])
+
+            def delete(check_id):
+                if check_id == 'chk_3':
+                    raise Exception("Not found")
+
+            mock_api.v1_checks_check_id_delete.side_effect = delete
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'delete', '--type', 'web', '--name', '^staging', '--confirm'])
+
+            assert result.exit_code == 1
+            assert mock_api.v1_checks_get.call_args.kwargs['type'] == 'web'
+            report = json.loads(result.stdout)
+            assert report['succeeded'] == ['chk_1']
+            assert report['failed'] == [{'id': 'chk_3', 'name': 'Staging API', 'error': 'Not found'}]
+
+    def test_single_confirmation(self, cli_runner, mock_config_with_api_key):
+        """Test one prompt covers all checks and declining deletes nothing"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+
+            result = cli_runner.invoke(app, ['checks', 'delete', 'chk_1', 'chk_2'], input='n\n')
+
+            assert result.exit_code == 0
+            assert "Delete 2 checks?" in result.stdout
+            mock_api.v1_checks_check_id_delete.assert_not_called()
+
+    def test_bulk_update(self, cli_runner, mock_config_with_api_key):
+        """Test the same update is applied to every selected check"""
+        with patch('pingera_cli.commands.checks.ChecksCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+
+            result = cli_runner.invoke(app, ['checks', 'update', 'chk_1', 'chk_2', '--inactive', '--confirm'])
+
+            assert result.exit_code == 0
+            assert mock_api.v1_checks_check_id_patch.call_count == 2
+            assert all(call.kwargs['monitor_check1'] == {'active': False} for call in mock_api.v1_checks_check_id_patch.call_args_list)
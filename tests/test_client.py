@@ -0,0 +1,167 @@
+"""
+Tests for the shared SDK client factory
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from pingera_cli.utils import client, trace
+from pingera_cli.main import app
+from pingera_cli.utils.client import DeadlineExceeded, TokenBucket, get_api_client, set_deadline, time_remaining
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """Answer each request with the next scripted (status, headers) pair"""
+
+    def _respond(self):
+        self.server.requests.append(self.command)
+        status, headers = self.server.responses.pop(0) if self.server.responses else (200, {})
+        body = b'{}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.endswith('/slow'):
+            time.sleep(1)
+        self._respond()
+
+    do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_server(temp_config_dir):
+    """Local HTTP server configured as the API base URL, with instant backoff"""
+    server = HTTPServer(('127.0.0.1', 0), _ScriptedHandler)
+    server.requests = []
+    server.responses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    with open(f'{temp_config_dir}/config.json', 'w') as f:
+        json.dump({'base_url': base_url, 'retries': 2, 'rate_limit': 0}, f)
+
+    with patch.object(client, 'RETRY_BACKOFF_FACTOR', 0), patch.object(client, 'RETRY_BACKOFF_JITTER', 0):
+        yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _request(method: str, path: str = '/v1/checks'):
+    api_client = get_api_client('key')
+    response = api_client.rest_client.request(method, api_client.configuration.host + path)
+    return response.status
+
+
+class TestClient:
+    """Test pooled clients, retries and rate limiting"""
+
+    def test_client_is_pooled(self, temp_config_dir):
+        """Test the same client is returned for the same key"""
+        assert get_api_client('key') is get_api_client('key')
+        assert get_api_client('key') is not get_api_client('other')
+
+    def test_retries_idempotent_requests(self, api_server):
+        """Test GET is retried on 5xx until it succeeds"""
+        api_server.responses = [(503, {}), (502, {})]
+        assert _request('GET') == 200
+        assert api_server.requests == ['GET', 'GET', 'GET']
+
+    def test_returns_last_response_when_retries_exhausted(self, api_server):
+        """Test the final error response reaches the SDK instead of raising"""
+        api_server.responses = [(500, {})] * 5
+        assert _request('GET') == 500
+        assert len(api_server.requests) == 3
+
+    def test_does_not_retry_post_on_server_error(self, api_server):
+        """Test non-idempotent requests are not replayed after a 5xx"""
+        api_server.responses = [(500, {})]
+        assert _request('POST') == 500
+        assert api_server.requests == ['POST']
+
+    def test_retries_post_on_rate_limit(self, api_server):
+        """Test 429 is retried for any method, honoring Retry-After"""
+        api_server.responses = [(429, {'Retry-After': '0'})]
+        assert _request('POST') == 200
+        assert api_server.requests == ['POST', 'POST']
+
+    def test_retry_after_is_capped(self):
+        """Test huge Retry-After values do not stall the CLI"""
+        class _Response:
+            headers = {'Retry-After': '3600'}
+
+        assert client.build_retry(3).get_retry_after(_Response()) == client.RETRY_AFTER_MAX
+
+    def test_retry_after_bounded_by_deadline(self, api_server):
+        """Test a long Retry-After does not sleep past the command deadline"""
+        api_server.responses = [(503, {'Retry-After': '60'})] * 3
+        set_deadline(0.3)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            _request('GET')
+        assert time.monotonic() - start < 1
+        assert api_server.requests == ['GET']
+
+    def test_backoff_capped_at_time_left(self):
+        """Test backoff between retries never exceeds the time left"""
+        set_deadline(0.5)
+        retry = client.build_retry(3).increment('GET', '/', error=ConnectionError()).increment('GET', '/', error=ConnectionError())
+        assert retry.get_backoff_time() <= 0.5
+
+    def test_token_bucket_limits_rate(self):
+        """Test requests beyond the burst wait for refill"""
+        bucket = TokenBucket(rate=50, capacity=2)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.05
+
+    def test_read_timeout_bounded_by_deadline(self, api_server):
+        """Test a slow response is cut short by the command deadline"""
+        set_deadline(0.2)
+        start = time.monotonic()
+        with pytest.raises(Exception):
+            _request('GET', '/slow')
+        assert time.monotonic() - start < 0.9
+
+    def test_deadline_exceeded_before_request(self, api_server):
+        """Test no request starts once the deadline has passed"""
+        set_deadline(0.01)
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            _request('GET')
+        assert api_server.requests == []
+
+    def test_timeout_option_sets_deadline(self, cli_runner, temp_config_dir):
+        """Test the global --timeout option starts the command deadline"""
+        result = cli_runner.invoke(app, ['--timeout', '30', 'daemon', 'status', '--socket', f'{temp_config_dir}/none.sock'])
+        assert result.exit_code == 0
+        assert 0 < time_remaining() <= 30
+
+    def test_api_calls_are_traced(self, api_server):
+        """Test traced requests record endpoint, status, size and timings"""
+        trace.start_tracing('pngr test')
+        try:
+            assert _request('GET') == 200
+        finally:
+            tracer = trace.stop_tracing()
+
+        call, = tracer.summary()['api_calls']
+        assert call['method'] == 'GET'
+        assert call['endpoint'] == '/v1/checks'
+        assert call['status'] == 200
+        assert call['bytes'] == 2
+        assert 'connect_ms' in call and 'ttfb_ms' in call
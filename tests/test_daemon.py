@@ -0,0 +1,81 @@
+"""
+Tests for the pngr daemon and launcher
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pingera_cli import launcher
+from pingera_cli.utils.daemon import request_control, wait_for_daemon
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (Unix socket paths are length limited) and isolated config"""
+    directory = tempfile.mkdtemp(prefix='pngr-')
+    path = Path(directory) / 'daemon.sock'
+    with patch.dict(os.environ, {'PNGR_DAEMON_SOCKET': str(path), 'XDG_CONFIG_HOME': directory}):
+        yield path
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    """Serve a daemon from a separate process (it takes over the process stdio)"""
+    env = {**os.environ, 'PNGR_NO_DAEMON': '1'}
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'pingera_cli.main', 'daemon', 'start', '--foreground', '--socket', str(socket_path)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env,
+    )
+    try:
+        assert wait_for_daemon(socket_path, timeout=15)
+        yield process
+    finally:
+        request_control('stop', socket_path)
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class TestDaemon:
+    """Test daemon request handling"""
+
+    def test_run_via_daemon_streams_output(self, running_daemon, capsys):
+        """Test an invocation runs in the daemon and returns its exit code"""
+        exit_code = launcher.run_via_daemon(['version'])
+        assert exit_code == 0
+        assert 'PingeraCLI v' in capsys.readouterr().out
+
+    def test_run_via_daemon_usage_error(self, running_daemon, capsys):
+        """Test usage errors keep click's exit code"""
+        assert launcher.run_via_daemon(['no-such-command']) == 2
+        assert 'No such command' in capsys.readouterr().err
+
+    def test_status_and_stop(self, running_daemon, socket_path):
+        """Test control messages"""
+        launcher.run_via_daemon(['version'])
+        status = request_control('status', socket_path)
+        assert status['pid'] == running_daemon.pid
+        assert status['requests_served'] == 1
+        assert request_control('stop', socket_path)['stopped'] is True
+
+    def test_falls_back_without_daemon(self, socket_path):
+        """Test the launcher reports no daemon when nothing is listening"""
+        assert launcher.run_via_daemon(['version']) is None
+
+    def test_should_use_daemon(self):
+        """Test interactive and daemon management invocations stay local"""
+        with patch.object(launcher.sys, 'stdin', io.StringIO('')):
+            assert launcher.should_use_daemon(['checks', 'list'])
+            assert not launcher.should_use_daemon(['daemon', 'status'])
+            with patch.dict(os.environ, {'PNGR_NO_DAEMON': '1'}):
+                assert not launcher.should_use_daemon(['checks', 'list'])
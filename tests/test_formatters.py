@@ -0,0 +1,88 @@
+"""
+Tests for check result formatters
+"""
+
+import pytest
+from rich.text import Text
+
+from pingera_cli.formatters import FormatterRegistry, PortscanFormatter, SSLFormatter
+
+
+@pytest.fixture
+def portscan_metadata():
+    """Port scan metadata with many open ports"""
+    return {
+        'target': 'example.com',
+        'summary': {'hosts_up': 1, 'hosts_down': 0, 'total_hosts': 1, 'total_open_ports': 2000},
+        'scan_results': [{
+            'hostname': 'example.com',
+            'ip': '93.184.216.34',
+            'state': 'up',
+            'open_ports': [
+                {'port': port, 'protocol': 'tcp', 'service': 'http', 'product': 'nginx', 'version': '1.25'}
+                for port in range(2000)
+            ],
+        }],
+    }
+
+
+class TestFormatters:
+    """Test streaming formatter output"""
+
+    def test_iter_format_matches_format(self, portscan_metadata):
+        """Test joined chunks equal the full formatted string"""
+        formatter = PortscanFormatter(verbose=True)
+        chunks = list(formatter.iter_format(portscan_metadata))
+        assert len(chunks) > 2000
+        assert "".join(chunks) == formatter.format(portscan_metadata)
+
+    def test_iter_format_is_lazy(self, portscan_metadata):
+        """Test the first chunk is available before the whole scan is formatted"""
+        chunks = PortscanFormatter().iter_format(portscan_metadata)
+        assert "Port Scan Results" in next(chunks)
+
+    def test_iter_lines_have_balanced_markup(self, portscan_metadata):
+        """Test every streamed line renders on its own"""
+        registry = FormatterRegistry(verbose=True)
+        lines = list(registry.iter_lines(portscan_metadata))
+        for line in lines:
+            Text.from_markup(line)
+        assert any("nginx 1.25" in line for line in lines)
+        assert "\n".join(lines) == registry.format_metadata(portscan_metadata).lstrip("\n")
+
+    def test_ssl_truncation_notice(self):
+        """Test truncation flag propagates through nested generators"""
+        metadata = {
+            'ssl_grade': 'A',
+            'result_id': 'res_123',
+            'checks': {
+                'certificate_info': {'subject': 'CN=example.com'},
+                'protocol_support': {
+                    'tls_1_3': {
+                        'supported': True,
+                        'ciphers': ['a', 'b', 'c', 'd'],
+                        'cipher_details': [{'name': name, 'key_size': 256} for name in 'abcd'],
+                    }
+                },
+            },
+        }
+        output = SSLFormatter(verbose=False).format(metadata)
+        assert "1 more cipher(s)" in output
+        assert "pngr checks result res_123 --verbose" in output
+
+    def test_portscan_collapses_ports_and_hosts(self, portscan_metadata):
+        """Test non-verbose output shows top ports and collapses the rest"""
+        portscan_metadata['scan_results'].append({'hostname': 'quiet', 'ip': '10.0.0.2', 'state': 'up', 'open_ports': []})
+        output = PortscanFormatter(verbose=False).format(portscan_metadata)
+        assert output.count("Port [cyan]") == PortscanFormatter.TOP_PORTS
+        assert "1990 more open ports: http (1990)" in output
+        assert "1 host(s) with no open ports hidden" in output
+
+    def test_portscan_port_records(self, portscan_metadata):
+        """Test per-port records are flat and cover every open port"""
+        records = list(PortscanFormatter().iter_port_records(portscan_metadata))
+        assert len(records) == 2000
+        assert records[0] == {
+            'hostname': 'example.com', 'ip': '93.184.216.34', 'state': 'up', 'port': 0,
+            'protocol': 'tcp', 'service': 'http', 'product': 'nginx', 'version': '1.25', 'extrainfo': None,
+        }
@@ -0,0 +1,228 @@
+"""
+Tests for job wait strategies
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pingera_cli.main import app
+from pingera_cli.utils.job_wait import (
+    IntervalPoller, LongPoller, WaitStrategy, WebhookReceiver, select_strategy,
+)
+
+
+class FakeJobService:
+    """
+    A job API offering all three ways of waiting
+
+    Jobs move through the given statuses one step per advance(); status
+    fetches, long-polls and webhook deliveries are counted.
+    """
+
+    def __init__(self, statuses=('pending', 'running', 'completed')):
+        self.statuses = list(statuses)
+        self.step = 0
+        self.fetches = 0
+        self.long_polls = 0
+        self.webhooks = []
+        self.changed = threading.Condition()
+
+    def _job(self, job_id):
+        return SimpleNamespace(id=job_id, status=self.statuses[self.step])
+
+    def advance(self):
+        with self.changed:
+            self.step = min(self.step + 1, len(self.statuses) - 1)
+            self.changed.notify_all()
+        for job_id, url in self.webhooks:
+            body = json.dumps({'job_id': job_id}).encode('utf-8')
+            request = urllib.request.Request(url, data=body, method='POST', headers={'Content-Type': 'application/json'})
+            urllib.request.urlopen(request, timeout=5).close()
+
+    def get_status(self, job_id):
+        self.fetches += 1
+        return self._job(job_id)
+
+    def long_poll(self, job_id, last_status, hold):
+        self.long_polls += 1
+        with self.changed:
+            self.changed.wait_for(lambda: self.statuses[self.step] != last_status, timeout=hold)
+            return self._job(job_id)
+
+    def register(self, job_id, url):
+        self.webhooks.append((job_id, url))
+
+
+def _advance_later(service, times, delay=0.05):
+    def run():
+        for _ in range(times):
+            threading.Event().wait(delay)
+            service.advance()
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestIntervalPoller:
+    """Test polling at a fixed interval"""
+
+    def test_polls_until_finished(self):
+        """Test the status is fetched once per interval until the job is done"""
+        service = FakeJobService()
+        seen = []
+        with patch('time.sleep', side_effect=lambda seconds: service.advance()) as mock_sleep:
+            job_status, elapsed = IntervalPoller(service.get_status, interval=2).wait('job_1', 60, lambda status, _: seen.append(status.status))
+
+        assert job_status.status == 'completed'
+        assert seen == ['pending', 'running', 'completed']
+        assert service.fetches == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 2]
+        assert elapsed >= 4
+
+    def test_timeout(self):
+        """Test None is returned once the timeout passes"""
+        service = FakeJobService(statuses=('running',))
+        with patch('time.sleep'):
+            job_status, elapsed = IntervalPoller(service.get_status, interval=2).wait('job_1', 5)
+
+        assert job_status is None
+        assert elapsed >= 5
+        assert service.fetches == 3
+
+
+class TestLongPoller:
+    """Test waiting with requests held open"""
+
+    def test_one_request_per_change(self):
+        """Test each request returns as soon as the status changes, without sleeping"""
+        service = FakeJobService()
+        _advance_later(service, 2)
+        with patch('time.sleep') as mock_sleep:
+            job_status, _ = LongPoller(service.long_poll, hold=5).wait('job_1', 10)
+
+        assert job_status.status == 'completed'
+        assert service.long_polls == 3
+        mock_sleep.assert_not_called()
+
+    def test_timeout(self):
+        """Test an unchanged status ends the wait at the timeout"""
+        service = FakeJobService(statuses=('running',))
+        job_status, elapsed = LongPoller(service.long_poll, hold=5).wait('job_1', 0.2)
+
+        assert job_status is None
+        assert elapsed >= 0.2
+
+
+class TestWebhookReceiver:
+    """Test waiting for callbacks"""
+
+    def test_fetches_on_callback(self):
+        """Test the status is fetched after registering and then only when a callback arrives"""
+        service = FakeJobService()
+        receiver = WebhookReceiver(service.get_status, service.register, fallback_interval=10)
+
+        def register(job_id, url):
+            service.register(job_id, url)
+            _advance_later(service, 2)
+
+        receiver.register = register
+        job_status, elapsed = receiver.wait('job_1', 10)
+
+        assert job_status.status == 'completed'
+        assert service.fetches == 3
+        assert elapsed < 10
+        assert service.webhooks[0][1].startswith('http://127.0.0.1:')
+
+    def test_ignores_unknown_paths(self):
+        """Test a POST to another path is rejected and does not trigger a fetch"""
+        service = FakeJobService(statuses=('running', 'completed'))
+        receiver = WebhookReceiver(service.get_status, service.register, fallback_interval=10)
+        rejected = []
+
+        def register(job_id, url):
+            service.register(job_id, url)
+            wrong = url.rsplit('/', 1)[0] + '/guess'
+            try:
+                urllib.request.urlopen(urllib.request.Request(wrong, data=b'{}', method='POST'), timeout=5)
+            except urllib.error.HTTPError as e:
+                rejected.append(e.code)
+            _advance_later(service, 1)
+
+        receiver.register = register
+        job_status, _ = receiver.wait('job_1', 10)
+
+        assert rejected == [404]
+        assert job_status.status == 'completed'
+        assert service.fetches == 2
+
+    def test_fallback_fetch_without_callbacks(self):
+        """Test the status is still fetched when no callback ever arrives"""
+        service = FakeJobService(statuses=('running', 'completed'))
+        receiver = WebhookReceiver(service.get_status, register=lambda job_id, url: None, fallback_interval=0.05)
+        fetch = service.get_status
+
+        def get_status(job_id):
+            job_status = fetch(job_id)
+            service.step = 1
+            return job_status
+
+        receiver.get_status = get_status
+        job_status, _ = receiver.wait('job_1', 10)
+
+        assert job_status.status == 'completed'
+        assert service.fetches == 2
+
+
+class TestSelectStrategy:
+    """Test picking the cheapest way to wait"""
+
+    def test_prefers_cheapest_available(self):
+        """Test webhooks beat long-polling, which beats interval polling"""
+        service = FakeJobService()
+        webhook = WebhookReceiver(service.get_status, service.register)
+        long_poll = LongPoller(service.long_poll)
+        interval = IntervalPoller(service.get_status)
+
+        assert select_strategy([interval, long_poll, webhook]) is webhook
+        assert select_strategy([interval, long_poll]) is long_poll
+        assert select_strategy([interval]) is interval
+
+    def test_strategy_must_implement_wait(self):
+        """Test a strategy without wait() fails when it is created, not mid-wait"""
+        class NoWait(WaitStrategy):
+            name = 'none'
+
+        with pytest.raises(TypeError):
+            NoWait()
+
+    def test_skips_unavailable(self):
+        """Test strategies without API support are passed over"""
+        service = FakeJobService()
+        interval = IntervalPoller(service.get_status)
+
+        assert select_strategy([WebhookReceiver(service.get_status, register=None), LongPoller(None), interval]) is interval
+        with pytest.raises(ValueError):
+            select_strategy([LongPoller(None)])
+
+    def test_command_uses_interval_polling(self, cli_runner, mock_config_with_api_key):
+        """Test run falls back to interval polling, as the API offers nothing cheaper yet"""
+        checks_api = Mock()
+        checks_api.v1_checks_execute_post.return_value = SimpleNamespace(job_id='job_1')
+        checks_api.v1_checks_jobs_job_id_get.side_effect = [
+            SimpleNamespace(status='running'),
+            SimpleNamespace(status='failed', error_message='boom', result=None, job_type='custom', check_id=None,
+                            check_parameters={}, created_at=None, started_at=None, completed_at=None),
+        ]
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client', return_value=checks_api), \
+             patch('time.sleep') as mock_sleep:
+            result = cli_runner.invoke(app, ['checks', 'run', 'custom', '--url', 'https://example.com', '--type', 'web'])
+
+        assert result.exit_code == 0
+        assert checks_api.v1_checks_jobs_job_id_get.call_count == 2
+        assert 2.0 in [call.args[0] for call in mock_sleep.call_args_list]
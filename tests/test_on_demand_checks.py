@@ -363,3 +363,185 @@ class TestOnDemandChecksCommand:
         
         assert result.exit_code == 1
         assert "Playwright script file is empty" in result.stdout
+
+
+class TestJobsSinceLast:
+    """Test the --since-last cursor of checks jobs list"""
+
+    @staticmethod
+    def _job(number):
+        return Mock(id=f"job_{number}", status='completed', job_type='custom', check_id=None, error_message=None,
+                    check_parameters={'name': f"Check {number}", 'type': 'web'},
+                    created_at=datetime(2025, 1, 1, 12, number), started_at=None, completed_at=None)
+
+    def _listing(self, mock_api, numbers, per_page=2):
+        # Newest first, like the API
+        jobs = [self._job(number) for number in sorted(numbers, reverse=True)]
+
+        def page(page, per_page, **params):
+            return Mock(jobs=jobs[(page - 1) * per_page:page * per_page], pagination=None)
+        mock_api.v1_checks_jobs_get.side_effect = page
+
+    def _run(self, cli_runner, *args):
+        result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'jobs', 'list', '--since-last', '--page-size', '2', *args])
+        return result, [job['job_id'] for job in json.loads(result.stdout)['jobs']] if result.exit_code == 0 else None
+
+    def test_only_new_jobs_after_first_run(self, cli_runner, mock_config_with_api_key):
+        """Test the first run lists everything and later runs only what is newer"""
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client:
+            mock_api = mock_get_client.return_value
+            self._listing(mock_api, [1, 2, 3])
+            result, ids = self._run(cli_runner)
+            assert result.exit_code == 0
+            assert ids == ['job_3', 'job_2', 'job_1']
+
+            self._listing(mock_api, [1, 2, 3, 4, 5])
+            result, ids = self._run(cli_runner)
+            assert ids == ['job_5', 'job_4']
+
+            result, ids = self._run(cli_runner, '--where', 'status=failed')
+            assert result.exit_code == 0
+            assert json.loads(result.stdout)['jobs'] == []
+
+    def test_failed_run_keeps_cursor(self, cli_runner, mock_config_with_api_key):
+        """Test the cursor only moves after the jobs were output"""
+        from pingera_cli.utils.cursor import load_cursor
+
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client:
+            mock_api = mock_get_client.return_value
+            self._listing(mock_api, [1])
+            self._run(cli_runner)
+            cursor = load_cursor('checks.jobs')
+
+            mock_api.v1_checks_jobs_get.side_effect = Exception("connection reset")
+            result, _ = self._run(cli_runner)
+
+            assert result.exit_code == 1
+            assert load_cursor('checks.jobs') == cursor
+            assert cursor['ids'] == ['job_1']
+
+    def test_cursor_is_per_account(self, cli_runner, mock_config_with_api_key, monkeypatch):
+        """Test another API key starts from its own cursor"""
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client:
+            self._listing(mock_get_client.return_value, [1, 2])
+            self._run(cli_runner)
+
+            monkeypatch.setenv('PINGERA_API_KEY', 'other-key')
+            result, ids = self._run(cli_runner)
+            assert ids == ['job_2', 'job_1']
+
+    def test_rejects_limit(self, cli_runner, mock_config_with_api_key):
+        """Test --since-last cannot skip jobs through --limit"""
+        result = cli_runner.invoke(app, ['checks', 'jobs', 'list', '--since-last', '--limit', '5'])
+
+        assert result.exit_code == 1
+        assert "--since-last cannot be combined" in result.output
+
+
+class TestMultiRegionDetails:
+    """Test --details for multi-region jobs"""
+
+    REGIONS = ['eu-west', 'us-east', 'ap-south']
+
+    def _job(self):
+        return Mock(status='completed', job_type='custom', check_id=None, error_message=None, check_parameters={'name': 'API', 'type': 'web'},
+                    created_at=None, started_at=None, completed_at=None,
+                    result={'total_regions': 3, 'completed_regions': 3, 'regional_summary': [
+                        {'region': region, 'status': 'ok', 'response_time': 100, 'result_id': f"res_{region}"} for region in self.REGIONS
+                    ]})
+
+    @staticmethod
+    def _result(result_id):
+        result = Mock(id=result_id, check_id=None, check_name='API', check_type='web', status='ok', created_at=None, response_time=100,
+                      error_message=None, check_server_id=None, region=result_id[4:], result_type='on_demand', check_server=None)
+        result.check_metadata = {'status_code': 200, 'headers': {'server': 'nginx'}}
+        return result
+
+    def _results_api(self, mock_results_api, failing=None):
+        import threading
+        # Every fetch waits for the others, so this only passes if they run at once
+        barrier = threading.Barrier(len(self.REGIONS), timeout=5)
+
+        def fetch(result_id):
+            barrier.wait()
+            if result_id == failing:
+                raise Exception("HTTP 500: Internal Server Error")
+            return Mock(results=[self._result(result_id)])
+        mock_results_api.return_value.v1_checks_all_results_get.side_effect = lambda result_id: fetch(result_id)
+
+    def test_json_fetches_regions_concurrently(self, cli_runner, mock_config_with_api_key):
+        """Test every region's full result is fetched in parallel and included"""
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client, \
+             patch('pingera.api.ChecksUnifiedResultsApi') as mock_results_api:
+            mock_get_client.return_value.v1_checks_jobs_job_id_get.return_value = self._job()
+            self._results_api(mock_results_api)
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'jobs', 'status', 'job_1', '--details'])
+
+            assert result.exit_code == 0
+            regional = json.loads(result.stdout)['regional_results']
+            assert [record['id'] for record in regional] == [f"res_{region}" for region in self.REGIONS]
+            assert regional[0]['check_metadata']['status_code'] == 200
+
+    def test_table_shows_each_region(self, cli_runner, mock_config_with_api_key):
+        """Test region panels are rendered with formatted metadata, and a failed fetch only affects its region"""
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client, \
+             patch('pingera.api.ChecksUnifiedResultsApi') as mock_results_api:
+            mock_get_client.return_value.v1_checks_jobs_job_id_get.return_value = self._job()
+            self._results_api(mock_results_api, failing='res_us-east')
+
+            result = cli_runner.invoke(app, ['checks', 'jobs', 'status', 'job_1', '--details'])
+
+            assert result.exit_code == 0
+            assert "Regional Details" in result.stdout
+            assert "eu-west" in result.stdout and "ap-south" in result.stdout
+            assert "Could not fetch result res_us-east" in result.stdout
+            assert "200" in result.stdout
+
+
+class TestRegionalWait:
+    """Test waiting for the last regions of a multi-region job"""
+
+    @staticmethod
+    def _status(reported, total=3):
+        regions = ['eu-west', 'us-east', 'ap-south'][:reported]
+        return Mock(status='completed', job_type='custom', check_id=None, error_message=None, check_parameters={'name': 'API', 'type': 'web'},
+                    created_at=None, started_at=None, completed_at=None,
+                    result={'total_regions': total, 'completed_regions': reported, 'regional_summary': [
+                        {'region': region, 'status': 'ok', 'response_time': 100 + i, 'result_id': f"res_{region}"} for i, region in enumerate(regions)
+                    ]})
+
+    def test_polls_until_all_regions_report(self, cli_runner, mock_config_with_api_key):
+        """Test regions are shown as they land and polling backs off until all are in"""
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client, \
+             patch('pingera.api.ChecksUnifiedResultsApi'), \
+             patch('time.sleep') as mock_sleep:
+            jobs_api = mock_get_client.return_value
+            jobs_api.v1_checks_jobs_job_id_get.side_effect = [self._status(1), self._status(2), self._status(3)]
+
+            result = cli_runner.invoke(app, ['checks', 'jobs', 'status', 'job_1'])
+
+            assert result.exit_code == 0
+            assert "eu-west: ok 100ms (1/3)" in result.stdout
+            assert "ap-south: ok 102ms (3/3)" in result.stdout
+            assert "partial results" not in result.stdout
+            assert "res_ap-south" in result.stdout
+            assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    def test_complete_job_does_not_poll(self, mock_config_with_api_key):
+        """Test a job with every region in is returned as is"""
+        command = OnDemandChecksCommand('table')
+        status = self._status(3)
+        with patch.object(OnDemandChecksCommand, 'get_client') as mock_get_client:
+            assert command._wait_for_regions('job_1', status) is status
+            mock_get_client.assert_not_called()
+
+    def test_deadline_shows_partial_results(self, mock_config_with_api_key):
+        """Test waiting stops at the deadline with a warning instead of hiding the missing regions"""
+        command = OnDemandChecksCommand('table')
+        with patch.object(OnDemandChecksCommand, 'get_client'), \
+             patch.object(command, 'display_warning') as mock_warning:
+            status = command._wait_for_regions('job_1', self._status(2), timeout=0)
+
+            assert len(command._regional_progress(status)[0]) == 2
+            assert "2 of 3 regions reported" in mock_warning.call_args.args[0]
@@ -0,0 +1,43 @@
+"""
+Tests for --profile
+"""
+
+import pstats
+
+from pingera_cli.main import app
+from pingera_cli.utils.profiling import CommandProfiler
+
+
+def _busy():
+    return sum(i * i for i in range(200000))
+
+
+class TestProfiling:
+    """Test profiler output files"""
+
+    def test_profiler_writes_pstats_and_collapsed_stacks(self, tmp_path):
+        """Test both output files are written and contain the profiled code"""
+        profiler = CommandProfiler(str(tmp_path / 'run.pstats'))
+        profiler.start()
+        for _ in range(10):
+            _busy()
+        pstats_path, collapsed_path = profiler.stop()
+
+        assert pstats_path == tmp_path / 'run.pstats'
+        assert collapsed_path == tmp_path / 'run.collapsed'
+        assert any(name == '_busy' for _, _, name in pstats.Stats(str(pstats_path)).stats)
+
+        lines = collapsed_path.read_text().splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(' ', 1)
+        assert stack.startswith('thread:') and int(count) > 0
+        assert any('_busy (' in line for line in lines)
+
+    def test_profile_option(self, cli_runner, temp_config_dir, tmp_path):
+        """Test --profile writes files when the command ends"""
+        base = tmp_path / 'prof'
+        result = cli_runner.invoke(app, ['--profile-output', str(base), 'daemon', 'status', '--socket', str(tmp_path / 'none.sock')])
+
+        assert result.exit_code == 0
+        assert (tmp_path / 'prof.pstats').exists()
+        assert (tmp_path / 'prof.collapsed').exists()
@@ -0,0 +1,45 @@
+"""
+Tests for the interactive shell
+"""
+
+from unittest.mock import patch
+
+import typer.main
+
+from pingera_cli.main import app
+from pingera_cli.commands.shell import IdIndex, ShellCommand, ShellCompleter
+
+
+class TestShell:
+    """Test shell dispatch and completion"""
+
+    def test_completes_command_tree(self):
+        """Test subcommands complete at each level"""
+        completer = ShellCompleter(typer.main.get_command(app), IdIndex())
+        assert 'checks' in completer.candidates([])
+        assert 'exit' in completer.candidates([])
+        assert 'results' in completer.candidates(['checks'])
+        assert '--page-size' in completer.candidates(['checks', 'list'])
+
+    def test_completes_ids_from_index(self):
+        """Test ID arguments complete from the session index, loaded once"""
+        id_index = IdIndex()
+        completer = ShellCompleter(typer.main.get_command(app), id_index)
+        with patch.object(id_index, '_load_check_ids', return_value=['chk_1', 'chk_2']) as mock_load:
+            id_index._loaders['check_id'] = mock_load
+            assert 'chk_1' in completer.candidates(['checks', 'get'])
+            assert 'chk_2' in completer.candidates(['checks', 'delete'])
+            assert mock_load.call_count == 1
+
+    def test_session_options_applied(self, temp_config_dir):
+        """Test global options from shell start apply unless overridden"""
+        shell_cmd = ShellCommand('json', verbose=True)
+        assert shell_cmd._with_session_options(['checks', 'list']) == ['--output', 'json', '--verbose', 'checks', 'list']
+        assert shell_cmd._with_session_options(['-o', 'yaml', 'checks', 'list']) == ['-o', 'yaml', 'checks', 'list']
+
+    def test_dispatches_lines_in_process(self, cli_runner, temp_config_dir):
+        """Test lines run through the same app until exit"""
+        result = cli_runner.invoke(app, ['shell'], input='version\nnosuch\nexit\n')
+        assert result.exit_code == 0
+        assert 'PingeraCLI v' in result.output
+        assert "No such command 'nosuch'" in result.output
@@ -0,0 +1,92 @@
+"""
+Tests for snapshot export and import
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from pingera.models import CheckGroup1, CheckSecret, Component, Incident, MonitorCheck, Page
+
+from pingera_cli.main import app
+
+
+def _source_clients():
+    clients = {name: Mock() for name in ['checks', 'groups', 'secrets', 'pages', 'components', 'incidents']}
+    clients['groups'].v1_check_groups_get.return_value = SimpleNamespace(groups=[CheckGroup1(id='g1', name='APIs')], pagination=None)
+    clients['checks'].v1_checks_get.return_value = SimpleNamespace(checks=[
+        MonitorCheck(id='c1', name='Web', type='web', url='https://example.com', interval=60, group_id='g1'),
+        MonitorCheck(id='c2', name='Ungrouped', type='tcp', host='example.com', port=443, interval=60),
+    ], pagination=None)
+    clients['secrets'].v1_checks_check_id_secrets_get.side_effect = lambda check_id: [CheckSecret(secret_id='s1', env_variable='TOKEN')] if check_id == 'c1' else []
+    clients['pages'].v1_pages_get.return_value = SimpleNamespace(pages=[Page(id='p1', name='Status', subdomain='status')], pagination=None)
+    clients['components'].v1_pages_page_id_components_get.return_value = [
+        Component(id='k1', name='Backend', group=True),
+        Component(id='k2', name='API', group_id='k1'),
+    ]
+    clients['incidents'].v1_pages_page_id_incidents_get.return_value = [
+        Incident(id='i1', name='Outage', status='resolved', components=[{'id': 'k2', 'status': 'major_outage'}]),
+    ]
+    return clients
+
+
+def _target_clients():
+    clients = {name: Mock() for name in ['checks', 'groups', 'secrets', 'pages', 'components', 'incidents']}
+    clients['groups'].v1_check_groups_post.side_effect = lambda check_group1: SimpleNamespace(id='new-g1')
+    clients['checks'].v1_checks_post.side_effect = lambda monitor_check: SimpleNamespace(id=f"new-{monitor_check['name']}")
+    clients['pages'].v1_pages_post.side_effect = lambda page: SimpleNamespace(id='new-p1')
+    clients['components'].v1_pages_page_id_component_groups_post.side_effect = lambda page_id, component: SimpleNamespace(id='new-k1')
+    clients['components'].v1_pages_page_id_components_post.side_effect = lambda page_id, component: SimpleNamespace(id='new-k2')
+    clients['incidents'].v1_pages_page_id_incidents_post.side_effect = lambda page_id, incident_create: SimpleNamespace(id='new-i1')
+    return clients
+
+
+class TestSnapshot:
+    """Test exporting a snapshot and importing it into another account"""
+
+    def test_export_then_import(self, cli_runner, mock_config_with_api_key, tmp_path):
+        """Test a snapshot round trip recreates resources with mapped references"""
+        path = str(tmp_path / 'snapshot.tar')
+
+        with patch('pingera_cli.commands.snapshot.SnapshotCommand.get_clients', return_value=_source_clients()):
+            result = cli_runner.invoke(app, ['--output', 'json', 'export', path])
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)['resources'] == {
+            'check_groups': 1, 'checks': 2, 'check_secrets': 1, 'pages': 1, 'components': 2, 'incidents': 1,
+        }
+
+        target = _target_clients()
+        with patch('pingera_cli.commands.snapshot.SnapshotCommand.get_clients', return_value=target):
+            result = cli_runner.invoke(app, ['--output', 'json', 'import', path, '--confirm'])
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)['created']['checks'] == 2
+
+        created_check = target['checks'].v1_checks_post.call_args_list[0].kwargs['monitor_check']
+        assert 'group_id' not in created_check and 'id' not in created_check
+        target['groups'].v1_checks_check_id_group_patch.assert_called_once_with(check_id='new-Web', generated={'group_id': 'new-g1'})
+        target['secrets'].v1_checks_check_id_secrets_put.assert_called_once_with('new-Web', [{'secret_id': 's1', 'env_variable': 'TOKEN'}])
+
+        component = target['components'].v1_pages_page_id_components_post.call_args.kwargs
+        assert component['page_id'] == 'new-p1' and component['component']['group_id'] == 'new-k1'
+
+        incident = target['incidents'].v1_pages_page_id_incidents_post.call_args.kwargs
+        assert incident['page_id'] == 'new-p1'
+        assert incident['incident_create']['components'] == {'new-k2': 'major_outage'}
+        assert incident['incident_create']['deliver_notifications'] is False
+
+    def test_import_reports_failures(self, cli_runner, mock_config_with_api_key, tmp_path):
+        """Test dependents of a failed resource fail with a clear error instead of aborting the import"""
+        path = str(tmp_path / 'snapshot.tar')
+        with patch('pingera_cli.commands.snapshot.SnapshotCommand.get_clients', return_value=_source_clients()):
+            cli_runner.invoke(app, ['export', path])
+
+        target = _target_clients()
+        target['pages'].v1_pages_post.side_effect = Exception("Subdomain already taken")
+        with patch('pingera_cli.commands.snapshot.SnapshotCommand.get_clients', return_value=target):
+            result = cli_runner.invoke(app, ['--output', 'json', 'import', path, '--confirm'])
+
+        assert result.exit_code == 1
+        failed = {(item['resource'], item['id']): item['error'] for item in json.loads(result.stdout)['failed']}
+        assert failed[('pages', 'p1')] == "Subdomain already taken"
+        assert failed[('incidents', 'i1')] == "status page p1 was not imported"
+        assert target['checks'].v1_checks_post.call_count == 2
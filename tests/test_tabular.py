@@ -0,0 +1,52 @@
+"""
+Tests for CSV and TSV output
+"""
+
+import io
+from datetime import datetime
+
+import pytest
+
+from pingera_cli.utils.tabular import TabularWriter, parse_columns, records_of
+
+
+class TestTabular:
+    """Test flattening records into rows"""
+
+    def test_nested_fields_become_dotted_columns(self):
+        """Test nested objects are flattened and values are rendered plainly"""
+        stream = io.StringIO()
+        writer = TabularWriter('csv', stream=stream)
+        writer.write([{'id': 'r1', 'ok': True, 'at': datetime(2025, 1, 1, 12, 0), 'server': {'region': 'eu, west'}, 'tags': ['a', 'b'], 'error': None}])
+
+        assert stream.getvalue().splitlines() == [
+            'id,ok,at,server.region,tags,error',
+            'r1,true,2025-01-01T12:00:00,"eu, west","[""a"",""b""]",',
+        ]
+
+    def test_columns_fixed_by_spec_across_batches(self):
+        """Test the header is written once and missing fields are empty"""
+        stream = io.StringIO()
+        writer = TabularWriter('tsv', columns=['id', 'server.*', 'meta.grade'], stream=stream)
+        assert writer.write([{'id': 'r1', 'server': {'ip': '10.0.0.1', 'region': 'eu'}, 'meta': {'grade': 'A'}}]) == 1
+        assert writer.write([{'id': 'r2', 'server': None}]) == 1
+
+        assert stream.getvalue().splitlines() == [
+            'id\tserver.ip\tserver.region\tmeta.grade',
+            'r1\t10.0.0.1\teu\tA',
+            'r2\t\t\t',
+        ]
+
+    def test_parse_columns(self):
+        """Test specs replace or extend the defaults"""
+        assert parse_columns(None, ['id']) == ['id']
+        assert parse_columns('status, region', ['id']) == ['status', 'region']
+        assert parse_columns('+meta.grade,id', ['id']) == ['id', 'meta.grade']
+        with pytest.raises(ValueError):
+            parse_columns(',', ['id'])
+
+    def test_records_of_command_output(self):
+        """Test the record list is picked out of wrapped command output"""
+        assert records_of({'checks': [{'id': 'c1'}], 'pagination': {'page': 1}}) == [{'id': 'c1'}]
+        assert records_of({'checks': [], 'total': 0, 'message': 'No checks found'}) == []
+        assert records_of({'id': 'c1', 'regions': []}) == [{'id': 'c1', 'regions': []}]
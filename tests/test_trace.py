@@ -0,0 +1,92 @@
+"""
+Tests for timing instrumentation
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+from pingera_cli.main import app
+from pingera_cli.utils import otlp, trace
+
+
+class TestTrace:
+    """Test trace records and summaries"""
+
+    def test_nested_spans_counted_once(self):
+        """Test phases only sum top-level records"""
+        tracer = trace.Tracer('pngr checks list')
+        with tracer.span('api', 'GET /v1/checks'):
+            with tracer.span('config', 'config load'):
+                pass
+        tracer.finish()
+
+        summary = tracer.summary()
+        assert summary['phases']['api']['calls'] == 1
+        assert summary['phases']['config']['calls'] == 0
+        assert len(summary['api_calls']) == 1
+
+    def test_span_is_noop_without_tracer(self):
+        """Test hooks work when tracing is off"""
+        assert trace.get_tracer() is None
+        with trace.span('api', 'GET /') as record:
+            record['attributes']['status'] = 200
+
+    def test_command_name_from_arguments(self):
+        """Test the trace is named after the command, skipping global options"""
+        trace.set_invocation_args(['--output', 'json', 'checks', 'list', '--page-size', '5'])
+        assert trace.command_name('checks') == 'pngr checks list'
+
+    def test_trace_file_written(self, cli_runner, temp_config_dir, tmp_path):
+        """Test --trace-file writes the summary as JSON when the command ends"""
+        trace_path = tmp_path / 'trace.json'
+        trace.set_invocation_args(['daemon', 'status'])
+        result = cli_runner.invoke(app, ['--trace-file', str(trace_path), 'daemon', 'status', '--socket', str(tmp_path / 'none.sock')])
+
+        assert result.exit_code == 0
+        summary = json.loads(trace_path.read_text())
+        assert summary['command'] == 'pngr daemon status'
+        assert summary['phases']['render']['calls'] >= 1
+        assert trace.get_tracer() is None
+
+    def test_otlp_export_nests_spans(self):
+        """Test the command is the root span and records keep their nesting"""
+        tracer = trace.Tracer('pngr checks run existing')
+        tracer.attributes.update(job_id='job_1', check_id='chk_1')
+        with tracer.span('poll', 'poll job status', job_id='job_1'):
+            with tracer.span('api', 'GET /v1/checks/jobs/job_1', method='GET', status=200):
+                pass
+        tracer.finish()
+
+        traceparent = '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'
+        with patch.dict(os.environ, {'TRACEPARENT': traceparent}):
+            request = otlp.build_export_request(tracer)
+
+        root, poll, api = request['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert root['name'] == 'pngr checks run existing'
+        assert root['traceId'] == '4bf92f3577b34da6a3ce929d0e0e4736'
+        assert root['parentSpanId'] == '00f067aa0ba902b7'
+        assert {'key': 'pngr.job_id', 'value': {'stringValue': 'job_1'}} in root['attributes']
+        assert poll['parentSpanId'] == root['spanId']
+        assert api['parentSpanId'] == poll['spanId']
+        assert {'key': 'http.response.status_code', 'value': {'intValue': '200'}} in api['attributes']
+        assert int(root['startTimeUnixNano']) <= int(api['startTimeUnixNano']) <= int(root['endTimeUnixNano'])
+
+    def test_otlp_file_appended(self, cli_runner, temp_config_dir, tmp_path):
+        """Test --otlp-file appends one export request per invocation, offline"""
+        otlp_path = tmp_path / 'spans.jsonl'
+        args = ['--otlp-file', str(otlp_path), 'daemon', 'status', '--socket', str(tmp_path / 'none.sock')]
+        cli_runner.invoke(app, args)
+        cli_runner.invoke(app, args)
+
+        lines = otlp_path.read_text().splitlines()
+        assert len(lines) == 2
+        spans = json.loads(lines[0])['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert spans[0]['name'].startswith('pngr')
+
+    def test_malformed_otlp_endpoint_warns(self, cli_runner, temp_config_dir, tmp_path):
+        """Test a malformed --otlp-endpoint warns instead of raising after the command"""
+        result = cli_runner.invoke(app, ['--otlp-endpoint', 'http//x', 'daemon', 'status', '--socket', str(tmp_path / 'none.sock')])
+
+        assert result.exception is None
+        assert "Could not export spans to http//x" in result.stderr
@@ -0,0 +1,180 @@
+"""
+Tests for --where filter expressions
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pingera.models import Incident
+
+from pingera_cli.main import app
+from pingera_cli.utils.where import compile_where
+
+NOW = datetime(2025, 1, 10, tzinfo=timezone.utc)
+
+RECORDS = [
+    {'status': 'resolved', 'impact': 'major', 'created_at': datetime(2025, 1, 9), 'response_time': 600, 'region': 'eu-west'},
+    {'status': 'investigating', 'impact': 'major', 'created_at': datetime(2024, 1, 9), 'response_time': 100, 'region': 'us-east'},
+    {'status': 'Investigating', 'impact': 'minor', 'created_at': datetime(2025, 1, 8), 'response_time': None, 'region': 'EU-central'},
+]
+
+
+def _matching(expression, pushdown=None):
+    where = compile_where(expression, pushdown, now=NOW)
+    return [index for index, record in enumerate(RECORDS) if where(record)]
+
+
+class TestWhere:
+    """Test compiling and evaluating expressions"""
+
+    @pytest.mark.parametrize('expression, expected', [
+        ('status!=resolved and impact=major', [1]),
+        ('status=investigating', [1, 2]),
+        ('response_time>500 and region~^eu', [0]),
+        ('response_time=null', [2]),
+        ('created_at>=7d', [0, 2]),
+        ('created_at<2025-01-01T00:00:00Z', [1]),
+        ('not (status=resolved or impact=minor)', [1]),
+        ('impact=minor or response_time>=600', [0, 2]),
+        ("region !~ 'us|central'", [0]),
+    ])
+    def test_expressions(self, expression, expected):
+        """Test operators, type-aware comparisons and boolean structure"""
+        assert _matching(expression) == expected
+
+    def test_string_timestamps(self):
+        """Test ISO timestamps held as strings compare as dates, not as text"""
+        records = [{'resolved_at': '2025-01-09T12:00:00Z'}, {'resolved_at': '2024-06-01T00:00:00+00:00'}, {'resolved_at': None}]
+        recent = compile_where('resolved_at>=7d', now=NOW)
+        older = compile_where('resolved_at<7d', now=NOW)
+        assert [recent(record) for record in records] == [True, False, False]
+        assert [older(record) for record in records] == [False, True, False]
+
+    def test_pushdown_only_top_level_equality(self):
+        """Test API-side terms are split off only when the API alone can decide them"""
+        where = compile_where('component=c1 and status!=resolved', {'component': 'component_id'}, now=NOW)
+        assert where.params == {'component_id': 'c1'}
+        assert where({'status': 'investigating'})
+
+        assert compile_where('component=c1', {'component': 'component_id'}).is_local is False
+        assert compile_where('component=c1 or status=resolved', {'component': 'component_id'}).params == {}
+        assert compile_where('component=null', {'component': 'component_id'}).params == {}
+
+    @pytest.mark.parametrize('expression, message', [
+        ('status=', 'expected a value'),
+        ('(status=resolved', r"expected '\)'"),
+        ('status=resolved impact=major', "unexpected 'impact'"),
+        ('region~[', 'Invalid pattern'),
+    ])
+    def test_invalid_expressions(self, expression, message):
+        """Test errors point at the problem"""
+        with pytest.raises(ValueError, match=message):
+            compile_where(expression)
+
+
+class TestIncidentsWhere:
+    """Test incidents list filters"""
+
+    def test_list_pushes_component_and_filters_locally(self, cli_runner, mock_config_with_api_key):
+        """Test component terms go to the API and the rest is applied to the returned incidents"""
+        with patch('pingera_cli.commands.incidents.IncidentsCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_pages_page_id_incidents_get.return_value = [
+                Incident(id='i1', name='Outage', status='investigating', impact='major', created_at=datetime(2025, 1, 9, tzinfo=timezone.utc)),
+                Incident(id='i2', name='Old outage', status='resolved', impact='major', created_at=datetime(2024, 1, 9, tzinfo=timezone.utc)),
+                Incident(id='i3', name='Slow', status='monitoring', impact='minor', created_at=datetime(2025, 1, 8, tzinfo=timezone.utc)),
+            ]
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'pages', 'incidents', 'list', '--page-id', 'p1', '--where', 'component=k1 and impact=major', '--unresolved', '--since', '2025-01-01'])
+
+            assert result.exit_code == 0
+            assert [incident['id'] for incident in json.loads(result.stdout)['incidents']] == ['i1']
+            mock_api.v1_pages_page_id_incidents_get.assert_called_once_with(page_id='p1', component_id='k1')
+
+    @pytest.mark.parametrize('expression, expected, params', [
+        ('component!=k1', ['i2', 'i3'], {}),
+        ('component~^k', ['i1', 'i2'], {}),
+        ('impact=minor or component=k2', ['i2', 'i3'], {}),
+        ('component=null', ['i3'], {}),
+        ('component=k1', ['i1', 'i2', 'i3'], {'component_id': 'k1'}),
+    ])
+    def test_component_evaluated_locally(self, cli_runner, mock_config_with_api_key, expression, expected, params):
+        """Test component terms the API cannot take match the affected components' IDs"""
+        with patch('pingera_cli.commands.incidents.IncidentsCommand.get_client') as mock_get_client:
+            mock_api = mock_get_client.return_value
+            mock_api.v1_pages_page_id_incidents_get.return_value = [
+                Incident(id='i1', name='Outage', status='investigating', impact='major', components=[{'id': 'k1', 'status': 'major_outage'}]),
+                Incident(id='i2', name='Slow', status='monitoring', impact='minor', components=[{'id': 'k2', 'status': 'degraded_performance'}]),
+                Incident(id='i3', name='Notice', status='resolved', impact='minor', components=[]),
+            ]
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'pages', 'incidents', 'list', '--page-id', 'p1', '--where', expression])
+
+            assert result.exit_code == 0
+            assert [incident['id'] for incident in json.loads(result.stdout)['incidents']] == expected
+            mock_api.v1_pages_page_id_incidents_get.assert_called_once_with(page_id='p1', **params)
+
+    def test_component_id_contradicting_where(self, cli_runner, mock_config_with_api_key):
+        """Test --component-id and a different component= term are rejected"""
+        with patch('pingera_cli.commands.incidents.IncidentsCommand.get_client') as mock_get_client:
+            result = cli_runner.invoke(app, ['pages', 'incidents', 'list', '--page-id', 'p1', '--component-id', 'k2', '--where', 'component=k1'])
+
+            assert result.exit_code == 1
+            assert "contradicts" in result.stderr
+            mock_get_client.assert_not_called()
+
+    def test_invalid_where(self, cli_runner, mock_config_with_api_key):
+        """Test an invalid expression fails before any request"""
+        with patch('pingera_cli.commands.incidents.IncidentsCommand.get_client') as mock_get_client:
+            result = cli_runner.invoke(app, ['pages', 'incidents', 'list', '--page-id', 'p1', '--where', 'impact=>major'])
+
+            assert result.exit_code == 1
+            mock_get_client.assert_not_called()
+
+
+class TestListWhere:
+    """Test --where on other listings"""
+
+    def test_jobs_list_all_pages(self, cli_runner, mock_config_with_api_key):
+        """Test jobs status goes to the API and paging follows the pagination info"""
+        def page(page, per_page, **params):
+            response = Mock()
+            response.pagination = {'page': page, 'total_pages': 2}
+            response.jobs = [Mock(id=f"j{page}", status='failed', check_parameters={'type': 'web' if page == 1 else 'tcp'}, job_type='custom', check_id=None, error_message=None, created_at=None, started_at=None, completed_at=None)]
+            return response
+
+        with patch('pingera_cli.commands.on_demand_checks.OnDemandChecksCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            mock_api.v1_checks_jobs_get.side_effect = page
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'checks', 'jobs', 'list', '--all', '--where', 'status=failed and check_parameters.type=tcp'])
+
+            assert result.exit_code == 0
+            assert [job['job_id'] for job in json.loads(result.stdout)['jobs']] == ['j2']
+            assert [call.kwargs for call in mock_api.v1_checks_jobs_get.call_args_list] == [
+                {'page': 1, 'per_page': 20, 'status': 'failed'},
+                {'page': 2, 'per_page': 20, 'status': 'failed'},
+            ]
+
+    def test_components_list(self, cli_runner, mock_config_with_api_key):
+        """Test components are filtered locally"""
+        with patch('pingera_cli.commands.components.ComponentsCommand.get_client') as mock_get_client:
+            mock_api = Mock()
+            mock_get_client.return_value = mock_api
+            components = [Mock(id='k1', status='operational', group_id=None, created_at=None), Mock(id='k2', status='major_outage', group_id=None, created_at=None)]
+            for component, name in zip(components, ['API', 'Web']):
+                component.name = name
+                component.description = None
+                component.position = 0
+                component.showcase = True
+            mock_api.v1_pages_page_id_components_get.return_value = components
+
+            result = cli_runner.invoke(app, ['--output', 'json', 'pages', 'components', 'list', '--page-id', 'p1', '--where', 'status!=operational'])
+
+            assert result.exit_code == 0
+            assert [component['id'] for component in json.loads(result.stdout)['components']] == ['k2']